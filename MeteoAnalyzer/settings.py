@@ -31,6 +31,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.infrastructure.middlewares.server_timing_middleware.ServerTimingMiddleware",
+    "core.infrastructure.middlewares.prometheus_middleware.PrometheusMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -51,7 +53,7 @@ if PAGE_SIZE:
         **REST_FRAMEWORK,
         **{
             "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
-            "PAGE_SIZE": 10,
+            "PAGE_SIZE": PAGE_SIZE,
         },
     }
 
@@ -93,6 +95,81 @@ TEMPLATES = [
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+STATS_ALL_MAX_WORKERS = int(os.getenv("STATS_ALL_MAX_WORKERS", "1"))
+
+STATS_ALL_STREAM_CHUNK_SIZE = int(os.getenv("STATS_ALL_STREAM_CHUNK_SIZE", "100"))
+
+STATS_EXECUTOR_MAX_WORKERS = int(os.getenv("STATS_EXECUTOR_MAX_WORKERS", "0"))
+
+STATS_BATCH_MAX_QUERIES = int(os.getenv("STATS_BATCH_MAX_QUERIES", "500"))
+
+STATS_HISTORICAL_MAX_AGE = int(os.getenv("STATS_HISTORICAL_MAX_AGE", "86400"))
+
+STATS_ARCHIVE_LAG_DAYS = int(os.getenv("STATS_ARCHIVE_LAG_DAYS", "5"))
+
+STATS_SINGLE_FLIGHT = os.getenv("STATS_SINGLE_FLIGHT", "memory")
+
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "True") in [
+    "TRUE",
+    "True",
+    "true",
+    "t",
+    "1",
+]
+
+SERVER_TIMING_LOG = os.getenv("SERVER_TIMING_LOG", "False") in [
+    "TRUE",
+    "True",
+    "true",
+    "t",
+    "1",
+]
+
+PROMETHEUS_METRICS_ENABLED = os.getenv("PROMETHEUS_METRICS_ENABLED", "True") in [
+    "TRUE",
+    "True",
+    "true",
+    "t",
+    "1",
+]
+
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR", None)
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {"console": {"class": "logging.StreamHandler"}},
+    "loggers": {
+        "core.performance": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
+
+WEATHER_SERIES_CACHE_MAX_BYTES = int(
+    os.getenv("WEATHER_SERIES_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+STATS_CACHE_ALIAS = "stats"
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    STATS_CACHE_ALIAS: {
+        "BACKEND": os.getenv(
+            "STATS_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("STATS_CACHE_LOCATION", "stats"),
+        "TIMEOUT": None,
+        "OPTIONS": {
+            "MAX_ENTRIES": int(os.getenv("STATS_CACHE_MAX_ENTRIES", "1024")),
+        },
+    },
+}
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
 
@@ -2,10 +2,13 @@ from django.urls import path, reverse_lazy
 from django.views.generic import RedirectView
 
 from core.infrastructure.views.get_all_weather_stats_view import GetAllWeatherStatsView
+from core.infrastructure.views.get_combined_stats_view import GetCombinedStatsView
+from core.infrastructure.views.get_metrics_view import GetMetricsView
 from core.infrastructure.views.get_precipitation_stats_view import (
     GetPrecipitationStatsView,
 )
 from core.infrastructure.views.get_temperature_stats_view import GetTemperatureStatsView
+from core.infrastructure.views.post_batch_stats_view import PostBatchStatsView
 from core.views import schema_view
 
 urlpatterns = [
@@ -17,5 +20,8 @@ urlpatterns = [
         GetPrecipitationStatsView.as_view(),
         name="precipitation",
     ),
+    path("stats/combined/", GetCombinedStatsView.as_view(), name="combined"),
+    path("stats/batch/", PostBatchStatsView.as_view(), name="batch"),
     path("stats/all/", GetAllWeatherStatsView.as_view(), name="all"),
+    path("metrics", GetMetricsView.as_view(), name="metrics"),
 ]
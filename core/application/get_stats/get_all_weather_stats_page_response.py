@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from core.domain.models.all_weather_stats_by_city import AllWeatherStatsByCity
+
+
+@dataclass(frozen=True)
+class GetAllWeatherStatsPageResponse:
+    weather_stats_by_city: AllWeatherStatsByCity
+    next_after_city_id: int | None
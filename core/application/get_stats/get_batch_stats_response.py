@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from core.domain.models.city_combined_stats import CityCombinedStats
+
+
+@dataclass(frozen=True)
+class GetBatchStatsResponse:
+    combined_stats_for_queries: list[list[CityCombinedStats]]
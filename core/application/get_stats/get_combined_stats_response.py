@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+from core.domain.models.city_combined_stats import CityCombinedStats
+
+
+@dataclass(frozen=True)
+class GetCombinedStatsResponse:
+    combined_stats_for_cities: list[CityCombinedStats]
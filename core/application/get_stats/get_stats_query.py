@@ -1,23 +1,66 @@
-import pandas as pd
-
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from contextvars import copy_context
+from datetime import datetime
+from hashlib import sha256
+from typing import Callable, ContextManager, Iterator, TypeVar
+
+from django.db import connections
+
+from core.application.get_stats.get_all_weather_stats_page_response import (
+    GetAllWeatherStatsPageResponse,
+)
 from core.application.get_stats.get_all_weather_stats_response import (
     GetAllWeatherStatsResponse,
 )
+from core.application.get_stats.get_batch_stats_response import (
+    GetBatchStatsResponse,
+)
+from core.application.get_stats.get_combined_stats_response import (
+    GetCombinedStatsResponse,
+)
 from core.application.get_stats.get_precipitation_stats_response import (
     GetPrecipitationStatsResponse,
 )
 from core.application.get_stats.get_temperature_stats_response import (
     GetTemperatureStatsResponse,
 )
+from core.domain.caches.stats_cache import StatsCache
+from core.domain.caches.weather_series_cache import WeatherSeriesCache
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+from core.domain.locks.single_flight import SingleFlight
 from core.domain.models.all_weather_stats_by_city import AllWeatherStatsByCity
+from core.domain.models.city import City
+from core.domain.models.city_combined_stats import CityCombinedStats
 from core.domain.models.city_precipitation_stats import CityPrecipitationStats
 from core.domain.models.city_temperature_stats import CityTemperatureStats
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
 from core.domain.models.city_weather_stats import CityWeatherStats
+from core.domain.models.daily_series import DailySeries
 from core.domain.models.precipitation_stats import PrecipitationStats
-from core.domain.models.stats_query import StatsQuery
+from core.domain.models.series_stats import SeriesStats
+from core.domain.models.stats_query import (
+    ALL_SERIES,
+    ALL_STATS_FIELDS,
+    AVERAGE_BY_DAY_FIELD,
+    PRECIPITATION_SERIES,
+    TEMPERATURE_SERIES,
+    TOTAL_BY_DAY_FIELD,
+    StatsQuery,
+)
+from core.domain.models.stats_watermark import StatsWatermark
 from core.domain.models.temperature_stats import TemperatureStats
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.models.weather_series_stats import WeatherSeriesStats
 from core.domain.repositories.city_repository import CityRepository
+from core.domain.repositories.city_weather_snapshot_repository import (
+    CityWeatherSnapshotRepository,
+)
 from core.domain.repositories.weather_data_repository import WeatherDataRepository
+from core.domain.services.weather_series_index import WeatherSeriesIndex
+
+Response = TypeVar("Response")
 
 
 class GetStatsQuery:
@@ -25,56 +68,215 @@ class GetStatsQuery:
         self,
         city_repository: CityRepository,
         weather_data_repository: WeatherDataRepository,
+        stats_cache: StatsCache | None = None,
+        max_workers: int = 1,
+        city_weather_snapshot_repository: CityWeatherSnapshotRepository | None = None,
+        weather_series_cache: WeatherSeriesCache | None = None,
+        single_flight: SingleFlight | None = None,
+        performance_recorder: PerformanceRecorder | None = None,
     ):
         self.__city_repository = city_repository
         self.__weather_data_repository = weather_data_repository
+        self.__stats_cache = stats_cache
+        self.__max_workers = max_workers
+        self.__city_weather_snapshot_repository = city_weather_snapshot_repository
+        self.__weather_series_cache = weather_series_cache
+        self.__single_flight = single_flight
+        self.__performance_recorder = performance_recorder
 
     def execute_for_temperature(
-        self,
-        stats_query: StatsQuery,
+        self, stats_query: StatsQuery, cities: list[City] | None = None
     ) -> GetTemperatureStatsResponse:
-        cities = self.__city_repository.get_cities_by_match(
+        if cities is None:
+            cities = self.get_cities(stats_query)
+
+        return self.__get_cached(
+            "temperature",
+            stats_query,
+            cities,
+            lambda: self.__get_temperature_stats(cities, stats_query),
+        )
+
+    def execute_for_precipitation(
+        self, stats_query: StatsQuery, cities: list[City] | None = None
+    ) -> GetPrecipitationStatsResponse:
+        if cities is None:
+            cities = self.get_cities(stats_query)
+
+        return self.__get_cached(
+            "precipitation",
+            stats_query,
+            cities,
+            lambda: self.__get_precipitation_stats(cities, stats_query),
+        )
+
+    def execute_for_combined(
+        self, stats_query: StatsQuery, cities: list[City] | None = None
+    ) -> GetCombinedStatsResponse:
+        if cities is None:
+            cities = self.get_cities(stats_query)
+
+        return self.__get_cached(
+            "combined",
+            stats_query,
+            cities,
+            lambda: self.__get_combined_stats(cities, stats_query),
+        )
+
+    def get_cities(self, stats_query: StatsQuery) -> list[City]:
+        return self.__city_repository.get_cities_by_match(
             stats_query.city_name, stats_query.latitude, stats_query.longitude
         )
 
-        city_temperature_stats = []
-        for city in cities:
-            weather_stats_df = pd.DataFrame(
-                self.__weather_data_repository.get_by_city_id_and_date_range(
-                    city.id, stats_query.start_date, stats_query.end_date
-                ),
-                columns=["date_time", "temperature"],
+    def get_watermark(
+        self, stats_name: str, stats_query: StatsQuery, cities: list[City]
+    ) -> StatsWatermark:
+        data_updated_ats = [
+            city.data_updated_at for city in cities if city.data_updated_at is not None
+        ]
+
+        return StatsWatermark(
+            tag=sha256(
+                self.__build_cache_key(stats_name, stats_query, cities).encode()
+            ).hexdigest(),
+            last_modified=max(data_updated_ats) if len(data_updated_ats) > 0 else None,
+        )
+
+    def execute_for_batch(
+        self, stats_queries: list[StatsQuery]
+    ) -> GetBatchStatsResponse:
+        cities_by_match = {}
+        for stats_query in stats_queries:
+            match = (stats_query.city_name, stats_query.latitude, stats_query.longitude)
+            if match not in cities_by_match:
+                cities_by_match[match] = self.__city_repository.get_cities_by_match(
+                    *match
+                )
+
+        cities = list(
+            {
+                city.id: city for cities in cities_by_match.values() for city in cities
+            }.values()
+        )
+        weather_series_index_by_city_id = self.__get_cached_weather_series_indexes(
+            cities
+        )
+        date_ranges_by_city_id = defaultdict(list)
+        for stats_query in stats_queries:
+            for city in cities_by_match[
+                (stats_query.city_name, stats_query.latitude, stats_query.longitude)
+            ]:
+                if city.id not in weather_series_index_by_city_id:
+                    date_ranges_by_city_id[city.id].append(
+                        (stats_query.start_date, stats_query.end_date)
+                    )
+        weather_series_index_by_city_id.update(
+            self.__get_weather_series_indexes(dict(date_ranges_by_city_id))
+        )
+
+        combined_stats_for_queries = []
+        with self.__measure("aggregation"):
+            for stats_query in stats_queries:
+                matched_cities = cities_by_match[
+                    (stats_query.city_name, stats_query.latitude, stats_query.longitude)
+                ]
+                combined_stats_for_queries.append(
+                    self.__get_city_combined_stats(
+                        matched_cities,
+                        {
+                            city.id: weather_series_index_by_city_id[city.id].compute(
+                                stats_query.start_date,
+                                stats_query.end_date,
+                                stats_query.upper_threshold,
+                                stats_query.lower_threshold,
+                                stats_query.fields,
+                            )
+                            for city in matched_cities
+                        },
+                        stats_query.fields,
+                    )
+                )
+
+        return GetBatchStatsResponse(
+            combined_stats_for_queries=combined_stats_for_queries
+        )
+
+    def execute_for_all(self) -> GetAllWeatherStatsResponse:
+        return self.__run_single_flight("all", self.__get_all_weather_stats)
+
+    def execute_for_all_page(
+        self, after_city_id: int | None, page_size: int
+    ) -> GetAllWeatherStatsPageResponse:
+        return self.__run_single_flight(
+            f"all|{after_city_id}|{page_size}",
+            lambda: self.__get_all_weather_stats_page(after_city_id, page_size),
+        )
+
+    def iterate_for_all(
+        self, chunk_size: int | None = None
+    ) -> Iterator[tuple[str, CityWeatherStats]]:
+        cities_by_name = defaultdict(list)
+        for city in self.__city_repository.get_all_cities():
+            cities_by_name[city.name].append(city)
+
+        all_cities = [city for cities in cities_by_name.values() for city in cities]
+        chunk_size = chunk_size or max(len(all_cities), 1)
+
+        for index in range(0, len(all_cities), chunk_size):
+            cities = all_cities[index : index + chunk_size]
+
+            for city, city_weather_stats in self.__get_all_city_weather_stats(cities):
+                yield city.name, city_weather_stats
+
+    def __get_all_weather_stats(self) -> GetAllWeatherStatsResponse:
+        weather_stats_by_city = AllWeatherStatsByCity()
+
+        for city_name, city_weather_stats in self.iterate_for_all():
+            weather_stats_by_city.all_city_weather_stats[city_name].append(
+                city_weather_stats
             )
 
-            if weather_stats_df.empty:
-                continue
+        return GetAllWeatherStatsResponse(weather_stats_by_city=weather_stats_by_city)
+
+    def __get_all_weather_stats_page(
+        self, after_city_id: int | None, page_size: int
+    ) -> GetAllWeatherStatsPageResponse:
+        cities = self.__city_repository.get_cities_page(after_city_id, page_size + 1)
+        page_cities = cities[:page_size]
+        weather_stats_by_city = AllWeatherStatsByCity()
 
-            mean_temperature = self.__get_mean_from_df("temperature", weather_stats_df)
-            mean_temperature_by_day = self.__get_mean_for_days(
-                "temperature", weather_stats_df
+        for city, city_weather_stats in self.__get_all_city_weather_stats(page_cities):
+            weather_stats_by_city.all_city_weather_stats[city.name].append(
+                city_weather_stats
             )
 
-            max_temperature = self.__get_max("temperature", weather_stats_df)
-            min_temperature = self.__get_min("temperature", weather_stats_df)
+        return GetAllWeatherStatsPageResponse(
+            weather_stats_by_city=weather_stats_by_city,
+            next_after_city_id=(
+                page_cities[-1].id if len(cities) > page_size else None
+            ),
+        )
+
+    def __get_temperature_stats(
+        self, cities: list[City], stats_query: StatsQuery
+    ) -> GetTemperatureStatsResponse:
+        weather_series_stats_by_city_id = self.__get_weather_series_stats(
+            cities, stats_query, frozenset([TEMPERATURE_SERIES])
+        )
 
-            hours_above_threshold = (
-                weather_stats_df["temperature"] > stats_query.upper_threshold
-            ).sum()
-            hours_below_threshold = (
-                weather_stats_df["temperature"] < stats_query.lower_threshold
-            ).sum()
+        city_temperature_stats = []
+        for city in cities:
+            weather_series_stats = weather_series_stats_by_city_id.get(city.id)
+
+            if weather_series_stats is None:
+                continue
 
             city_temperature_stats.append(
                 CityTemperatureStats(
                     longitude=city.longitude,
                     latitude=city.latitude,
-                    temperature_stats=TemperatureStats(
-                        average=mean_temperature,
-                        average_by_day=mean_temperature_by_day,
-                        max=max_temperature,
-                        min=min_temperature,
-                        hours_above_threshold=hours_above_threshold,
-                        hours_below_threshold=hours_below_threshold,
+                    temperature_stats=self.__get_temperature_stats_for_series(
+                        weather_series_stats.temperature, stats_query.fields
                     ),
                 )
             )
@@ -83,49 +285,26 @@ class GetStatsQuery:
             temperature_stats_for_cities=city_temperature_stats,
         )
 
-    def execute_for_precipitation(
-        self, stats_query: StatsQuery
+    def __get_precipitation_stats(
+        self, cities: list[City], stats_query: StatsQuery
     ) -> GetPrecipitationStatsResponse:
-        cities = self.__city_repository.get_cities_by_match(
-            stats_query.city_name, stats_query.latitude, stats_query.longitude
+        weather_series_stats_by_city_id = self.__get_weather_series_stats(
+            cities, stats_query, frozenset([PRECIPITATION_SERIES])
         )
 
         city_precipitation_stats = []
         for city in cities:
-            weather_stats_df = pd.DataFrame(
-                self.__weather_data_repository.get_by_city_id_and_date_range(
-                    city.id, stats_query.start_date, stats_query.end_date
-                ),
-                columns=["date_time", "precipitation"],
-            )
+            weather_series_stats = weather_series_stats_by_city_id.get(city.id)
 
-            if weather_stats_df.empty:
+            if weather_series_stats is None:
                 continue
 
-            mean_precipitation = self.__get_mean_from_df(
-                "precipitation", weather_stats_df
-            )
-            total_precipitation = self.__get_sum_from_df(
-                "precipitation", weather_stats_df
-            )
-            total_precipitation_by_day = self.__get_sum_for_days(
-                "precipitation", weather_stats_df
-            )
-            days_with_precipitation = self.__get_day_with_precipitation(
-                weather_stats_df
-            )
-            max_precipitation = self.__get_max("precipitation", weather_stats_df)
-
             city_precipitation_stats.append(
                 CityPrecipitationStats(
                     longitude=city.longitude,
                     latitude=city.latitude,
-                    precipitation_stats=PrecipitationStats(
-                        total=total_precipitation,
-                        total_by_day=total_precipitation_by_day,
-                        days_with_precipitation=days_with_precipitation,
-                        max=max_precipitation,
-                        average=mean_precipitation,
+                    precipitation_stats=self.__get_precipitation_stats_for_series(
+                        weather_series_stats.precipitation, stats_query.fields
                     ),
                 )
             )
@@ -134,98 +313,394 @@ class GetStatsQuery:
             precipitation_stats_for_cities=city_precipitation_stats,
         )
 
-    def execute_for_all(self) -> GetAllWeatherStatsResponse:
-        all_cities = self.__city_repository.get_all_cities()
-        weather_stats_by_city = AllWeatherStatsByCity()
+    def __get_combined_stats(
+        self, cities: list[City], stats_query: StatsQuery
+    ) -> GetCombinedStatsResponse:
+        return GetCombinedStatsResponse(
+            combined_stats_for_cities=self.__get_city_combined_stats(
+                cities,
+                self.__get_weather_series_stats(cities, stats_query),
+                stats_query.fields,
+            )
+        )
+
+    def __get_city_combined_stats(
+        self,
+        cities: list[City],
+        weather_series_stats_by_city_id: dict[int, WeatherSeriesStats | None],
+        fields: frozenset[str],
+    ) -> list[CityCombinedStats]:
+        city_combined_stats = []
+        for city in cities:
+            weather_series_stats = weather_series_stats_by_city_id.get(city.id)
+
+            if weather_series_stats is None:
+                continue
 
-        for city in all_cities:
-            weather_stats_df = pd.DataFrame(
-                self.__weather_data_repository.get_by_city_id(city.id),
-                columns=["date_time", "precipitation", "temperature"],
+            city_combined_stats.append(
+                CityCombinedStats(
+                    longitude=city.longitude,
+                    latitude=city.latitude,
+                    temperature_stats=self.__get_temperature_stats_for_series(
+                        weather_series_stats.temperature, fields
+                    ),
+                    precipitation_stats=self.__get_precipitation_stats_for_series(
+                        weather_series_stats.precipitation, fields
+                    ),
+                )
+            )
+
+        return city_combined_stats
+
+    def __get_temperature_stats_for_series(
+        self, temperature_stats: SeriesStats, fields: frozenset[str]
+    ) -> TemperatureStats:
+        return TemperatureStats(
+            average=temperature_stats.average,
+            average_by_day=(
+                DailySeries(temperature_stats.days, temperature_stats.average_by_day)
+                if AVERAGE_BY_DAY_FIELD in fields
+                else None
+            ),
+            max=self.__get_max("temperature", temperature_stats),
+            min=self.__get_min("temperature", temperature_stats),
+            hours_above_threshold=temperature_stats.hours_above_threshold,
+            hours_below_threshold=temperature_stats.hours_below_threshold,
+        )
+
+    def __get_precipitation_stats_for_series(
+        self, precipitation_stats: SeriesStats, fields: frozenset[str]
+    ) -> PrecipitationStats:
+        return PrecipitationStats(
+            total=precipitation_stats.total,
+            total_by_day=(
+                DailySeries(precipitation_stats.days, precipitation_stats.total_by_day)
+                if TOTAL_BY_DAY_FIELD in fields
+                else None
+            ),
+            days_with_precipitation=precipitation_stats.hours_above_threshold,
+            max=self.__get_max("precipitation", precipitation_stats),
+            average=precipitation_stats.average,
+        )
+
+    def __get_cached(
+        self,
+        stats_name: str,
+        stats_query: StatsQuery,
+        cities: list[City],
+        get_response: Callable[[], Response],
+    ) -> Response:
+        key = self.__build_cache_key(stats_name, stats_query, cities)
+
+        if self.__stats_cache is None:
+            return self.__run_single_flight(key, get_response)
+
+        response = self.__stats_cache.get(key)
+        self.__count(
+            "stats_cache_hits" if response is not None else "stats_cache_misses"
+        )
+
+        if response is None:
+            response = self.__run_single_flight(
+                key, lambda: self.__get_and_set_cached(key, get_response)
+            )
+
+        return response
+
+    def __get_and_set_cached(
+        self, key: str, get_response: Callable[[], Response]
+    ) -> Response:
+        response = (
+            self.__stats_cache.get(key) if self.__single_flight is not None else None
+        )
+
+        if response is None:
+            response = get_response()
+            self.__stats_cache.set(key, response)
+
+        return response
+
+    def __measure(self, metric: str) -> ContextManager[None]:
+        if self.__performance_recorder is None:
+            return nullcontext()
+
+        return self.__performance_recorder.measure(metric)
+
+    def __count(self, metric: str, value: int = 1) -> None:
+        if self.__performance_recorder is not None:
+            self.__performance_recorder.count(metric, value)
+
+    def __run_single_flight(
+        self, key: str, function: Callable[[], Response]
+    ) -> Response:
+        if self.__single_flight is None:
+            return function()
+
+        return self.__single_flight.run(key, function)
+
+    def __build_cache_key(
+        self, stats_name: str, stats_query: StatsQuery, cities: list[City]
+    ) -> str:
+        return "|".join(
+            [
+                stats_name,
+                stats_query.city_name.lower(),
+                stats_query.start_date.isoformat(),
+                stats_query.end_date.isoformat(),
+                repr(stats_query.latitude),
+                repr(stats_query.longitude),
+                repr(stats_query.upper_threshold),
+                repr(stats_query.lower_threshold),
+                (
+                    "*"
+                    if stats_query.fields == ALL_STATS_FIELDS
+                    else ",".join(sorted(stats_query.fields))
+                ),
+                ",".join(f"{city.id}:{city.data_version}" for city in cities),
+            ]
+        )
+
+    def __get_all_city_weather_stats(
+        self, cities: list[City]
+    ) -> list[tuple[City, CityWeatherStats]]:
+        city_weather_snapshots_by_city_id = self.__get_city_weather_snapshots(cities)
+        dirty_cities = [
+            city
+            for city in cities
+            if not self.__is_up_to_date(
+                city, city_weather_snapshots_by_city_id.get(city.id)
             )
+        ]
+        weather_series_stats_by_city_id = self.__get_summary_stats(
+            [city.id for city in dirty_cities]
+        )
+
+        all_city_weather_stats = []
+        refreshed_city_weather_snapshots = []
+        for city in cities:
+            city_weather_snapshot = city_weather_snapshots_by_city_id.get(city.id)
+
+            if not self.__is_up_to_date(city, city_weather_snapshot):
+                weather_series_stats = weather_series_stats_by_city_id.get(city.id)
+                city_weather_snapshot = CityWeatherSnapshot(
+                    city_id=city.id,
+                    data_version=city.data_version,
+                    city_weather_stats=(
+                        self.__get_city_weather_stats(city, weather_series_stats)
+                        if weather_series_stats is not None
+                        else None
+                    ),
+                )
+                refreshed_city_weather_snapshots.append(city_weather_snapshot)
 
-            if weather_stats_df.empty:
+            if city_weather_snapshot.city_weather_stats is None:
                 continue
 
-            weather_stats_by_day = self.__get_df_with_day_column(weather_stats_df)
+            all_city_weather_stats.append(
+                (city, city_weather_snapshot.city_weather_stats)
+            )
 
-            start_date = weather_stats_by_day.loc[
-                weather_stats_by_day["date_time"].idxmin()
-            ]["day"]
-            end_date = weather_stats_by_day.loc[
-                weather_stats_by_day["date_time"].idxmax()
-            ]["day"]
+        if (
+            self.__city_weather_snapshot_repository is not None
+            and len(refreshed_city_weather_snapshots) > 0
+        ):
+            self.__city_weather_snapshot_repository.bulk_save(
+                refreshed_city_weather_snapshots
+            )
+
+        return all_city_weather_stats
+
+    def __get_city_weather_snapshots(
+        self, cities: list[City]
+    ) -> dict[int, CityWeatherSnapshot]:
+        if self.__city_weather_snapshot_repository is None or len(cities) == 0:
+            return {}
+
+        return self.__city_weather_snapshot_repository.get_by_city_ids(
+            [city.id for city in cities]
+        )
 
-            mean_temperature = self.__get_mean_from_df("temperature", weather_stats_df)
-            total_precipitation = self.__get_sum_from_df(
-                "precipitation", weather_stats_df
+    def __is_up_to_date(
+        self, city: City, city_weather_snapshot: CityWeatherSnapshot | None
+    ) -> bool:
+        return (
+            city_weather_snapshot is not None
+            and city_weather_snapshot.data_version == city.data_version
+        )
+
+    def __get_city_weather_stats(
+        self, city: City, weather_series_stats: WeatherSeriesStats
+    ) -> CityWeatherStats:
+        temperature_stats = weather_series_stats.temperature
+        precipitation_stats = weather_series_stats.precipitation
+
+        return CityWeatherStats(
+            latitude=city.latitude,
+            longitude=city.longitude,
+            start_date=temperature_stats.start_day,
+            end_date=temperature_stats.end_day,
+            temperature_average=temperature_stats.average,
+            precipitation_total=precipitation_stats.total,
+            days_with_precipitation=precipitation_stats.hours_above_threshold,
+            precipitation_max=self.__get_max("precipitation", precipitation_stats),
+            temperature_max=self.__get_max("temperature", temperature_stats),
+            temperature_min=self.__get_min("temperature", temperature_stats),
+        )
+
+    def __get_summary_stats(self, city_ids: list[int]) -> dict[int, WeatherSeriesStats]:
+        if len(city_ids) == 0:
+            return {}
+
+        if self.__max_workers <= 1 or len(city_ids) == 1:
+            return self.__weather_data_repository.get_summary_stats_by_city_ids(
+                city_ids
             )
-            days_with_precipitation = self.__get_day_with_precipitation(
-                weather_stats_df
+
+        workers = min(self.__max_workers, len(city_ids))
+        city_ids_chunks = [city_ids[index::workers] for index in range(workers)]
+
+        weather_series_stats_by_city_id = {}
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    copy_context().run,
+                    self.__get_summary_stats_in_thread,
+                    city_ids_chunk,
+                )
+                for city_ids_chunk in city_ids_chunks
+            ]
+            for future in futures:
+                weather_series_stats_by_city_id.update(future.result())
+
+        return weather_series_stats_by_city_id
+
+    def __get_summary_stats_in_thread(
+        self, city_ids: list[int]
+    ) -> dict[int, WeatherSeriesStats]:
+        try:
+            return self.__weather_data_repository.get_summary_stats_by_city_ids(
+                city_ids
             )
+        finally:
+            connections.close_all()
+
+    def __get_weather_series_stats(
+        self,
+        cities: list[City],
+        stats_query: StatsQuery,
+        series: frozenset[str] = ALL_SERIES,
+    ) -> dict[int, WeatherSeriesStats]:
+        if len(cities) == 0:
+            return {}
 
-            max_precipitation = self.__get_max("precipitation", weather_stats_df)
-            max_temperature = self.__get_max("temperature", weather_stats_df)
-            min_temperature = self.__get_min("temperature", weather_stats_df)
+        weather_series_index_by_city_id = self.__get_cached_weather_series_indexes(
+            cities
+        )
 
-            weather_stats_by_city.all_city_weather_stats[city.name].append(
-                CityWeatherStats(
-                    latitude=city.latitude,
-                    longitude=city.longitude,
-                    start_date=start_date,
-                    end_date=end_date,
-                    temperature_average=mean_temperature,
-                    precipitation_total=total_precipitation,
-                    days_with_precipitation=days_with_precipitation,
-                    precipitation_max=max_precipitation,
-                    temperature_max=max_temperature,
-                    temperature_min=min_temperature,
+        weather_series_stats_by_city_id = {}
+        with self.__measure("aggregation"):
+            for (
+                city_id,
+                weather_series_index,
+            ) in weather_series_index_by_city_id.items():
+                weather_series_stats = weather_series_index.compute(
+                    stats_query.start_date,
+                    stats_query.end_date,
+                    stats_query.upper_threshold,
+                    stats_query.lower_threshold,
+                    stats_query.fields,
+                    series,
+                )
+
+                if weather_series_stats is not None:
+                    weather_series_stats_by_city_id[city_id] = weather_series_stats
+
+        uncached_city_ids = [
+            city.id for city in cities if city.id not in weather_series_index_by_city_id
+        ]
+        if len(uncached_city_ids) > 0:
+            weather_series_stats_by_city_id.update(
+                self.__weather_data_repository.get_stats_by_city_ids_and_date_range(
+                    uncached_city_ids,
+                    stats_query.start_date,
+                    stats_query.end_date,
+                    stats_query.upper_threshold,
+                    stats_query.lower_threshold,
+                    stats_query.fields,
                 )
             )
 
-        return GetAllWeatherStatsResponse(weather_stats_by_city=weather_stats_by_city)
+        return weather_series_stats_by_city_id
 
-    def __get_day_with_precipitation(self, df: pd.DataFrame) -> int:
-        return (df["precipitation"] > 0.0).sum()
-
-    def __get_mean_from_df(self, column_name: str, df: pd.DataFrame) -> float:
-        return df[column_name].mean()
-
-    def __get_sum_from_df(self, column_name: str, df: pd.DataFrame) -> float:
-        return df[column_name].sum()
-
-    def __get_mean_for_days(
-        self, column_name: str, df: pd.DataFrame
-    ) -> dict[str, float]:
-        df = self.__get_df_with_day_column(df)
-        daily_mean = df.groupby("day")[column_name].mean()
-        return daily_mean.to_dict()
-
-    def __get_sum_for_days(
-        self, column_name: str, df: pd.DataFrame
-    ) -> dict[str, float]:
-        df = self.__get_df_with_day_column(df)
-        daily_sum = df.groupby("day")[column_name].sum()
-        return daily_sum.to_dict()
-
-    def __get_df_with_day_column(self, df: pd.DataFrame) -> pd.DataFrame:
-        df_copy = df.copy()
-        df_copy["day"] = df_copy["date_time"].dt.strftime("%Y-%m-%d")
-        return df_copy
-
-    def __get_max(self, column_name: str, df: pd.DataFrame) -> dict[str, float | str]:
-        formatted_df = self.__format_df_for_max_min(df)
-        return formatted_df.loc[formatted_df[column_name].idxmax()][
-            ["date_time", column_name]
-        ].to_dict()
-
-    def __get_min(self, column_name: str, df: pd.DataFrame) -> dict[str, float | str]:
-        formatted_df = self.__format_df_for_max_min(df)
-        return formatted_df.loc[formatted_df[column_name].idxmin()][
-            ["date_time", column_name]
-        ].to_dict()
-
-    def __format_df_for_max_min(self, df: pd.DataFrame) -> pd.DataFrame:
-        df_copy = df.copy()
-        df_copy["date_time"] = df_copy["date_time"].dt.strftime("%Y-%m-%dT%H:%M")
-        return df_copy
+    def __get_cached_weather_series_indexes(
+        self, cities: list[City]
+    ) -> dict[int, WeatherSeriesIndex]:
+        if self.__weather_series_cache is None:
+            return {}
+
+        weather_series_index_by_city_id = {}
+        admitted_cities = []
+        for city in cities:
+            weather_series_index = self.__weather_series_cache.get(
+                city.id, city.data_version
+            )
+
+            if weather_series_index is not None:
+                weather_series_index_by_city_id[city.id] = weather_series_index
+            elif self.__weather_series_cache.admit(city.id, city.data_version):
+                admitted_cities.append(city)
+
+        self.__count("series_cache_hits", len(weather_series_index_by_city_id))
+        self.__count(
+            "series_cache_misses", len(cities) - len(weather_series_index_by_city_id)
+        )
+        if len(admitted_cities) == 0:
+            return weather_series_index_by_city_id
+
+        weather_series_by_city_id = (
+            self.__weather_data_repository.get_series_by_city_ids(
+                [city.id for city in admitted_cities]
+            )
+        )
+        for city in admitted_cities:
+            with self.__measure("series"):
+                weather_series_index = WeatherSeriesIndex(
+                    weather_series_by_city_id.get(city.id)
+                    or WeatherSeries.from_weather_data([])
+                )
+            self.__weather_series_cache.set(
+                city.id, city.data_version, weather_series_index
+            )
+            weather_series_index_by_city_id[city.id] = weather_series_index
+
+        return weather_series_index_by_city_id
+
+    def __get_weather_series_indexes(
+        self, date_ranges_by_city_id: dict[int, list[tuple[datetime, datetime]]]
+    ) -> dict[int, WeatherSeriesIndex]:
+        if len(date_ranges_by_city_id) == 0:
+            return {}
+
+        weather_series_by_city_id = (
+            self.__weather_data_repository.get_series_by_city_date_ranges(
+                date_ranges_by_city_id
+            )
+        )
+        with self.__measure("series"):
+            return {
+                city_id: WeatherSeriesIndex(
+                    weather_series_by_city_id.get(city_id)
+                    or WeatherSeries.from_weather_data([])
+                )
+                for city_id in date_ranges_by_city_id
+            }
+
+    def __get_max(
+        self, column_name: str, series_stats: SeriesStats
+    ) -> dict[str, float | str]:
+        return {"date_time": series_stats.max_date_time, column_name: series_stats.max}
+
+    def __get_min(
+        self, column_name: str, series_stats: SeriesStats
+    ) -> dict[str, float | str]:
+        return {"date_time": series_stats.min_date_time, column_name: series_stats.min}
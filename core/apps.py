@@ -1,6 +1,25 @@
 from django.apps import AppConfig
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+
+from core.dependency_injection_factories.infrastructure.instrumentation.db_query_timer_factory import (
+    DbQueryTimerFactory,
+)
+from MeteoAnalyzer.settings import PROMETHEUS_METRICS_ENABLED, SERVER_TIMING_ENABLED
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self) -> None:
+        if SERVER_TIMING_ENABLED or PROMETHEUS_METRICS_ENABLED:
+            connection_created.connect(CoreConfig.__install_db_query_timer, weak=False)
+
+    @staticmethod
+    def __install_db_query_timer(
+        sender: type, connection: BaseDatabaseWrapper, **kwargs
+    ) -> None:
+        db_query_timer = DbQueryTimerFactory.create()
+        if db_query_timer not in connection.execute_wrappers:
+            connection.execute_wrappers.append(db_query_timer)
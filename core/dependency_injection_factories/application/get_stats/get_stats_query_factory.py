@@ -1,7 +1,30 @@
+from MeteoAnalyzer.settings import (
+    STATS_ALL_MAX_WORKERS,
+    STATS_SINGLE_FLIGHT,
+    WEATHER_SERIES_CACHE_MAX_BYTES,
+)
 from core.application.get_stats.get_stats_query import GetStatsQuery
+from core.dependency_injection_factories.infrastructure.caches.django_stats_cache_factory import (
+    DjangoStatsCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.caches.in_memory_weather_series_cache_factory import (
+    InMemoryWeatherSeriesCacheFactory,
+)
+from core.dependency_injection_factories.infrastructure.instrumentation.performance_recorder_factory import (
+    PerformanceRecorderFactory,
+)
+from core.dependency_injection_factories.infrastructure.locks.db_single_flight_factory import (
+    DbSingleFlightFactory,
+)
+from core.dependency_injection_factories.infrastructure.locks.in_memory_single_flight_factory import (
+    InMemorySingleFlightFactory,
+)
 from core.dependency_injection_factories.infrastructure.persistence.repositories.db_city_repository_factory import (
     DbCityRepositoryFactory,
 )
+from core.dependency_injection_factories.infrastructure.persistence.repositories.db_city_weather_snapshot_repository_factory import (
+    DbCityWeatherSnapshotRepositoryFactory,
+)
 from core.dependency_injection_factories.infrastructure.persistence.repositories.db_weather_data_repository_factory import (
     DbWeatherDataRepositoryFactory,
 )
@@ -11,5 +34,24 @@ class GetStatsQueryFactory:
     @staticmethod
     def create() -> GetStatsQuery:
         return GetStatsQuery(
-            DbCityRepositoryFactory.create(), DbWeatherDataRepositoryFactory.create()
+            DbCityRepositoryFactory.create(),
+            DbWeatherDataRepositoryFactory.create(),
+            DjangoStatsCacheFactory.create(),
+            STATS_ALL_MAX_WORKERS,
+            DbCityWeatherSnapshotRepositoryFactory.create(),
+            (
+                InMemoryWeatherSeriesCacheFactory.create()
+                if WEATHER_SERIES_CACHE_MAX_BYTES > 0
+                else None
+            ),
+            (
+                DbSingleFlightFactory.create()
+                if STATS_SINGLE_FLIGHT == "db"
+                else (
+                    InMemorySingleFlightFactory.create()
+                    if STATS_SINGLE_FLIGHT == "memory"
+                    else None
+                )
+            ),
+            PerformanceRecorderFactory.create(),
         )
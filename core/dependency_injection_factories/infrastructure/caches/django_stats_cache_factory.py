@@ -0,0 +1,10 @@
+from django.core.cache import caches
+
+from MeteoAnalyzer.settings import STATS_CACHE_ALIAS
+from core.infrastructure.caches.django_stats_cache import DjangoStatsCache
+
+
+class DjangoStatsCacheFactory:
+    @staticmethod
+    def create() -> DjangoStatsCache:
+        return DjangoStatsCache(caches[STATS_CACHE_ALIAS])
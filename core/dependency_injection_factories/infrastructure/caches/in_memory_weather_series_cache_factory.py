@@ -0,0 +1,12 @@
+from MeteoAnalyzer.settings import WEATHER_SERIES_CACHE_MAX_BYTES
+from core.infrastructure.caches.in_memory_weather_series_cache import (
+    InMemoryWeatherSeriesCache,
+)
+
+
+class InMemoryWeatherSeriesCacheFactory:
+    __instance = InMemoryWeatherSeriesCache(WEATHER_SERIES_CACHE_MAX_BYTES)
+
+    @staticmethod
+    def create() -> InMemoryWeatherSeriesCache:
+        return InMemoryWeatherSeriesCacheFactory.__instance
@@ -0,0 +1,12 @@
+from core.dependency_injection_factories.infrastructure.instrumentation.performance_recorder_factory import (
+    PerformanceRecorderFactory,
+)
+from core.infrastructure.instrumentation.db_query_timer import DbQueryTimer
+
+
+class DbQueryTimerFactory:
+    __instance = DbQueryTimer(PerformanceRecorderFactory.create())
+
+    @staticmethod
+    def create() -> DbQueryTimer:
+        return DbQueryTimerFactory.__instance
@@ -0,0 +1,28 @@
+from MeteoAnalyzer.settings import PROMETHEUS_METRICS_ENABLED
+from core.dependency_injection_factories.infrastructure.instrumentation.prometheus_performance_recorder_factory import (
+    PrometheusPerformanceRecorderFactory,
+)
+from core.dependency_injection_factories.infrastructure.instrumentation.request_performance_recorder_factory import (
+    RequestPerformanceRecorderFactory,
+)
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+from core.infrastructure.instrumentation.composite_performance_recorder import (
+    CompositePerformanceRecorder,
+)
+
+
+class PerformanceRecorderFactory:
+    __instance = (
+        CompositePerformanceRecorder(
+            [
+                RequestPerformanceRecorderFactory.create(),
+                PrometheusPerformanceRecorderFactory.create(),
+            ]
+        )
+        if PROMETHEUS_METRICS_ENABLED
+        else RequestPerformanceRecorderFactory.create()
+    )
+
+    @staticmethod
+    def create() -> PerformanceRecorder:
+        return PerformanceRecorderFactory.__instance
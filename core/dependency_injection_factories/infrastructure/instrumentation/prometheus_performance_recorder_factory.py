@@ -0,0 +1,11 @@
+from core.infrastructure.instrumentation.prometheus_performance_recorder import (
+    PrometheusPerformanceRecorder,
+)
+
+
+class PrometheusPerformanceRecorderFactory:
+    __instance = PrometheusPerformanceRecorder()
+
+    @staticmethod
+    def create() -> PrometheusPerformanceRecorder:
+        return PrometheusPerformanceRecorderFactory.__instance
@@ -0,0 +1,11 @@
+from core.infrastructure.instrumentation.request_performance_recorder import (
+    RequestPerformanceRecorder,
+)
+
+
+class RequestPerformanceRecorderFactory:
+    __instance = RequestPerformanceRecorder()
+
+    @staticmethod
+    def create() -> RequestPerformanceRecorder:
+        return RequestPerformanceRecorderFactory.__instance
@@ -0,0 +1,12 @@
+from core.dependency_injection_factories.infrastructure.locks.in_memory_single_flight_factory import (
+    InMemorySingleFlightFactory,
+)
+from core.infrastructure.locks.db_single_flight import DbSingleFlight
+
+
+class DbSingleFlightFactory:
+    __instance = DbSingleFlight(InMemorySingleFlightFactory.create())
+
+    @staticmethod
+    def create() -> DbSingleFlight:
+        return DbSingleFlightFactory.__instance
@@ -0,0 +1,9 @@
+from core.infrastructure.locks.in_memory_single_flight import InMemorySingleFlight
+
+
+class InMemorySingleFlightFactory:
+    __instance = InMemorySingleFlight()
+
+    @staticmethod
+    def create() -> InMemorySingleFlight:
+        return InMemorySingleFlightFactory.__instance
@@ -0,0 +1,9 @@
+from core.infrastructure.persistence.repositories.db_city_weather_snapshot_repository import (
+    DbCityWeatherSnapshotRepository,
+)
+
+
+class DbCityWeatherSnapshotRepositoryFactory:
+    @staticmethod
+    def create() -> DbCityWeatherSnapshotRepository:
+        return DbCityWeatherSnapshotRepository()
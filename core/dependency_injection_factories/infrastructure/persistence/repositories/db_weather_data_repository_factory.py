@@ -1,3 +1,6 @@
+from core.dependency_injection_factories.infrastructure.instrumentation.performance_recorder_factory import (
+    PerformanceRecorderFactory,
+)
 from core.infrastructure.persistence.repositories.db_weather_data_repository import (
     DbWeatherDataRepository,
 )
@@ -6,4 +9,6 @@ from core.infrastructure.persistence.repositories.db_weather_data_repository imp
 class DbWeatherDataRepositoryFactory:
     @staticmethod
     def create() -> DbWeatherDataRepository:
-        return DbWeatherDataRepository()
+        return DbWeatherDataRepository(
+            performance_recorder=PerformanceRecorderFactory.create()
+        )
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class StatsCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from core.domain.services.weather_series_index import WeatherSeriesIndex
+
+
+class WeatherSeriesCache(ABC):
+    @abstractmethod
+    def get(self, city_id: int, data_version: int) -> WeatherSeriesIndex | None:
+        pass
+
+    @abstractmethod
+    def admit(self, city_id: int, data_version: int) -> bool:
+        pass
+
+    @abstractmethod
+    def set(
+        self, city_id: int, data_version: int, weather_series_index: WeatherSeriesIndex
+    ) -> None:
+        pass
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import ContextManager
+
+
+class PerformanceRecorder(ABC):
+    @abstractmethod
+    def measure(self, metric: str) -> ContextManager[None]:
+        pass
+
+    @abstractmethod
+    def count(self, metric: str, value: int = 1) -> None:
+        pass
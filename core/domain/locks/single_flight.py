@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Callable, TypeVar
+
+Result = TypeVar("Result")
+
+
+class SingleFlight(ABC):
+    @abstractmethod
+    def run(self, key: str, function: Callable[[], Result]) -> Result:
+        pass
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 
 @dataclass
@@ -7,6 +8,8 @@ class City:
     latitude: float
     longitude: float
     id: int | None = None
+    data_version: int = 0
+    data_updated_at: datetime | None = None
 
     def __str__(self):
         return f"{self.name}, [latitude: {self.latitude}, longitude: {self.longitude}]"
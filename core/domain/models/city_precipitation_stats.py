@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from typing import Any
 
+from core.domain.models.daily_series import MAP_DAILY_FORMAT
 from core.domain.models.precipitation_stats import PrecipitationStats
+from core.domain.models.stats_query import ALL_STATS_FIELDS
 
 
 @dataclass(frozen=True)
@@ -10,9 +12,13 @@ class CityPrecipitationStats:
     longitude: float
     precipitation_stats: PrecipitationStats
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(
+        self,
+        daily_format: str = MAP_DAILY_FORMAT,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[str, Any]:
         return {
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "precipitation": self.precipitation_stats.to_dict(),
+            "precipitation": self.precipitation_stats.to_dict(daily_format, fields),
         }
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Any
 
+from core.domain.models.daily_series import MAP_DAILY_FORMAT
+from core.domain.models.stats_query import ALL_STATS_FIELDS
 from core.domain.models.temperature_stats import TemperatureStats
 
 
@@ -10,9 +12,13 @@ class CityTemperatureStats:
     longitude: float
     temperature_stats: TemperatureStats
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(
+        self,
+        daily_format: str = MAP_DAILY_FORMAT,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[str, Any]:
         return {
             "latitude": self.latitude,
             "longitude": self.longitude,
-            "temperature": self.temperature_stats.to_dict(),
+            "temperature": self.temperature_stats.to_dict(daily_format, fields),
         }
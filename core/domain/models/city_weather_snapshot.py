@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from core.domain.models.city_weather_stats import CityWeatherStats
+
+
+@dataclass(frozen=True)
+class CityWeatherSnapshot:
+    city_id: int
+    data_version: int
+    city_weather_stats: CityWeatherStats | None
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+MAP_DAILY_FORMAT = "map"
+COMPACT_DAILY_FORMAT = "compact"
+DAILY_FORMATS = [MAP_DAILY_FORMAT, COMPACT_DAILY_FORMAT]
+
+DAILY_STEP = "P1D"
+
+
+@dataclass(frozen=True, eq=False)
+class DailySeries:
+    days: np.ndarray
+    values: np.ndarray
+
+    def to_dict(self, daily_format: str = MAP_DAILY_FORMAT) -> dict[str, Any]:
+        if daily_format == COMPACT_DAILY_FORMAT:
+            return self.__to_compact_dict()
+
+        return dict(
+            zip(
+                np.datetime_as_string(self.days, unit="D").tolist(),
+                self.values.tolist(),
+            )
+        )
+
+    def __to_compact_dict(self) -> dict[str, Any]:
+        if len(self.days) == 0:
+            return {
+                "start": None,
+                "step": DAILY_STEP,
+                "values": np.empty(0, dtype=np.float64),
+            }
+
+        offsets = (self.days - self.days[0]).astype(np.int64)
+        if offsets[-1] == len(offsets) - 1:
+            values = np.ascontiguousarray(self.values, dtype=np.float64)
+        else:
+            values = np.full(offsets[-1] + 1, np.nan)
+            values[offsets] = self.values
+
+        return {
+            "start": str(self.days[0]),
+            "step": DAILY_STEP,
+            "values": values,
+        }
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from core.domain.models.date_time_range import DateTimeRange
+from core.domain.models.period_range import PeriodRange
+
+
+@dataclass(frozen=True)
+class DateRangePlan:
+    hourly_ranges: list[DateTimeRange]
+    period_ranges: list[PeriodRange]
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class DateTimeRange:
+    start: datetime
+    end: datetime
+    include_end: bool
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+
+DAY_RESOLUTION = "day"
+MONTH_RESOLUTION = "month"
+YEAR_RESOLUTION = "year"
+
+
+@dataclass(frozen=True)
+class PeriodRange:
+    resolution: str
+    start: date
+    end: date
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from dataclasses import dataclass, fields
+from typing import Callable
+
+import numpy as np
+
+from core.domain.models.series_stats import SeriesStats
+
+
+@dataclass(frozen=True, eq=False)
+class PeriodSeriesStats:
+    periods: np.ndarray
+    count: np.ndarray
+    total: np.ndarray
+    max: np.ndarray
+    max_date_time: np.ndarray
+    min: np.ndarray
+    min_date_time: np.ndarray
+    hours_above_threshold: np.ndarray
+    hours_below_threshold: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.periods)
+
+    @staticmethod
+    def empty() -> PeriodSeriesStats:
+        return PeriodSeriesStats(
+            periods=np.array([], dtype="datetime64[D]"),
+            count=np.array([], dtype=np.int64),
+            total=np.array([], dtype=np.float64),
+            max=np.array([], dtype=np.float64),
+            max_date_time=np.array([], dtype="datetime64[us]"),
+            min=np.array([], dtype=np.float64),
+            min_date_time=np.array([], dtype="datetime64[us]"),
+            hours_above_threshold=np.array([], dtype=np.int64),
+            hours_below_threshold=np.array([], dtype=np.int64),
+        )
+
+    @staticmethod
+    def concatenate(
+        period_series_stats_list: list[PeriodSeriesStats],
+    ) -> PeriodSeriesStats:
+        if len(period_series_stats_list) == 0:
+            return PeriodSeriesStats.empty()
+
+        concatenated = PeriodSeriesStats(
+            **{
+                field.name: np.concatenate(
+                    [
+                        getattr(period_series_stats, field.name)
+                        for period_series_stats in period_series_stats_list
+                    ]
+                )
+                for field in fields(PeriodSeriesStats)
+            }
+        )
+        return concatenated.take(np.argsort(concatenated.periods, kind="stable"))
+
+    def take(self, indices: np.ndarray | slice) -> PeriodSeriesStats:
+        return PeriodSeriesStats(
+            **{
+                field.name: getattr(self, field.name)[indices]
+                for field in fields(PeriodSeriesStats)
+            }
+        )
+
+    def resample(self, unit: str) -> PeriodSeriesStats:
+        if len(self) == 0:
+            return PeriodSeriesStats.empty()
+
+        if np.any(self.periods[1:] < self.periods[:-1]):
+            return self.take(np.argsort(self.periods, kind="stable")).resample(unit)
+
+        periods = self.periods.astype(f"datetime64[{unit}]").astype("datetime64[D]")
+        starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+        codes = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(periods)]))
+
+        max_values, max_date_times = self.__extreme_by_period(
+            self.max, self.max_date_time, np.fmax, starts, codes
+        )
+        min_values, min_date_times = self.__extreme_by_period(
+            self.min, self.min_date_time, np.fmin, starts, codes
+        )
+
+        return PeriodSeriesStats(
+            periods=periods[starts],
+            count=np.add.reduceat(self.count, starts),
+            total=np.add.reduceat(self.total, starts),
+            max=max_values,
+            max_date_time=max_date_times,
+            min=min_values,
+            min_date_time=min_date_times,
+            hours_above_threshold=np.add.reduceat(self.hours_above_threshold, starts),
+            hours_below_threshold=np.add.reduceat(self.hours_below_threshold, starts),
+        )
+
+    def to_series_stats(self) -> SeriesStats:
+        count = int(self.count.sum())
+        total = float(self.total.sum())
+        max_value, max_date_time = self.__extreme(
+            self.max, self.max_date_time, np.nanargmax
+        )
+        min_value, min_date_time = self.__extreme(
+            self.min, self.min_date_time, np.nanargmin
+        )
+
+        return SeriesStats(
+            count=count,
+            total=total,
+            average=total / count if count > 0 else np.nan,
+            max=max_value,
+            max_date_time=max_date_time,
+            min=min_value,
+            min_date_time=min_date_time,
+            days=self.periods,
+            total_by_day=self.total,
+            count_by_day=self.count,
+            hours_above_threshold=int(self.hours_above_threshold.sum()),
+            hours_below_threshold=int(self.hours_below_threshold.sum()),
+        )
+
+    @staticmethod
+    def __extreme_by_period(
+        values: np.ndarray,
+        date_times: np.ndarray,
+        reducer: np.ufunc,
+        starts: np.ndarray,
+        codes: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        extreme_by_period = reducer.reduceat(values, starts)
+
+        positions = np.arange(len(values))
+        first_positions = np.minimum.reduceat(
+            np.where(values == extreme_by_period[codes], positions, len(values)),
+            starts,
+        )
+
+        return extreme_by_period, np.where(
+            np.isnan(extreme_by_period),
+            np.datetime64("NaT"),
+            date_times[np.minimum(first_positions, len(values) - 1)],
+        )
+
+    @staticmethod
+    def __extreme(
+        values: np.ndarray,
+        date_times: np.ndarray,
+        arg_function: Callable[[np.ndarray], int],
+    ) -> tuple[float | None, str | None]:
+        if np.all(np.isnan(values)):
+            return None, None
+
+        index = int(arg_function(values))
+        return float(values[index]), str(
+            np.datetime_as_string(date_times[index], unit="m")
+        )
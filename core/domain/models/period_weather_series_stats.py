@@ -0,0 +1,53 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.domain.models.period_series_stats import PeriodSeriesStats
+from core.domain.models.weather_series_stats import WeatherSeriesStats
+
+
+@dataclass(frozen=True, eq=False)
+class PeriodWeatherSeriesStats:
+    temperature: PeriodSeriesStats
+    precipitation: PeriodSeriesStats
+
+    def __len__(self) -> int:
+        return len(self.temperature)
+
+    @staticmethod
+    def concatenate(
+        period_weather_series_stats_list: list[PeriodWeatherSeriesStats],
+    ) -> PeriodWeatherSeriesStats:
+        return PeriodWeatherSeriesStats(
+            temperature=PeriodSeriesStats.concatenate(
+                [
+                    period_weather_series_stats.temperature
+                    for period_weather_series_stats in period_weather_series_stats_list
+                ]
+            ),
+            precipitation=PeriodSeriesStats.concatenate(
+                [
+                    period_weather_series_stats.precipitation
+                    for period_weather_series_stats in period_weather_series_stats_list
+                ]
+            ),
+        )
+
+    def take(self, indices: np.ndarray | slice) -> PeriodWeatherSeriesStats:
+        return PeriodWeatherSeriesStats(
+            temperature=self.temperature.take(indices),
+            precipitation=self.precipitation.take(indices),
+        )
+
+    def resample(self, unit: str) -> PeriodWeatherSeriesStats:
+        return PeriodWeatherSeriesStats(
+            temperature=self.temperature.resample(unit),
+            precipitation=self.precipitation.resample(unit),
+        )
+
+    def to_weather_series_stats(self) -> WeatherSeriesStats:
+        return WeatherSeriesStats(
+            temperature=self.temperature.to_series_stats(),
+            precipitation=self.precipitation.to_series_stats(),
+        )
@@ -1,25 +1,37 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+from core.domain.models.daily_series import DailySeries, MAP_DAILY_FORMAT
+from core.domain.models.stats_query import ALL_STATS_FIELDS
 
 
 @dataclass(frozen=True)
 class PrecipitationStats:
     total: float
-    total_by_day: dict[str, float]
+    total_by_day: DailySeries | None
     days_with_precipitation: int
     max: dict[str, float | str]
     average: float
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(
+        self,
+        daily_format: str = MAP_DAILY_FORMAT,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[str, Any]:
         return {
-            "total": float(self.total),
-            "total_by_day": {
-                key: float(value) for key, value in self.total_by_day.items()
-            },
-            "days_with_precipitation": int(self.days_with_precipitation),
-            "max": {
+            name: serialize()
+            for name, serialize in self.__serializers(daily_format).items()
+            if name in fields
+        }
+
+    def __serializers(self, daily_format: str) -> dict[str, Callable[[], Any]]:
+        return {
+            "total": lambda: float(self.total),
+            "total_by_day": lambda: self.total_by_day.to_dict(daily_format),
+            "days_with_precipitation": lambda: int(self.days_with_precipitation),
+            "max": lambda: {
                 "value": float(self.max["precipitation"]),
                 "date": self.max["date_time"],
             },
-            "average": float(self.average),
+            "average": lambda: float(self.average),
         }
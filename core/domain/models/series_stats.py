@@ -0,0 +1,41 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True, eq=False)
+class SeriesStats:
+    count: int
+    total: float
+    average: float
+    max: float | None
+    max_date_time: str | None
+    min: float | None
+    min_date_time: str | None
+    days: np.ndarray
+    total_by_day: np.ndarray
+    count_by_day: np.ndarray
+    hours_above_threshold: int
+    hours_below_threshold: int
+
+    @property
+    def start_day(self) -> str:
+        return str(self.days[0])
+
+    @property
+    def end_day(self) -> str:
+        return str(self.days[-1])
+
+    @property
+    def average_by_day(self) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.total_by_day / self.count_by_day
+
+    def total_by_day_as_dict(self) -> dict[str, float]:
+        return dict(zip(self.__day_keys(), self.total_by_day.tolist()))
+
+    def average_by_day_as_dict(self) -> dict[str, float]:
+        return dict(zip(self.__day_keys(), self.average_by_day.tolist()))
+
+    def __day_keys(self) -> list[str]:
+        return np.datetime_as_string(self.days, unit="D").tolist()
@@ -1,6 +1,49 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+DEFAULT_UPPER_THRESHOLD = 30.0
+DEFAULT_LOWER_THRESHOLD = 0.0
+
+AVERAGE_FIELD = "average"
+AVERAGE_BY_DAY_FIELD = "average_by_day"
+TOTAL_FIELD = "total"
+TOTAL_BY_DAY_FIELD = "total_by_day"
+MAX_FIELD = "max"
+MIN_FIELD = "min"
+HOURS_ABOVE_THRESHOLD_FIELD = "hours_above_threshold"
+HOURS_BELOW_THRESHOLD_FIELD = "hours_below_threshold"
+DAYS_WITH_PRECIPITATION_FIELD = "days_with_precipitation"
+STATS_FIELDS = [
+    AVERAGE_FIELD,
+    AVERAGE_BY_DAY_FIELD,
+    TOTAL_FIELD,
+    TOTAL_BY_DAY_FIELD,
+    MAX_FIELD,
+    MIN_FIELD,
+    HOURS_ABOVE_THRESHOLD_FIELD,
+    HOURS_BELOW_THRESHOLD_FIELD,
+    DAYS_WITH_PRECIPITATION_FIELD,
+]
+ALL_STATS_FIELDS = frozenset(STATS_FIELDS)
+TEMPERATURE_STATS_FIELDS = [
+    AVERAGE_FIELD,
+    AVERAGE_BY_DAY_FIELD,
+    MAX_FIELD,
+    MIN_FIELD,
+    HOURS_ABOVE_THRESHOLD_FIELD,
+    HOURS_BELOW_THRESHOLD_FIELD,
+]
+PRECIPITATION_STATS_FIELDS = [
+    AVERAGE_FIELD,
+    TOTAL_FIELD,
+    TOTAL_BY_DAY_FIELD,
+    MAX_FIELD,
+    DAYS_WITH_PRECIPITATION_FIELD,
+]
+TEMPERATURE_SERIES = "temperature"
+PRECIPITATION_SERIES = "precipitation"
+ALL_SERIES = frozenset([TEMPERATURE_SERIES, PRECIPITATION_SERIES])
+
 
 @dataclass(frozen=True)
 class StatsQuery:
@@ -11,3 +54,4 @@ class StatsQuery:
     longitude: float | None
     upper_threshold: float
     lower_threshold: float
+    fields: frozenset[str] = ALL_STATS_FIELDS
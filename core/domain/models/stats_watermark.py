@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class StatsWatermark:
+    tag: str
+    last_modified: datetime | None
@@ -1,30 +1,42 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
+
+from core.domain.models.daily_series import DailySeries, MAP_DAILY_FORMAT
+from core.domain.models.stats_query import ALL_STATS_FIELDS
 
 
 @dataclass(frozen=True)
 class TemperatureStats:
     average: float
-    average_by_day: dict[str, float]
+    average_by_day: DailySeries | None
     max: dict[str, float | str]
     min: dict[str, float]
     hours_above_threshold: int
     hours_below_threshold: int
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(
+        self,
+        daily_format: str = MAP_DAILY_FORMAT,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[str, Any]:
         return {
-            "average": float(self.average),
-            "average_by_day": {
-                key: float(value) for key, value in self.average_by_day.items()
-            },
-            "max": {
+            name: serialize()
+            for name, serialize in self.__serializers(daily_format).items()
+            if name in fields
+        }
+
+    def __serializers(self, daily_format: str) -> dict[str, Callable[[], Any]]:
+        return {
+            "average": lambda: float(self.average),
+            "average_by_day": lambda: self.average_by_day.to_dict(daily_format),
+            "max": lambda: {
                 "value": float(self.max["temperature"]),
                 "date": self.max["date_time"],
             },
-            "min": {
+            "min": lambda: {
                 "value": float(self.min["temperature"]),
                 "date": self.min["date_time"],
             },
-            "hours_above_threshold": int(self.hours_above_threshold),
-            "hours_below_threshold": int(self.hours_below_threshold),
+            "hours_above_threshold": lambda: int(self.hours_above_threshold),
+            "hours_below_threshold": lambda: int(self.hours_below_threshold),
         }
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+
+from core.domain.models.weather_data import WeatherData
+
+
+@dataclass(frozen=True, eq=False)
+class WeatherSeries:
+    date_times: np.ndarray
+    temperatures: np.ndarray
+    precipitations: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.date_times)
+
+    def is_empty(self) -> bool:
+        return len(self.date_times) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.date_times.nbytes
+            + self.temperatures.nbytes
+            + self.precipitations.nbytes
+        )
+
+    def between(self, start_date: datetime, end_date: datetime) -> WeatherSeries:
+        start = np.searchsorted(
+            self.date_times, self.__to_datetime64(start_date), side="left"
+        )
+        end = np.searchsorted(
+            self.date_times, self.__to_datetime64(end_date), side="right"
+        )
+
+        return WeatherSeries(
+            date_times=self.date_times[start:end],
+            temperatures=self.temperatures[start:end],
+            precipitations=self.precipitations[start:end],
+        )
+
+    @staticmethod
+    def from_weather_data(weather_data_list: list[WeatherData]) -> WeatherSeries:
+        return WeatherSeries(
+            date_times=np.array(
+                [
+                    weather_data.date_time.replace(tzinfo=None)
+                    for weather_data in weather_data_list
+                ],
+                dtype="datetime64[us]",
+            ),
+            temperatures=np.array(
+                [weather_data.temperature for weather_data in weather_data_list],
+                dtype=np.float64,
+            ),
+            precipitations=np.array(
+                [weather_data.precipitation for weather_data in weather_data_list],
+                dtype=np.float64,
+            ),
+        )
+
+    @staticmethod
+    def __to_datetime64(date_time: datetime) -> np.datetime64:
+        if date_time.tzinfo is not None:
+            date_time = date_time.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(date_time, "us")
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from core.domain.models.series_stats import SeriesStats
+
+
+@dataclass(frozen=True, eq=False)
+class WeatherSeriesStats:
+    temperature: SeriesStats | None
+    precipitation: SeriesStats | None
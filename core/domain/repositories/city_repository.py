@@ -17,3 +17,7 @@ class CityRepository(ABC):
     @abstractmethod
     def get_all_cities(self) -> list[City]:
         pass
+
+    @abstractmethod
+    def get_cities_page(self, after_id: int | None, limit: int) -> list[City]:
+        pass
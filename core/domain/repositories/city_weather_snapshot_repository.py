@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
+
+
+class CityWeatherSnapshotRepository(ABC):
+    @abstractmethod
+    def bulk_save(self, city_weather_snapshots: list[CityWeatherSnapshot]) -> None:
+        pass
+
+    @abstractmethod
+    def get_by_city_ids(self, city_ids: list[int]) -> dict[int, CityWeatherSnapshot]:
+        pass
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+from core.domain.models.stats_query import ALL_STATS_FIELDS
 from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.models.weather_series_stats import WeatherSeriesStats
 
 
 class WeatherDataRepository(ABC):
@@ -18,3 +21,31 @@ class WeatherDataRepository(ABC):
     @abstractmethod
     def get_by_city_id(self, city_id: int) -> list[WeatherData]:
         pass
+
+    @abstractmethod
+    def get_series_by_city_ids(self, city_ids: list[int]) -> dict[int, WeatherSeries]:
+        pass
+
+    @abstractmethod
+    def get_series_by_city_date_ranges(
+        self, date_ranges_by_city_id: dict[int, list[tuple[datetime, datetime]]]
+    ) -> dict[int, WeatherSeries]:
+        pass
+
+    @abstractmethod
+    def get_stats_by_city_ids_and_date_range(
+        self,
+        city_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        upper_threshold: float,
+        lower_threshold: float,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[int, WeatherSeriesStats]:
+        pass
+
+    @abstractmethod
+    def get_summary_stats_by_city_ids(
+        self, city_ids: list[int]
+    ) -> dict[int, WeatherSeriesStats]:
+        pass
@@ -0,0 +1,49 @@
+from core.domain.models.period_weather_series_stats import PeriodWeatherSeriesStats
+from core.domain.models.stats_query import (
+    DEFAULT_LOWER_THRESHOLD,
+    DEFAULT_UPPER_THRESHOLD,
+)
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
+
+
+class DailyWeatherStatsAccumulator:
+    def __init__(
+        self,
+        upper_threshold: float = DEFAULT_UPPER_THRESHOLD,
+        lower_threshold: float = DEFAULT_LOWER_THRESHOLD,
+    ):
+        self.__upper_threshold = upper_threshold
+        self.__lower_threshold = lower_threshold
+        self.__closed_days: list[PeriodWeatherSeriesStats] = []
+        self.__open_day: PeriodWeatherSeriesStats | None = None
+
+    def add(self, weather_series: WeatherSeries) -> None:
+        if weather_series.is_empty():
+            return
+
+        kernel = SeriesStatsKernel(weather_series.date_times)
+        daily = PeriodWeatherSeriesStats(
+            temperature=kernel.compute_by_day(
+                weather_series.temperatures,
+                upper_threshold=self.__upper_threshold,
+                lower_threshold=self.__lower_threshold,
+            ),
+            precipitation=kernel.compute_by_day(
+                weather_series.precipitations, upper_threshold=0.0
+            ),
+        )
+
+        if self.__open_day is not None:
+            daily = PeriodWeatherSeriesStats.concatenate(
+                [self.__open_day, daily]
+            ).resample("D")
+
+        self.__closed_days.append(daily.take(slice(0, len(daily) - 1)))
+        self.__open_day = daily.take(slice(len(daily) - 1, len(daily)))
+
+    def result(self) -> PeriodWeatherSeriesStats:
+        return PeriodWeatherSeriesStats.concatenate(
+            self.__closed_days
+            + ([self.__open_day] if self.__open_day is not None else [])
+        )
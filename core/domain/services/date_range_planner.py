@@ -0,0 +1,87 @@
+from datetime import date, datetime, time, timedelta
+
+from core.domain.models.date_range_plan import DateRangePlan
+from core.domain.models.date_time_range import DateTimeRange
+from core.domain.models.period_range import (
+    DAY_RESOLUTION,
+    MONTH_RESOLUTION,
+    YEAR_RESOLUTION,
+    PeriodRange,
+)
+
+
+class DateRangePlanner:
+    @staticmethod
+    def plan(
+        start_date: datetime, end_date: datetime, resolution: str = YEAR_RESOLUTION
+    ) -> DateRangePlan:
+        first_full_day = start_date.date()
+        if start_date.time() != time.min:
+            first_full_day += timedelta(days=1)
+        end_full_day = end_date.date()
+
+        if first_full_day >= end_full_day:
+            return DateRangePlan(
+                hourly_ranges=[DateTimeRange(start_date, end_date, include_end=True)],
+                period_ranges=[],
+            )
+
+        head_end = datetime.combine(first_full_day, time.min, tzinfo=start_date.tzinfo)
+        hourly_ranges = [
+            DateTimeRange(
+                datetime.combine(end_full_day, time.min, tzinfo=end_date.tzinfo),
+                end_date,
+                include_end=True,
+            )
+        ]
+        if start_date < head_end:
+            hourly_ranges.insert(
+                0, DateTimeRange(start_date, head_end, include_end=False)
+            )
+
+        return DateRangePlan(
+            hourly_ranges=hourly_ranges,
+            period_ranges=DateRangePlanner.__cover(
+                first_full_day, end_full_day, resolution
+            ),
+        )
+
+    @staticmethod
+    def __cover(start: date, end: date, resolution: str) -> list[PeriodRange]:
+        if start >= end:
+            return []
+
+        if resolution == DAY_RESOLUTION:
+            return [PeriodRange(DAY_RESOLUTION, start, end)]
+
+        finer_resolution = (
+            MONTH_RESOLUTION if resolution == YEAR_RESOLUTION else DAY_RESOLUTION
+        )
+        first_period = DateRangePlanner.__ceil(start, resolution)
+        end_period = DateRangePlanner.__floor(end, resolution)
+
+        if first_period >= end_period:
+            return DateRangePlanner.__cover(start, end, finer_resolution)
+
+        return (
+            DateRangePlanner.__cover(start, first_period, finer_resolution)
+            + [PeriodRange(resolution, first_period, end_period)]
+            + DateRangePlanner.__cover(end_period, end, finer_resolution)
+        )
+
+    @staticmethod
+    def __floor(day: date, resolution: str) -> date:
+        if resolution == YEAR_RESOLUTION:
+            return date(day.year, 1, 1)
+        return date(day.year, day.month, 1)
+
+    @staticmethod
+    def __ceil(day: date, resolution: str) -> date:
+        floor = DateRangePlanner.__floor(day, resolution)
+        if floor == day:
+            return day
+        if resolution == YEAR_RESOLUTION:
+            return date(day.year + 1, 1, 1)
+        if day.month == 12:
+            return date(day.year + 1, 1, 1)
+        return date(day.year, day.month + 1, 1)
@@ -0,0 +1,402 @@
+from datetime import datetime, timezone
+from typing import Callable
+
+import numpy as np
+
+from core.domain.models.period_series_stats import PeriodSeriesStats
+from core.domain.models.series_stats import SeriesStats
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
+
+
+class SeriesRangeIndex:
+    def __init__(
+        self,
+        date_times: np.ndarray,
+        values: np.ndarray,
+    ):
+        if np.any(date_times[1:] < date_times[:-1]):
+            order = np.argsort(date_times, kind="stable")
+            date_times, values = date_times[order], values[order]
+
+        self.__date_times = date_times
+        self.__values = values
+
+        self.__daily = SeriesStatsKernel(date_times).compute_by_day(values)
+        self.__day_starts = np.searchsorted(
+            date_times, self.__daily.periods.astype("datetime64[us]"), side="left"
+        )
+        self.__day_ends = np.append(self.__day_starts[1:], len(date_times))
+
+        self.__count_prefix = self.__prefix(self.__daily.count)
+        self.__levels = [
+            self.__build_level(self.__block_bounds(unit))
+            for unit in ["datetime64[Y]", "datetime64[M]", "datetime64[D]"]
+        ]
+
+        self.__max_values = np.where(
+            np.isnan(self.__daily.max), -np.inf, self.__daily.max
+        )
+        self.__max_table = self.__build_sparse_table(
+            self.__max_values, np.greater_equal
+        )
+        self.__min_values = np.where(
+            np.isnan(self.__daily.min), np.inf, self.__daily.min
+        )
+        self.__min_table = self.__build_sparse_table(self.__min_values, np.less_equal)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            array.nbytes
+            for array in [
+                self.__date_times,
+                self.__values,
+                self.__daily.periods,
+                self.__daily.count,
+                self.__daily.total,
+                self.__daily.max,
+                self.__daily.max_date_time,
+                self.__daily.min,
+                self.__daily.min_date_time,
+                self.__daily.hours_above_threshold,
+                self.__daily.hours_below_threshold,
+                self.__day_starts,
+                self.__day_ends,
+                self.__count_prefix,
+                *(array for level in self.__levels for array in level),
+                self.__max_values,
+                self.__min_values,
+                *self.__max_table,
+                *self.__min_table,
+            ]
+        )
+
+    def compute(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        upper_threshold: float | None = None,
+        lower_threshold: float | None = None,
+        extremes: bool = True,
+    ) -> SeriesStats | None:
+        start = int(
+            np.searchsorted(
+                self.__date_times, self.__to_datetime64(start_date), side="left"
+            )
+        )
+        end = int(
+            np.searchsorted(
+                self.__date_times, self.__to_datetime64(end_date), side="right"
+            )
+        )
+
+        if start >= end:
+            return None
+
+        first_day = int(np.searchsorted(self.__day_starts, start, side="right")) - 1
+        last_day = int(np.searchsorted(self.__day_starts, end - 1, side="right")) - 1
+
+        if first_day == last_day:
+            return self.__scan(
+                start, end, upper_threshold, lower_threshold
+            ).to_series_stats()
+
+        head, full_start = PeriodSeriesStats.empty(), first_day
+        if start > self.__day_starts[first_day]:
+            head = self.__scan(
+                start, self.__day_ends[first_day], upper_threshold, lower_threshold
+            )
+            full_start = first_day + 1
+
+        tail, full_end = PeriodSeriesStats.empty(), last_day + 1
+        if end < self.__day_ends[last_day]:
+            tail = self.__scan(
+                self.__day_starts[last_day], end, upper_threshold, lower_threshold
+            )
+            full_end = last_day
+
+        full = self.__daily.take(slice(full_start, full_end))
+        total_by_day = np.concatenate([head.total, full.total, tail.total])
+        count = int(
+            head.count.sum()
+            + self.__count_prefix[full_end]
+            - self.__count_prefix[full_start]
+            + tail.count.sum()
+        )
+        total = float(total_by_day.sum())
+
+        max_value, max_date_time, min_value, min_date_time = (
+            self.__get_extremes(head, tail, full_start, full_end)
+            if extremes
+            else (None, None, None, None)
+        )
+
+        return SeriesStats(
+            count=count,
+            total=total,
+            average=total / count if count > 0 else np.nan,
+            max=max_value,
+            max_date_time=max_date_time,
+            min=min_value,
+            min_date_time=min_date_time,
+            days=np.concatenate([head.periods, full.periods, tail.periods]),
+            total_by_day=total_by_day,
+            count_by_day=np.concatenate([head.count, full.count, tail.count]),
+            hours_above_threshold=int(
+                head.hours_above_threshold.sum()
+                + self.__count_above(full_start, full_end, upper_threshold)
+                + tail.hours_above_threshold.sum()
+            ),
+            hours_below_threshold=int(
+                head.hours_below_threshold.sum()
+                + self.__count_below(full_start, full_end, lower_threshold)
+                + tail.hours_below_threshold.sum()
+            ),
+        )
+
+    def __get_extremes(
+        self,
+        head: PeriodSeriesStats,
+        tail: PeriodSeriesStats,
+        full_start: int,
+        full_end: int,
+    ) -> tuple[float | None, str | None, float | None, str | None]:
+        max_value, max_date_time = self.__extreme(
+            self.__candidates(
+                head.max,
+                head.max_date_time,
+                self.__daily.max,
+                self.__daily.max_date_time,
+                self.__query(
+                    self.__max_table,
+                    self.__max_values,
+                    np.greater_equal,
+                    full_start,
+                    full_end,
+                ),
+                tail.max,
+                tail.max_date_time,
+            ),
+            np.greater,
+        )
+        min_value, min_date_time = self.__extreme(
+            self.__candidates(
+                head.min,
+                head.min_date_time,
+                self.__daily.min,
+                self.__daily.min_date_time,
+                self.__query(
+                    self.__min_table,
+                    self.__min_values,
+                    np.less_equal,
+                    full_start,
+                    full_end,
+                ),
+                tail.min,
+                tail.min_date_time,
+            ),
+            np.less,
+        )
+
+        return max_value, max_date_time, min_value, min_date_time
+
+    def __count_above(
+        self, start_day: int, end_day: int, threshold: float | None
+    ) -> int:
+        if threshold is None:
+            return 0
+
+        return sum(
+            int(
+                (
+                    ends
+                    - self.__search(
+                        sorted_values, starts, ends, threshold, np.less_equal
+                    )
+                ).sum()
+            )
+            for sorted_values, starts, ends in self.__blocks(start_day, end_day)
+        )
+
+    def __count_below(
+        self, start_day: int, end_day: int, threshold: float | None
+    ) -> int:
+        if threshold is None:
+            return 0
+
+        return sum(
+            int(
+                (
+                    self.__search(sorted_values, starts, ends, threshold, np.less)
+                    - starts
+                ).sum()
+            )
+            for sorted_values, starts, ends in self.__blocks(start_day, end_day)
+        )
+
+    def __blocks(
+        self, start_day: int, end_day: int, level: int = 0
+    ) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        if start_day >= end_day:
+            return []
+
+        day_bounds, value_bounds, sorted_values = self.__levels[level]
+        first = int(np.searchsorted(day_bounds, start_day, side="left"))
+        last = int(np.searchsorted(day_bounds, end_day, side="right")) - 1
+        if first >= last:
+            return self.__blocks(start_day, end_day, level + 1)
+
+        starts = value_bounds[first:last]
+        ends = starts + (
+            self.__count_prefix[day_bounds[first + 1 : last + 1]]
+            - self.__count_prefix[day_bounds[first:last]]
+        )
+        return [
+            *self.__blocks(start_day, int(day_bounds[first]), level + 1),
+            (sorted_values, starts, ends),
+            *self.__blocks(int(day_bounds[last]), end_day, level + 1),
+        ]
+
+    @staticmethod
+    def __search(
+        sorted_values: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        threshold: float,
+        goes_right: Callable[[np.ndarray, float], np.ndarray],
+    ) -> np.ndarray:
+        low, high = starts.copy(), ends.copy()
+        while np.any(low < high):
+            active = low < high
+            middle = (low + high) // 2
+            right = active & goes_right(
+                sorted_values[np.minimum(middle, len(sorted_values) - 1)],
+                threshold,
+            )
+            low = np.where(right, middle + 1, low)
+            high = np.where(active & ~right, middle, high)
+        return low
+
+    def __block_bounds(self, unit: str) -> np.ndarray:
+        periods = self.__daily.periods.astype(unit)
+        return np.concatenate(
+            [
+                [0],
+                np.flatnonzero(periods[1:] != periods[:-1]) + 1,
+                [len(periods)],
+            ]
+        ).astype(np.int64)
+
+    def __build_level(
+        self, day_bounds: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        value_bounds = np.append(self.__day_starts, len(self.__values))[day_bounds]
+        return (
+            day_bounds,
+            value_bounds,
+            self.__values[
+                np.lexsort(
+                    (
+                        np.where(np.isnan(self.__values), np.inf, self.__values),
+                        np.repeat(
+                            np.arange(len(day_bounds) - 1), np.diff(value_bounds)
+                        ),
+                    )
+                )
+            ],
+        )
+
+    def __scan(
+        self,
+        start: int,
+        end: int,
+        upper_threshold: float | None,
+        lower_threshold: float | None,
+    ) -> PeriodSeriesStats:
+        return SeriesStatsKernel(self.__date_times[start:end]).compute_by_day(
+            self.__values[start:end], upper_threshold, lower_threshold
+        )
+
+    @staticmethod
+    def __prefix(values: np.ndarray) -> np.ndarray:
+        return np.concatenate([[0], np.cumsum(values, dtype=np.int64)])
+
+    @staticmethod
+    def __build_sparse_table(
+        values: np.ndarray,
+        is_preferred: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    ) -> list[np.ndarray]:
+        table = [np.arange(len(values))]
+        width = 1
+        while 2 * width <= len(values):
+            previous = table[-1]
+            left = previous[: len(previous) - width]
+            right = previous[width:]
+            table.append(
+                np.where(is_preferred(values[left], values[right]), left, right)
+            )
+            width *= 2
+        return table
+
+    @staticmethod
+    def __query(
+        table: list[np.ndarray],
+        values: np.ndarray,
+        is_preferred: Callable[[float, float], bool],
+        start: int,
+        end: int,
+    ) -> int | None:
+        if start >= end:
+            return None
+
+        level = (end - start).bit_length() - 1
+        left = table[level][start]
+        right = table[level][end - (1 << level)]
+        return int(left if is_preferred(values[left], values[right]) else right)
+
+    @staticmethod
+    def __candidates(
+        head_values: np.ndarray,
+        head_date_times: np.ndarray,
+        daily_values: np.ndarray,
+        daily_date_times: np.ndarray,
+        day: int | None,
+        tail_values: np.ndarray,
+        tail_date_times: np.ndarray,
+    ) -> list[tuple[float, np.datetime64]]:
+        candidates = [
+            (values[0], date_times[0])
+            for values, date_times in [
+                (head_values, head_date_times),
+                (tail_values, tail_date_times),
+            ]
+            if len(values) > 0
+        ]
+        if day is not None:
+            candidates.insert(
+                len(head_values), (daily_values[day], daily_date_times[day])
+            )
+        return candidates
+
+    @staticmethod
+    def __extreme(
+        candidates: list[tuple[float, np.datetime64]],
+        is_better: Callable[[float, float], bool],
+    ) -> tuple[float | None, str | None]:
+        best = None
+        for value, date_time in candidates:
+            if np.isnan(value):
+                continue
+            if best is None or is_better(value, best[0]):
+                best = (value, date_time)
+
+        if best is None:
+            return None, None
+
+        return float(best[0]), str(np.datetime_as_string(best[1], unit="m"))
+
+    @staticmethod
+    def __to_datetime64(date_time: datetime) -> np.datetime64:
+        if date_time.tzinfo is not None:
+            date_time = date_time.astimezone(timezone.utc).replace(tzinfo=None)
+        return np.datetime64(date_time, "us")
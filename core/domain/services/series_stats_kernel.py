@@ -0,0 +1,59 @@
+from typing import Callable
+
+import numpy as np
+
+from core.domain.models.period_series_stats import PeriodSeriesStats
+from core.domain.models.series_stats import SeriesStats
+
+
+class SeriesStatsKernel:
+    def __init__(self, date_times: np.ndarray):
+        self.__order = None
+        if np.any(date_times[1:] < date_times[:-1]):
+            self.__order = np.argsort(date_times, kind="stable")
+            date_times = date_times[self.__order]
+
+        self.__date_times = date_times
+
+    def compute(
+        self,
+        values: np.ndarray,
+        upper_threshold: float | None = None,
+        lower_threshold: float | None = None,
+    ) -> SeriesStats:
+        return self.compute_by_day(
+            values, upper_threshold, lower_threshold
+        ).to_series_stats()
+
+    def compute_by_day(
+        self,
+        values: np.ndarray,
+        upper_threshold: float | None = None,
+        lower_threshold: float | None = None,
+    ) -> PeriodSeriesStats:
+        if self.__order is not None:
+            values = values[self.__order]
+
+        valid = ~np.isnan(values)
+
+        return PeriodSeriesStats(
+            periods=self.__date_times,
+            count=valid.astype(np.int64),
+            total=np.where(valid, values, 0.0),
+            max=values,
+            max_date_time=self.__date_times,
+            min=values,
+            min_date_time=self.__date_times,
+            hours_above_threshold=self.__count(values, upper_threshold, np.greater),
+            hours_below_threshold=self.__count(values, lower_threshold, np.less),
+        ).resample("D")
+
+    def __count(
+        self,
+        values: np.ndarray,
+        threshold: float | None,
+        comparator: Callable[[np.ndarray, float], np.ndarray],
+    ) -> np.ndarray:
+        if threshold is None:
+            return np.zeros(len(values), dtype=np.int64)
+        return comparator(values, threshold).astype(np.int64)
@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from core.domain.models.stats_query import (
+    ALL_SERIES,
+    ALL_STATS_FIELDS,
+    DAYS_WITH_PRECIPITATION_FIELD,
+    DEFAULT_LOWER_THRESHOLD,
+    DEFAULT_UPPER_THRESHOLD,
+    HOURS_ABOVE_THRESHOLD_FIELD,
+    HOURS_BELOW_THRESHOLD_FIELD,
+    MAX_FIELD,
+    MIN_FIELD,
+    PRECIPITATION_SERIES,
+    TEMPERATURE_SERIES,
+)
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.models.weather_series_stats import WeatherSeriesStats
+from core.domain.services.series_range_index import SeriesRangeIndex
+
+
+class WeatherSeriesIndex:
+    def __init__(self, weather_series: WeatherSeries):
+        self.__temperature_index = SeriesRangeIndex(
+            weather_series.date_times, weather_series.temperatures
+        )
+        self.__precipitation_index = SeriesRangeIndex(
+            weather_series.date_times, weather_series.precipitations
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.__temperature_index.nbytes + self.__precipitation_index.nbytes
+
+    def compute(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        upper_threshold: float = DEFAULT_UPPER_THRESHOLD,
+        lower_threshold: float = DEFAULT_LOWER_THRESHOLD,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+        series: frozenset[str] = ALL_SERIES,
+    ) -> WeatherSeriesStats | None:
+        temperature_stats = None
+        if TEMPERATURE_SERIES in series:
+            temperature_stats = self.__temperature_index.compute(
+                start_date,
+                end_date,
+                upper_threshold if HOURS_ABOVE_THRESHOLD_FIELD in fields else None,
+                lower_threshold if HOURS_BELOW_THRESHOLD_FIELD in fields else None,
+                extremes=MAX_FIELD in fields or MIN_FIELD in fields,
+            )
+            if temperature_stats is None:
+                return None
+
+        precipitation_stats = None
+        if PRECIPITATION_SERIES in series:
+            precipitation_stats = self.__precipitation_index.compute(
+                start_date,
+                end_date,
+                upper_threshold=(
+                    0.0 if DAYS_WITH_PRECIPITATION_FIELD in fields else None
+                ),
+                extremes=MAX_FIELD in fields,
+            )
+            if precipitation_stats is None:
+                return None
+
+        return WeatherSeriesStats(
+            temperature=temperature_stats, precipitation=precipitation_stats
+        )
@@ -0,0 +1,8 @@
+from core.domain.exceptions.validation_error import ValidationError
+
+
+class ChoiceValidator:
+    @staticmethod
+    def validate(name: str, value: str, choices: list[str]) -> None:
+        if value not in choices:
+            raise ValidationError(f"{name} {value} is not one of {', '.join(choices)}.")
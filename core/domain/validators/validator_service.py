@@ -1,4 +1,15 @@
-from core.domain.models.stats_query import StatsQuery
+from typing import Any
+
+from core.domain.exceptions.validation_error import ValidationError
+from core.domain.models.daily_series import DAILY_FORMATS, MAP_DAILY_FORMAT
+from core.domain.models.stats_query import (
+    ALL_STATS_FIELDS,
+    DEFAULT_LOWER_THRESHOLD,
+    DEFAULT_UPPER_THRESHOLD,
+    STATS_FIELDS,
+    StatsQuery,
+)
+from core.domain.validators.choice_validator import ChoiceValidator
 from core.domain.validators.date_format_validator import DateFormatValidator
 from core.domain.validators.float_format_validator import FloatFormatValidator
 from core.domain.validators.mandatory_validator import MandatoryValidator
@@ -15,6 +26,8 @@ class ValidatorService:
         longitude_str: str | None,
         upper_threshold_str: str | None,
         lower_threshold_str: str | None,
+        fields_str: str | None = None,
+        stats_fields: list[str] = STATS_FIELDS,
     ) -> StatsQuery:
         MandatoryValidator.validate("city_name", city_name)
         MandatoryValidator.validate("start_date", start_date_str)
@@ -42,9 +55,69 @@ class ValidatorService:
             upper_threshold=FloatFormatValidator.validate(
                 "upper_threshold", upper_threshold_str
             )
-            or 30,
+            or DEFAULT_UPPER_THRESHOLD,
             lower_threshold=FloatFormatValidator.validate(
                 "lower_threshold", lower_threshold_str
             )
-            or 0,
+            or DEFAULT_LOWER_THRESHOLD,
+            fields=ValidatorService.validate_fields(fields_str, stats_fields),
         )
+
+    @staticmethod
+    def validate_batch_params(
+        queries: Any, max_queries: int | None = None
+    ) -> list[StatsQuery]:
+        MandatoryValidator.validate("queries", queries)
+        if not isinstance(queries, list):
+            raise ValidationError(attr="queries", value=str(queries))
+
+        RangeValidator.validate("queries", len(queries), lower=1, upper=max_queries)
+
+        stats_queries = []
+        for index, query in enumerate(queries):
+            if not isinstance(query, dict):
+                raise ValidationError(attr=f"queries[{index}]", value=str(query))
+
+            params = {
+                name: str(value) if value is not None else None
+                for name, value in query.items()
+            }
+            try:
+                stats_queries.append(
+                    ValidatorService.validate_params(
+                        city_name=params.get("city"),
+                        start_date_str=params.get("start_date"),
+                        end_date_str=params.get("end_date"),
+                        latitude_str=params.get("latitude"),
+                        longitude_str=params.get("longitude"),
+                        upper_threshold_str=params.get("upper_threshold"),
+                        lower_threshold_str=params.get("lower_threshold"),
+                        fields_str=params.get("fields"),
+                    )
+                )
+            except ValidationError as error:
+                raise ValidationError(f"queries[{index}]: {error}")
+
+        return stats_queries
+
+    @staticmethod
+    def validate_daily_format(daily_format: str | None) -> str:
+        if daily_format is None:
+            return MAP_DAILY_FORMAT
+
+        ChoiceValidator.validate("daily_format", daily_format, DAILY_FORMATS)
+
+        return daily_format
+
+    @staticmethod
+    def validate_fields(
+        fields_str: str | None, stats_fields: list[str] = STATS_FIELDS
+    ) -> frozenset[str]:
+        if fields_str is None:
+            return ALL_STATS_FIELDS
+
+        fields = [field.strip() for field in fields_str.split(",")]
+        for field in fields:
+            ChoiceValidator.validate("fields", field, stats_fields)
+
+        return frozenset(fields)
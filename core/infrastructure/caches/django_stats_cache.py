@@ -0,0 +1,25 @@
+import hashlib
+from typing import Any
+
+from django.core.cache import BaseCache
+
+from core.domain.caches.stats_cache import StatsCache
+
+STATS_CACHE_SCHEMA_VERSION = 1
+
+
+class DjangoStatsCache(StatsCache):
+    def __init__(self, cache: BaseCache):
+        self.__cache = cache
+
+    def get(self, key: str) -> Any | None:
+        return self.__cache.get(self.__hash(key))
+
+    def set(self, key: str, value: Any) -> None:
+        self.__cache.set(self.__hash(key), value)
+
+    def __hash(self, key: str) -> str:
+        return (
+            f"stats:v{STATS_CACHE_SCHEMA_VERSION}:"
+            f"{hashlib.sha256(key.encode()).hexdigest()}"
+        )
@@ -0,0 +1,67 @@
+from collections import OrderedDict
+from threading import Lock
+
+from core.domain.caches.weather_series_cache import WeatherSeriesCache
+from core.domain.services.weather_series_index import WeatherSeriesIndex
+
+
+class InMemoryWeatherSeriesCache(WeatherSeriesCache):
+    def __init__(self, max_bytes: int):
+        self.__max_bytes = max_bytes
+        self.__entries: OrderedDict[int, tuple[int, WeatherSeriesIndex]] = OrderedDict()
+        self.__nbytes = 0
+        self.__misses: dict[int, tuple[int, int]] = {}
+        self.__oversized: dict[int, int] = {}
+        self.__lock = Lock()
+
+    @property
+    def nbytes(self) -> int:
+        return self.__nbytes
+
+    def get(self, city_id: int, data_version: int) -> WeatherSeriesIndex | None:
+        with self.__lock:
+            entry = self.__entries.get(city_id)
+
+            if entry is None or entry[0] != data_version:
+                return None
+
+            self.__entries.move_to_end(city_id)
+            return entry[1]
+
+    def admit(self, city_id: int, data_version: int) -> bool:
+        with self.__lock:
+            if self.__oversized.get(city_id) == data_version:
+                return False
+
+            missed_data_version, misses = self.__misses.get(city_id, (data_version, 0))
+            misses = misses + 1 if missed_data_version == data_version else 1
+            self.__misses[city_id] = (data_version, misses)
+            return misses > 1
+
+    def set(
+        self, city_id: int, data_version: int, weather_series_index: WeatherSeriesIndex
+    ) -> None:
+        with self.__lock:
+            self.__misses.pop(city_id, None)
+            if weather_series_index.nbytes > self.__max_bytes:
+                self.__oversized[city_id] = data_version
+                return
+
+            self.__evict(city_id)
+            self.__entries[city_id] = (data_version, weather_series_index)
+            self.__nbytes += weather_series_index.nbytes
+
+            while self.__nbytes > self.__max_bytes:
+                self.__evict(next(iter(self.__entries)))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__nbytes = 0
+            self.__misses.clear()
+            self.__oversized.clear()
+
+    def __evict(self, city_id: int) -> None:
+        entry = self.__entries.pop(city_id, None)
+        if entry is not None:
+            self.__nbytes -= entry[1].nbytes
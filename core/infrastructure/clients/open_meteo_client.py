@@ -1,20 +1,33 @@
+from contextlib import nullcontext
+from typing import ContextManager
+
 import requests
 import pandas as pd
 from core.domain.clients.meteo_client import MeteoClient
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
 from core.domain.models.city import City
 from core.domain.models.weather_data import WeatherData
 
 
 class OpenMeteoClient(MeteoClient):
-    def __init__(self, city_endpoint_url: str, weather_endpoint_url: str):
+    def __init__(
+        self,
+        city_endpoint_url: str,
+        weather_endpoint_url: str,
+        performance_recorder: PerformanceRecorder | None = None,
+    ):
         self.__city_endpoint_url = city_endpoint_url
         self.__weather_endpoint_url = weather_endpoint_url
+        self.__performance_recorder = performance_recorder
 
     def get_cities_by_name(self, city_name: str) -> list[City]:
-        response = requests.get(self.__city_endpoint_url, params={"name": city_name})
+        with self.__measure("meteo"):
+            response = requests.get(
+                self.__city_endpoint_url, params={"name": city_name}
+            )
+            response.raise_for_status()
 
         cities = []
-        response.raise_for_status()
         response_json = response.json()
         for city_json in response_json.get("results", []):
             cities.append(
@@ -30,21 +43,29 @@ class OpenMeteoClient(MeteoClient):
     def get_weather_data_by_city(
         self, city: City, start_date: str, end_date: str
     ) -> list[WeatherData]:
-        response = requests.get(
-            self.__weather_endpoint_url,
-            params={
-                "latitude": city.latitude,
-                "longitude": city.longitude,
-                "start_date": start_date,
-                "end_date": end_date,
-                "hourly": "precipitation,temperature_2m",
-            },
-        )
+        with self.__measure("meteo"):
+            response = requests.get(
+                self.__weather_endpoint_url,
+                params={
+                    "latitude": city.latitude,
+                    "longitude": city.longitude,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "hourly": "precipitation,temperature_2m",
+                },
+            )
+            response.raise_for_status()
 
-        response.raise_for_status()
         response_json = response.json()
 
-        timezone = response_json.get("timezone", "GMT")
+        with self.__measure("dataframe"):
+            return self.__to_weather_data(
+                city, response_json.get("timezone", "GMT"), response_json
+            )
+
+    def __to_weather_data(
+        self, city: City, timezone: str, response_json: dict
+    ) -> list[WeatherData]:
         response_dataframe = pd.DataFrame.from_dict(response_json.get("hourly", {}))
         if response_dataframe.empty:
             return []
@@ -64,3 +85,9 @@ class OpenMeteoClient(MeteoClient):
             ),
             axis=1,
         ).to_list()
+
+    def __measure(self, metric: str) -> ContextManager[None]:
+        if self.__performance_recorder is None:
+            return nullcontext()
+
+        return self.__performance_recorder.measure(metric)
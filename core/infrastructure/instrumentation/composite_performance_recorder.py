@@ -0,0 +1,20 @@
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+
+
+class CompositePerformanceRecorder(PerformanceRecorder):
+    def __init__(self, performance_recorders: list[PerformanceRecorder]):
+        self.__performance_recorders = performance_recorders
+
+    @contextmanager
+    def measure(self, metric: str) -> Iterator[None]:
+        with ExitStack() as exit_stack:
+            for performance_recorder in self.__performance_recorders:
+                exit_stack.enter_context(performance_recorder.measure(metric))
+            yield
+
+    def count(self, metric: str, value: int = 1) -> None:
+        for performance_recorder in self.__performance_recorders:
+            performance_recorder.count(metric, value)
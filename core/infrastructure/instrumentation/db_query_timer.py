@@ -0,0 +1,20 @@
+from typing import Any, Callable
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+
+
+class DbQueryTimer:
+    def __init__(self, performance_recorder: PerformanceRecorder):
+        self.__performance_recorder = performance_recorder
+
+    def __call__(
+        self,
+        execute: Callable[..., Any],
+        sql: str,
+        params: Any,
+        many: bool,
+        context: dict,
+    ) -> Any:
+        self.__performance_recorder.count("db_queries")
+        with self.__performance_recorder.measure("db"):
+            return execute(sql, params, many, context)
@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+from prometheus_client import Counter, Histogram
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+
+
+class PrometheusPerformanceRecorder(PerformanceRecorder):
+    __operation_duration_seconds = Histogram(
+        "meteoanalyzer_operation_duration_seconds",
+        "Duration of the instrumented operations.",
+        ["operation"],
+    )
+    __operation_errors = Counter(
+        "meteoanalyzer_operation_errors",
+        "Instrumented operations that raised an error.",
+        ["operation"],
+    )
+    __events = Counter(
+        "meteoanalyzer_events",
+        "Instrumented events such as rows read, rows ingested or cache hits.",
+        ["event"],
+    )
+
+    @contextmanager
+    def measure(self, metric: str) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        except Exception:
+            PrometheusPerformanceRecorder.__operation_errors.labels(metric).inc()
+            raise
+        finally:
+            PrometheusPerformanceRecorder.__operation_duration_seconds.labels(
+                metric
+            ).observe(perf_counter() - start)
+
+    def count(self, metric: str, value: int = 1) -> None:
+        PrometheusPerformanceRecorder.__events.labels(metric).inc(value)
@@ -0,0 +1,44 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+from core.infrastructure.instrumentation.request_timings import RequestTimings
+
+
+class RequestPerformanceRecorder(PerformanceRecorder):
+    def __init__(self):
+        self.__request_timings: ContextVar[RequestTimings | None] = ContextVar(
+            "request_timings", default=None
+        )
+
+    @contextmanager
+    def record(self) -> Iterator[RequestTimings]:
+        request_timings = RequestTimings()
+        token = self.__request_timings.set(request_timings)
+        try:
+            yield request_timings
+        finally:
+            self.__request_timings.reset(token)
+
+    def current(self) -> RequestTimings | None:
+        return self.__request_timings.get()
+
+    @contextmanager
+    def measure(self, metric: str) -> Iterator[None]:
+        request_timings = self.__request_timings.get()
+        if request_timings is None:
+            yield
+            return
+
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            request_timings.add_duration(metric, perf_counter() - start)
+
+    def count(self, metric: str, value: int = 1) -> None:
+        request_timings = self.__request_timings.get()
+        if request_timings is not None:
+            request_timings.add_count(metric, value)
@@ -0,0 +1,45 @@
+from collections import defaultdict
+from threading import Lock
+
+
+class RequestTimings:
+    def __init__(self):
+        self.__durations: dict[str, float] = defaultdict(float)
+        self.__counts: dict[str, int] = defaultdict(int)
+        self.__lock = Lock()
+
+    @property
+    def durations(self) -> dict[str, float]:
+        with self.__lock:
+            return dict(self.__durations)
+
+    @property
+    def counts(self) -> dict[str, int]:
+        with self.__lock:
+            return dict(self.__counts)
+
+    def add_duration(self, metric: str, seconds: float) -> None:
+        with self.__lock:
+            self.__durations[metric] += seconds
+
+    def add_count(self, metric: str, value: int) -> None:
+        with self.__lock:
+            self.__counts[metric] += value
+
+    def to_server_timing(self) -> str:
+        return ", ".join(
+            [
+                f"{metric};dur={seconds * 1000:.3f}"
+                for metric, seconds in self.durations.items()
+            ]
+            + [f'{metric};desc="{value}"' for metric, value in self.counts.items()]
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "durations_ms": {
+                metric: round(seconds * 1000, 3)
+                for metric, seconds in self.durations.items()
+            },
+            "counts": self.counts,
+        }
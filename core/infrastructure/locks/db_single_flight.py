@@ -0,0 +1,36 @@
+from hashlib import sha256
+from typing import Callable, TypeVar
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from core.domain.locks.single_flight import SingleFlight
+
+Result = TypeVar("Result")
+
+
+class DbSingleFlight(SingleFlight):
+    def __init__(self, single_flight: SingleFlight, using: str = DEFAULT_DB_ALIAS):
+        self.__single_flight = single_flight
+        self.__using = using
+
+    def run(self, key: str, function: Callable[[], Result]) -> Result:
+        return self.__single_flight.run(key, lambda: self.__run_locked(key, function))
+
+    def __run_locked(self, key: str, function: Callable[[], Result]) -> Result:
+        connection = connections[self.__using]
+
+        if connection.vendor != "postgresql":
+            return function()
+
+        lock_id = self.__get_lock_id(key)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(%s)", [lock_id])
+
+        try:
+            return function()
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [lock_id])
+
+    def __get_lock_id(self, key: str) -> int:
+        return int.from_bytes(sha256(key.encode()).digest()[:8], "big", signed=True)
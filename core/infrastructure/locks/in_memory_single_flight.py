@@ -0,0 +1,37 @@
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, TypeVar
+
+from core.domain.locks.single_flight import SingleFlight
+
+Result = TypeVar("Result")
+
+
+class InMemorySingleFlight(SingleFlight):
+    def __init__(self):
+        self.__futures: dict[str, Future] = {}
+        self.__lock = Lock()
+
+    def run(self, key: str, function: Callable[[], Result]) -> Result:
+        with self.__lock:
+            future = self.__futures.get(key)
+            is_leader = future is None
+
+            if is_leader:
+                future = Future()
+                self.__futures[key] = future
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__futures[key]
@@ -0,0 +1,87 @@
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Awaitable, Callable, ContextManager
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import Histogram
+
+from core.dependency_injection_factories.infrastructure.instrumentation.request_performance_recorder_factory import (
+    RequestPerformanceRecorderFactory,
+)
+from core.infrastructure.instrumentation.request_timings import RequestTimings
+from MeteoAnalyzer.settings import PROMETHEUS_METRICS_ENABLED
+
+
+class PrometheusMiddleware:
+    sync_capable = True
+    async_capable = True
+    __request_duration_seconds = Histogram(
+        "meteoanalyzer_request_duration_seconds",
+        "Duration of the requests by view.",
+        ["view", "method", "status"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    )
+    __request_db_rows = Histogram(
+        "meteoanalyzer_request_db_rows",
+        "Database rows read by each request.",
+        ["view"],
+        buckets=(0, 10, 100, 1000, 10000, 100000, 1000000, 10000000),
+    )
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ):
+        if not PROMETHEUS_METRICS_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.__request_performance_recorder = RequestPerformanceRecorderFactory.create()
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall(request)
+
+        with self.__record() as request_timings:
+            start = perf_counter()
+            response = self.get_response(request)
+            self.__observe(request, response, request_timings, perf_counter() - start)
+            return response
+
+    async def __acall(self, request: HttpRequest) -> HttpResponse:
+        with self.__record() as request_timings:
+            start = perf_counter()
+            response = await self.get_response(request)
+            self.__observe(request, response, request_timings, perf_counter() - start)
+            return response
+
+    def __record(self) -> ContextManager[RequestTimings]:
+        request_timings = self.__request_performance_recorder.current()
+        if request_timings is not None:
+            return nullcontext(request_timings)
+
+        return self.__request_performance_recorder.record()
+
+    def __observe(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        request_timings: RequestTimings,
+        seconds: float,
+    ) -> None:
+        if request.resolver_match is None:
+            return
+
+        view = request.resolver_match.view_name
+        PrometheusMiddleware.__request_duration_seconds.labels(
+            view, request.method, response.status_code
+        ).observe(seconds)
+
+        PrometheusMiddleware.__request_db_rows.labels(view).observe(
+            request_timings.counts.get("rows", 0)
+        )
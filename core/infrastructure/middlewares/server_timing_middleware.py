@@ -0,0 +1,77 @@
+import logging
+from time import perf_counter
+from typing import Awaitable, Callable
+
+import orjson
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpRequest, HttpResponse
+
+from core.dependency_injection_factories.infrastructure.instrumentation.request_performance_recorder_factory import (
+    RequestPerformanceRecorderFactory,
+)
+from core.infrastructure.instrumentation.request_timings import RequestTimings
+from MeteoAnalyzer.settings import SERVER_TIMING_ENABLED, SERVER_TIMING_LOG
+
+logger = logging.getLogger("core.performance")
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(
+        self,
+        get_response: Callable[[HttpRequest], HttpResponse | Awaitable[HttpResponse]],
+    ):
+        if not SERVER_TIMING_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+        self.__request_performance_recorder = RequestPerformanceRecorderFactory.create()
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse | Awaitable[HttpResponse]:
+        if iscoroutinefunction(self):
+            return self.__acall(request)
+
+        with self.__request_performance_recorder.record() as request_timings:
+            start = perf_counter()
+            response = self.get_response(request)
+            return self.__add_server_timing(
+                request, response, request_timings, perf_counter() - start
+            )
+
+    async def __acall(self, request: HttpRequest) -> HttpResponse:
+        with self.__request_performance_recorder.record() as request_timings:
+            start = perf_counter()
+            response = await self.get_response(request)
+            return self.__add_server_timing(
+                request, response, request_timings, perf_counter() - start
+            )
+
+    def __add_server_timing(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+        request_timings: RequestTimings,
+        seconds: float,
+    ) -> HttpResponse:
+        request_timings.add_duration("total", seconds)
+        response["Server-Timing"] = request_timings.to_server_timing()
+
+        if SERVER_TIMING_LOG:
+            logger.info(
+                orjson.dumps(
+                    {
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        **request_timings.to_dict(),
+                    }
+                ).decode()
+            )
+
+        return response
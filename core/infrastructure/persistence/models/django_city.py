@@ -13,6 +13,8 @@ class DjangoCity(models.Model):
     longitude = models.FloatField(
         validators=[MinValueValidator(-180.0), MaxValueValidator(180.0)]
     )
+    data_version = models.PositiveIntegerField(default=0)
+    data_updated_at = models.DateTimeField(null=True)
 
     class Meta:
         db_table = "cities"
@@ -33,5 +35,10 @@ class DjangoCity(models.Model):
 
     def to_domain(self) -> City:
         return City(
-            id=self.id, name=self.name, latitude=self.latitude, longitude=self.longitude
+            id=self.id,
+            name=self.name,
+            latitude=self.latitude,
+            longitude=self.longitude,
+            data_version=self.data_version,
+            data_updated_at=self.data_updated_at,
         )
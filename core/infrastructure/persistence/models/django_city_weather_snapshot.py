@@ -0,0 +1,132 @@
+from __future__ import annotations
+from datetime import date, datetime, timezone
+
+import numpy as np
+from django.db import models
+
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
+from core.domain.models.city_weather_stats import CityWeatherStats
+from core.infrastructure.persistence.models.django_city import DjangoCity
+
+DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M"
+
+
+class DjangoCityWeatherSnapshot(models.Model):
+    city = models.OneToOneField(
+        DjangoCity,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="weather_snapshot",
+    )
+    data_version = models.PositiveIntegerField()
+    start_date = models.DateField(null=True, blank=True)
+    end_date = models.DateField(null=True, blank=True)
+    temperature_average = models.FloatField(null=True, blank=True)
+    precipitation_total = models.FloatField(null=True, blank=True)
+    days_with_precipitation = models.IntegerField(null=True, blank=True)
+    precipitation_max = models.FloatField(null=True, blank=True)
+    precipitation_max_date_time = models.DateTimeField(null=True, blank=True)
+    temperature_max = models.FloatField(null=True, blank=True)
+    temperature_max_date_time = models.DateTimeField(null=True, blank=True)
+    temperature_min = models.FloatField(null=True, blank=True)
+    temperature_min_date_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "city_weather_snapshots"
+        verbose_name = "city weather snapshot"
+        verbose_name_plural = "city weather snapshots"
+
+    @staticmethod
+    def from_domain(
+        city_weather_snapshot: CityWeatherSnapshot,
+    ) -> DjangoCityWeatherSnapshot:
+        city_weather_stats = city_weather_snapshot.city_weather_stats
+
+        if city_weather_stats is None:
+            return DjangoCityWeatherSnapshot(
+                city_id=city_weather_snapshot.city_id,
+                data_version=city_weather_snapshot.data_version,
+            )
+
+        return DjangoCityWeatherSnapshot(
+            city_id=city_weather_snapshot.city_id,
+            data_version=city_weather_snapshot.data_version,
+            start_date=date.fromisoformat(city_weather_stats.start_date),
+            end_date=date.fromisoformat(city_weather_stats.end_date),
+            temperature_average=DjangoCityWeatherSnapshot.__to_float(
+                city_weather_stats.temperature_average
+            ),
+            precipitation_total=city_weather_stats.precipitation_total,
+            days_with_precipitation=city_weather_stats.days_with_precipitation,
+            precipitation_max=city_weather_stats.precipitation_max["precipitation"],
+            precipitation_max_date_time=DjangoCityWeatherSnapshot.__to_date_time(
+                city_weather_stats.precipitation_max["date_time"]
+            ),
+            temperature_max=city_weather_stats.temperature_max["temperature"],
+            temperature_max_date_time=DjangoCityWeatherSnapshot.__to_date_time(
+                city_weather_stats.temperature_max["date_time"]
+            ),
+            temperature_min=city_weather_stats.temperature_min["temperature"],
+            temperature_min_date_time=DjangoCityWeatherSnapshot.__to_date_time(
+                city_weather_stats.temperature_min["date_time"]
+            ),
+        )
+
+    def to_domain(self) -> CityWeatherSnapshot:
+        if self.start_date is None:
+            return CityWeatherSnapshot(
+                city_id=self.city_id,
+                data_version=self.data_version,
+                city_weather_stats=None,
+            )
+
+        return CityWeatherSnapshot(
+            city_id=self.city_id,
+            data_version=self.data_version,
+            city_weather_stats=CityWeatherStats(
+                latitude=self.city.latitude,
+                longitude=self.city.longitude,
+                start_date=self.start_date.isoformat(),
+                end_date=self.end_date.isoformat(),
+                temperature_average=(
+                    np.nan
+                    if self.temperature_average is None
+                    else self.temperature_average
+                ),
+                precipitation_total=self.precipitation_total,
+                days_with_precipitation=self.days_with_precipitation,
+                precipitation_max={
+                    "date_time": self.__format_date_time(
+                        self.precipitation_max_date_time
+                    ),
+                    "precipitation": self.precipitation_max,
+                },
+                temperature_max={
+                    "date_time": self.__format_date_time(
+                        self.temperature_max_date_time
+                    ),
+                    "temperature": self.temperature_max,
+                },
+                temperature_min={
+                    "date_time": self.__format_date_time(
+                        self.temperature_min_date_time
+                    ),
+                    "temperature": self.temperature_min,
+                },
+            ),
+        )
+
+    @staticmethod
+    def __to_float(value: float) -> float | None:
+        return None if np.isnan(value) else float(value)
+
+    @staticmethod
+    def __to_date_time(value: str | None) -> datetime | None:
+        if value is None:
+            return None
+        return datetime.strptime(value, DATE_TIME_FORMAT).replace(tzinfo=timezone.utc)
+
+    def __format_date_time(self, value: datetime | None) -> str | None:
+        if value is None:
+            return None
+        return value.astimezone(timezone.utc).strftime(DATE_TIME_FORMAT)
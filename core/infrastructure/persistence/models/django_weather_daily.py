@@ -0,0 +1,25 @@
+from django.db import models
+
+from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_weather_rollup import (
+    DjangoWeatherRollup,
+)
+
+
+class DjangoWeatherDaily(DjangoWeatherRollup):
+    period_field_name = "day"
+
+    city = models.ForeignKey(
+        DjangoCity, on_delete=models.CASCADE, related_name="weather_daily"
+    )
+    day = models.DateField()
+
+    class Meta:
+        db_table = "weather_daily"
+        verbose_name = "weather daily rollup"
+        verbose_name_plural = "weather daily rollups"
+        ordering = ["day"]
+        unique_together = ("city", "day")
+        indexes = [
+            models.Index(fields=["city", "day"]),
+        ]
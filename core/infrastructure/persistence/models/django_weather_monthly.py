@@ -0,0 +1,25 @@
+from django.db import models
+
+from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_weather_rollup import (
+    DjangoWeatherRollup,
+)
+
+
+class DjangoWeatherMonthly(DjangoWeatherRollup):
+    period_field_name = "month"
+
+    city = models.ForeignKey(
+        DjangoCity, on_delete=models.CASCADE, related_name="weather_monthly"
+    )
+    month = models.DateField()
+
+    class Meta:
+        db_table = "weather_monthly"
+        verbose_name = "weather monthly rollup"
+        verbose_name_plural = "weather monthly rollups"
+        ordering = ["month"]
+        unique_together = ("city", "month")
+        indexes = [
+            models.Index(fields=["city", "month"]),
+        ]
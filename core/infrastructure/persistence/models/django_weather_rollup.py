@@ -0,0 +1,208 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+
+import numpy as np
+from django.db import models
+
+from core.domain.models.period_series_stats import PeriodSeriesStats
+from core.domain.models.period_weather_series_stats import PeriodWeatherSeriesStats
+
+
+class DjangoWeatherRollup(models.Model):
+    period_field_name = None
+
+    temperature_count = models.IntegerField(default=0)
+    temperature_sum = models.FloatField(default=0.0)
+    temperature_max = models.FloatField(null=True, blank=True)
+    temperature_max_date_time = models.DateTimeField(null=True, blank=True)
+    temperature_min = models.FloatField(null=True, blank=True)
+    temperature_min_date_time = models.DateTimeField(null=True, blank=True)
+    hours_above_threshold = models.IntegerField(default=0)
+    hours_below_threshold = models.IntegerField(default=0)
+    precipitation_count = models.IntegerField(default=0)
+    precipitation_sum = models.FloatField(default=0.0)
+    precipitation_max = models.FloatField(null=True, blank=True)
+    precipitation_max_date_time = models.DateTimeField(null=True, blank=True)
+    precipitation_min = models.FloatField(null=True, blank=True)
+    precipitation_min_date_time = models.DateTimeField(null=True, blank=True)
+    hours_with_precipitation = models.IntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_domain(
+        cls, city_id: int, period_weather_series_stats: PeriodWeatherSeriesStats
+    ) -> list[DjangoWeatherRollup]:
+        temperature = period_weather_series_stats.temperature
+        precipitation = period_weather_series_stats.precipitation
+
+        return [
+            cls(
+                city_id=city_id,
+                **{cls.period_field_name: period},
+                temperature_count=temperature_count,
+                temperature_sum=temperature_sum,
+                temperature_max=cls.__to_float(temperature_max),
+                temperature_max_date_time=cls.__to_date_time(temperature_max_date_time),
+                temperature_min=cls.__to_float(temperature_min),
+                temperature_min_date_time=cls.__to_date_time(temperature_min_date_time),
+                hours_above_threshold=hours_above_threshold,
+                hours_below_threshold=hours_below_threshold,
+                precipitation_count=precipitation_count,
+                precipitation_sum=precipitation_sum,
+                precipitation_max=cls.__to_float(precipitation_max),
+                precipitation_max_date_time=cls.__to_date_time(
+                    precipitation_max_date_time
+                ),
+                precipitation_min=cls.__to_float(precipitation_min),
+                precipitation_min_date_time=cls.__to_date_time(
+                    precipitation_min_date_time
+                ),
+                hours_with_precipitation=hours_with_precipitation,
+            )
+            for (
+                period,
+                temperature_count,
+                temperature_sum,
+                temperature_max,
+                temperature_max_date_time,
+                temperature_min,
+                temperature_min_date_time,
+                hours_above_threshold,
+                hours_below_threshold,
+                precipitation_count,
+                precipitation_sum,
+                precipitation_max,
+                precipitation_max_date_time,
+                precipitation_min,
+                precipitation_min_date_time,
+                hours_with_precipitation,
+            ) in zip(
+                temperature.periods.tolist(),
+                temperature.count.tolist(),
+                temperature.total.tolist(),
+                temperature.max.tolist(),
+                temperature.max_date_time.tolist(),
+                temperature.min.tolist(),
+                temperature.min_date_time.tolist(),
+                temperature.hours_above_threshold.tolist(),
+                temperature.hours_below_threshold.tolist(),
+                precipitation.count.tolist(),
+                precipitation.total.tolist(),
+                precipitation.max.tolist(),
+                precipitation.max_date_time.tolist(),
+                precipitation.min.tolist(),
+                precipitation.min_date_time.tolist(),
+                precipitation.hours_above_threshold.tolist(),
+            )
+        ]
+
+    @classmethod
+    def to_domain(
+        cls,
+        django_weather_rollup_list: list[DjangoWeatherRollup],
+    ) -> PeriodWeatherSeriesStats:
+        periods = np.array(
+            [
+                getattr(django_weather_rollup, cls.period_field_name)
+                for django_weather_rollup in django_weather_rollup_list
+            ],
+            dtype="datetime64[D]",
+        )
+
+        return PeriodWeatherSeriesStats(
+            temperature=PeriodSeriesStats(
+                periods=periods,
+                count=cls.__to_array(
+                    django_weather_rollup_list, "temperature_count", np.int64
+                ),
+                total=cls.__to_array(
+                    django_weather_rollup_list, "temperature_sum", np.float64
+                ),
+                max=cls.__to_array(
+                    django_weather_rollup_list, "temperature_max", np.float64
+                ),
+                max_date_time=cls.__to_date_time_array(
+                    django_weather_rollup_list, "temperature_max_date_time"
+                ),
+                min=cls.__to_array(
+                    django_weather_rollup_list, "temperature_min", np.float64
+                ),
+                min_date_time=cls.__to_date_time_array(
+                    django_weather_rollup_list, "temperature_min_date_time"
+                ),
+                hours_above_threshold=cls.__to_array(
+                    django_weather_rollup_list, "hours_above_threshold", np.int64
+                ),
+                hours_below_threshold=cls.__to_array(
+                    django_weather_rollup_list, "hours_below_threshold", np.int64
+                ),
+            ),
+            precipitation=PeriodSeriesStats(
+                periods=periods,
+                count=cls.__to_array(
+                    django_weather_rollup_list, "precipitation_count", np.int64
+                ),
+                total=cls.__to_array(
+                    django_weather_rollup_list, "precipitation_sum", np.float64
+                ),
+                max=cls.__to_array(
+                    django_weather_rollup_list, "precipitation_max", np.float64
+                ),
+                max_date_time=cls.__to_date_time_array(
+                    django_weather_rollup_list, "precipitation_max_date_time"
+                ),
+                min=cls.__to_array(
+                    django_weather_rollup_list, "precipitation_min", np.float64
+                ),
+                min_date_time=cls.__to_date_time_array(
+                    django_weather_rollup_list, "precipitation_min_date_time"
+                ),
+                hours_above_threshold=cls.__to_array(
+                    django_weather_rollup_list, "hours_with_precipitation", np.int64
+                ),
+                hours_below_threshold=np.zeros(len(periods), dtype=np.int64),
+            ),
+        )
+
+    @staticmethod
+    def __to_float(value: float) -> float | None:
+        return None if np.isnan(value) else value
+
+    @staticmethod
+    def __to_date_time(value: datetime | None) -> datetime | None:
+        return None if value is None else value.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    def __to_array(
+        django_weather_rollup_list: list[DjangoWeatherRollup],
+        field_name: str,
+        dtype: type,
+    ) -> np.ndarray:
+        return np.array(
+            [
+                getattr(django_weather_rollup, field_name)
+                for django_weather_rollup in django_weather_rollup_list
+            ],
+            dtype=dtype,
+        )
+
+    @staticmethod
+    def __to_date_time_array(
+        django_weather_rollup_list: list[DjangoWeatherRollup], field_name: str
+    ) -> np.ndarray:
+        return np.array(
+            [
+                (
+                    date_time.astimezone(timezone.utc).replace(tzinfo=None)
+                    if date_time is not None
+                    else None
+                )
+                for date_time in (
+                    getattr(django_weather_rollup, field_name)
+                    for django_weather_rollup in django_weather_rollup_list
+                )
+            ],
+            dtype="datetime64[us]",
+        )
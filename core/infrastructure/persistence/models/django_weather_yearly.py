@@ -0,0 +1,25 @@
+from django.db import models
+
+from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_weather_rollup import (
+    DjangoWeatherRollup,
+)
+
+
+class DjangoWeatherYearly(DjangoWeatherRollup):
+    period_field_name = "year"
+
+    city = models.ForeignKey(
+        DjangoCity, on_delete=models.CASCADE, related_name="weather_yearly"
+    )
+    year = models.DateField()
+
+    class Meta:
+        db_table = "weather_yearly"
+        verbose_name = "weather yearly rollup"
+        verbose_name_plural = "weather yearly rollups"
+        ordering = ["year"]
+        unique_together = ("city", "year")
+        indexes = [
+            models.Index(fields=["city", "year"]),
+        ]
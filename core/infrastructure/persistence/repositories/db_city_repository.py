@@ -45,3 +45,11 @@ class DbCityRepository(CityRepository):
         return [
             django_city.to_domain() for django_city in self.__django_city_manager.all()
         ]
+
+    def get_cities_page(self, after_id: int | None, limit: int) -> list[City]:
+        query_set = self.__django_city_manager.order_by("id")
+
+        if after_id is not None:
+            query_set = query_set.filter(id__gt=after_id)
+
+        return [django_city.to_domain() for django_city in query_set[:limit]]
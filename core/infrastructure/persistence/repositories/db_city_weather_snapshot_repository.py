@@ -0,0 +1,39 @@
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
+from core.domain.repositories.city_weather_snapshot_repository import (
+    CityWeatherSnapshotRepository,
+)
+from core.infrastructure.persistence.models.django_city_weather_snapshot import (
+    DjangoCityWeatherSnapshot,
+)
+
+
+class DbCityWeatherSnapshotRepository(CityWeatherSnapshotRepository):
+    def __init__(self):
+        self.__django_city_weather_snapshot_manager = DjangoCityWeatherSnapshot.objects
+
+    def bulk_save(self, city_weather_snapshots: list[CityWeatherSnapshot]) -> None:
+        self.__django_city_weather_snapshot_manager.bulk_create(
+            [
+                DjangoCityWeatherSnapshot.from_domain(city_weather_snapshot)
+                for city_weather_snapshot in city_weather_snapshots
+            ],
+            update_conflicts=True,
+            unique_fields=["city"],
+            update_fields=[
+                field.name
+                for field in DjangoCityWeatherSnapshot._meta.concrete_fields
+                if field.name != "city"
+            ],
+        )
+
+    def get_by_city_ids(self, city_ids: list[int]) -> dict[int, CityWeatherSnapshot]:
+        django_city_weather_snapshot_query_set = (
+            self.__django_city_weather_snapshot_manager.filter(
+                city_id__in=city_ids
+            ).select_related("city")
+        )
+
+        return {
+            django_city_weather_snapshot.city_id: django_city_weather_snapshot.to_domain()
+            for django_city_weather_snapshot in django_city_weather_snapshot_query_set
+        }
@@ -1,13 +1,68 @@
-from datetime import datetime
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import islice
+from typing import Any, ContextManager, Iterable, Iterator
 
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, OuterRef, Q, QuerySet, Subquery, Sum
+from django.db.models.functions import Now, TruncDate
+from django.utils.timezone import is_naive, make_aware
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+from core.domain.models.date_range_plan import DateRangePlan
+from core.domain.models.period_range import DAY_RESOLUTION, YEAR_RESOLUTION
+from core.domain.models.period_weather_series_stats import PeriodWeatherSeriesStats
+from core.domain.models.series_stats import SeriesStats
+from core.domain.models.stats_query import (
+    ALL_STATS_FIELDS,
+    AVERAGE_BY_DAY_FIELD,
+    DEFAULT_LOWER_THRESHOLD,
+    DEFAULT_UPPER_THRESHOLD,
+    MAX_FIELD,
+    MIN_FIELD,
+    TOTAL_BY_DAY_FIELD,
+)
 from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.models.weather_series_stats import WeatherSeriesStats
 from core.domain.repositories.weather_data_repository import WeatherDataRepository
+from core.domain.services.daily_weather_stats_accumulator import (
+    DailyWeatherStatsAccumulator,
+)
+from core.domain.services.date_range_planner import DateRangePlanner
+from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_weather_daily import (
+    DjangoWeatherDaily,
+)
 from core.infrastructure.persistence.models.django_weather_data import DjangoWeatherData
+from core.infrastructure.persistence.models.django_weather_monthly import (
+    DjangoWeatherMonthly,
+)
+from core.infrastructure.persistence.models.django_weather_rollup import (
+    DjangoWeatherRollup,
+)
+from core.infrastructure.persistence.models.django_weather_yearly import (
+    DjangoWeatherYearly,
+)
 
 
 class DbWeatherDataRepository(WeatherDataRepository):
-    def __init__(self):
+    def __init__(
+        self,
+        chunk_size: int = 10000,
+        performance_recorder: PerformanceRecorder | None = None,
+    ):
+        self.__chunk_size = chunk_size
+        self.__performance_recorder = performance_recorder
         self.__django_weather_data_manager = DjangoWeatherData.objects
+        self.__django_city_manager = DjangoCity.objects
+        self.__django_weather_rollup_models = [
+            DjangoWeatherDaily,
+            DjangoWeatherMonthly,
+            DjangoWeatherYearly,
+        ]
 
     def bulk_save(self, weather_data_list: list[WeatherData]) -> None:
         django_weather_data_list = [
@@ -15,9 +70,16 @@ class DbWeatherDataRepository(WeatherDataRepository):
             for weather_data in weather_data_list
         ]
 
-        self.__django_weather_data_manager.bulk_create(
-            django_weather_data_list, ignore_conflicts=True
-        )
+        with self.__measure("ingest"), transaction.atomic():
+            self.__django_weather_data_manager.bulk_create(
+                django_weather_data_list, ignore_conflicts=True
+            )
+            self.__refresh_rollups(weather_data_list)
+            self.__django_city_manager.filter(
+                id__in={weather_data.city_id for weather_data in weather_data_list}
+            ).update(data_version=F("data_version") + 1, data_updated_at=Now())
+
+        self.__count("ingested_rows", len(weather_data_list))
 
     def get_by_city_id_and_date_range(
         self, city_id: int, start_date: datetime, end_date: datetime
@@ -38,3 +100,528 @@ class DbWeatherDataRepository(WeatherDataRepository):
                 city_id=city_id
             )
         ]
+
+    def get_series_by_city_ids(self, city_ids: list[int]) -> dict[int, WeatherSeries]:
+        return self.__to_series_by_city_id(
+            self.__stream_rows(
+                self.__django_weather_data_manager.filter(city_id__in=city_ids)
+            )
+        )
+
+    def get_series_by_city_date_ranges(
+        self, date_ranges_by_city_id: dict[int, list[tuple[datetime, datetime]]]
+    ) -> dict[int, WeatherSeries]:
+        query = Q()
+        for city_id, date_ranges in date_ranges_by_city_id.items():
+            for start_date, end_date in date_ranges:
+                query |= Q(
+                    city_id=city_id, date_time__gte=start_date, date_time__lte=end_date
+                )
+
+        if not query:
+            return {}
+
+        return self.__to_series_by_city_id(
+            self.__stream_rows(self.__django_weather_data_manager.filter(query))
+        )
+
+    def get_stats_by_city_ids_and_date_range(
+        self,
+        city_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        upper_threshold: float,
+        lower_threshold: float,
+        fields: frozenset[str] = ALL_STATS_FIELDS,
+    ) -> dict[int, WeatherSeriesStats]:
+        if (
+            upper_threshold != DEFAULT_UPPER_THRESHOLD
+            or lower_threshold != DEFAULT_LOWER_THRESHOLD
+        ):
+            return self.__get_stats_from_hourly_data(
+                city_ids,
+                start_date,
+                end_date,
+                upper_threshold,
+                lower_threshold,
+                fields,
+            )
+
+        date_range_plan = DateRangePlanner.plan(
+            self.__to_utc(start_date), self.__to_utc(end_date), DAY_RESOLUTION
+        )
+        if len(date_range_plan.period_ranges) == 0:
+            return self.__get_stats_from_hourly_data(
+                city_ids,
+                start_date,
+                end_date,
+                DEFAULT_UPPER_THRESHOLD,
+                DEFAULT_LOWER_THRESHOLD,
+                fields,
+            )
+
+        return self.__get_stats_from_rollups(
+            {city_id: date_range_plan for city_id in city_ids}
+        )
+
+    def get_summary_stats_by_city_ids(
+        self, city_ids: list[int]
+    ) -> dict[int, WeatherSeriesStats]:
+        date_range_plans_by_city_id = {
+            extent["city_id"]: DateRangePlanner.plan(
+                self.__to_utc(extent["first_date_time"]),
+                self.__to_utc(extent["last_date_time"]),
+                YEAR_RESOLUTION,
+            )
+            for extent in self.__django_weather_data_manager.filter(
+                city_id__in=city_ids
+            )
+            .values("city_id")
+            .annotate(first_date_time=Min("date_time"), last_date_time=Max("date_time"))
+            .order_by()
+        }
+
+        if len(date_range_plans_by_city_id) == 0:
+            return {}
+
+        return self.__get_stats_from_rollups(date_range_plans_by_city_id)
+
+    def __get_stats_from_rollups(
+        self, date_range_plans_by_city_id: dict[int, DateRangePlan]
+    ) -> dict[int, WeatherSeriesStats]:
+        parts_by_city_id = defaultdict(list)
+
+        for django_weather_rollup_model in self.__django_weather_rollup_models:
+            period_field_name = django_weather_rollup_model.period_field_name
+            query = Q()
+            for city_id, date_range_plan in date_range_plans_by_city_id.items():
+                for period_range in date_range_plan.period_ranges:
+                    if period_range.resolution == period_field_name:
+                        query |= Q(
+                            city_id=city_id,
+                            **{
+                                f"{period_field_name}__gte": period_range.start,
+                                f"{period_field_name}__lt": period_range.end,
+                            },
+                        )
+
+            if not query:
+                continue
+
+            for city_id, django_weather_rollup_list in self.__group_by_city_id(
+                django_weather_rollup_model.objects.filter(query)
+            ).items():
+                parts_by_city_id[city_id].append(
+                    django_weather_rollup_model.to_domain(django_weather_rollup_list)
+                )
+
+        query = Q()
+        for city_id, date_range_plan in date_range_plans_by_city_id.items():
+            for date_time_range in date_range_plan.hourly_ranges:
+                query |= Q(
+                    city_id=city_id,
+                    date_time__gte=date_time_range.start,
+                    **{
+                        (
+                            "date_time__lte"
+                            if date_time_range.include_end
+                            else "date_time__lt"
+                        ): date_time_range.end
+                    },
+                )
+
+        if query:
+            for city_id, daily in self.__accumulate_daily_by_city_id(
+                self.__django_weather_data_manager.filter(query)
+            ).items():
+                parts_by_city_id[city_id].append(daily)
+
+        with self.__measure("aggregation"):
+            return {
+                city_id: PeriodWeatherSeriesStats.concatenate(
+                    parts_by_city_id[city_id]
+                ).to_weather_series_stats()
+                for city_id in date_range_plans_by_city_id
+                if city_id in parts_by_city_id
+            }
+
+    def __get_stats_from_hourly_data(
+        self,
+        city_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        upper_threshold: float,
+        lower_threshold: float,
+        fields: frozenset[str],
+    ) -> dict[int, WeatherSeriesStats]:
+        by_day = AVERAGE_BY_DAY_FIELD in fields or TOTAL_BY_DAY_FIELD in fields
+        query_set = self.__django_weather_data_manager.filter(
+            city_id__in=city_ids,
+            date_time__gte=start_date,
+            date_time__lte=end_date,
+        )
+        group_by = ["city_id"]
+        if by_day:
+            query_set = query_set.annotate(day=TruncDate("date_time"))
+            group_by.append("day")
+
+        rows_by_city_id = defaultdict(list)
+        for row in (
+            query_set.values(*group_by)
+            .annotate(
+                temperature_count=Count("temperature"),
+                temperature_sum=Sum("temperature"),
+                temperature_max=Max("temperature"),
+                temperature_min=Min("temperature"),
+                hours_above_threshold=Count(
+                    "id", filter=Q(temperature__gt=upper_threshold)
+                ),
+                hours_below_threshold=Count(
+                    "id", filter=Q(temperature__lt=lower_threshold)
+                ),
+                precipitation_count=Count("precipitation"),
+                precipitation_sum=Sum("precipitation"),
+                precipitation_max=Max("precipitation"),
+                precipitation_min=Min("precipitation"),
+                hours_with_precipitation=Count("id", filter=Q(precipitation__gt=0.0)),
+            )
+            .order_by(*group_by)
+        ):
+            rows_by_city_id[row["city_id"]].append(row)
+
+        self.__count("rows", sum(len(rows) for rows in rows_by_city_id.values()))
+        if len(rows_by_city_id) == 0:
+            return {}
+
+        extremes_by_city_id = self.__get_extreme_date_times(
+            list(rows_by_city_id.keys()), start_date, end_date, fields
+        )
+
+        return {
+            city_id: WeatherSeriesStats(
+                temperature=self.__build_series_stats(
+                    rows,
+                    by_day,
+                    "temperature",
+                    extremes_by_city_id[city_id].get("temperature_max_date_time"),
+                    extremes_by_city_id[city_id].get("temperature_min_date_time"),
+                    "hours_above_threshold",
+                    "hours_below_threshold",
+                ),
+                precipitation=self.__build_series_stats(
+                    rows,
+                    by_day,
+                    "precipitation",
+                    extremes_by_city_id[city_id].get("precipitation_max_date_time"),
+                    extremes_by_city_id[city_id].get("precipitation_min_date_time"),
+                    "hours_with_precipitation",
+                ),
+            )
+            for city_id, rows in rows_by_city_id.items()
+        }
+
+    def __refresh_rollups(self, weather_data_list: list[WeatherData]) -> None:
+        days_by_city_id = defaultdict(set)
+        for weather_data in weather_data_list:
+            days_by_city_id[weather_data.city_id].add(
+                self.__to_utc(weather_data.date_time).date()
+            )
+
+        if len(days_by_city_id) == 0:
+            return
+
+        query = Q()
+        for city_id, days in days_by_city_id.items():
+            query |= Q(
+                city_id=city_id,
+                date_time__gte=self.__start_of_day(min(days)),
+                date_time__lt=self.__start_of_day(max(days) + timedelta(days=1)),
+            )
+
+        self.__save_rollup(
+            DjangoWeatherDaily,
+            self.__accumulate_daily_by_city_id(
+                self.__django_weather_data_manager.filter(query)
+            ),
+        )
+        self.__save_rollup(
+            DjangoWeatherMonthly,
+            self.__resample_rollup(
+                DjangoWeatherDaily,
+                {
+                    city_id: (
+                        date(min(days).year, min(days).month, 1),
+                        (
+                            date(max(days).year, max(days).month, 28)
+                            + timedelta(days=4)
+                        ).replace(day=1),
+                    )
+                    for city_id, days in days_by_city_id.items()
+                },
+                "M",
+            ),
+        )
+        self.__save_rollup(
+            DjangoWeatherYearly,
+            self.__resample_rollup(
+                DjangoWeatherMonthly,
+                {
+                    city_id: (
+                        date(min(days).year, 1, 1),
+                        date(max(days).year + 1, 1, 1),
+                    )
+                    for city_id, days in days_by_city_id.items()
+                },
+                "Y",
+            ),
+        )
+
+    def __resample_rollup(
+        self,
+        django_weather_rollup_model: type[DjangoWeatherRollup],
+        bounds_by_city_id: dict[int, tuple[date, date]],
+        unit: str,
+    ) -> dict[int, PeriodWeatherSeriesStats]:
+        period_field_name = django_weather_rollup_model.period_field_name
+        query = Q()
+        for city_id, (start, end) in bounds_by_city_id.items():
+            query |= Q(
+                city_id=city_id,
+                **{f"{period_field_name}__gte": start, f"{period_field_name}__lt": end},
+            )
+
+        return {
+            city_id: django_weather_rollup_model.to_domain(
+                django_weather_rollup_list
+            ).resample(unit)
+            for city_id, django_weather_rollup_list in self.__group_by_city_id(
+                django_weather_rollup_model.objects.filter(query)
+            ).items()
+        }
+
+    def __save_rollup(
+        self,
+        django_weather_rollup_model: type[DjangoWeatherRollup],
+        period_weather_series_stats_by_city_id: dict[int, PeriodWeatherSeriesStats],
+    ) -> None:
+        django_weather_rollup_list = []
+        for (
+            city_id,
+            period_weather_series_stats,
+        ) in period_weather_series_stats_by_city_id.items():
+            django_weather_rollup_list += django_weather_rollup_model.from_domain(
+                city_id, period_weather_series_stats
+            )
+
+        period_field_name = django_weather_rollup_model.period_field_name
+        django_weather_rollup_model.objects.bulk_create(
+            django_weather_rollup_list,
+            update_conflicts=True,
+            unique_fields=["city", period_field_name],
+            update_fields=[
+                field.name
+                for field in django_weather_rollup_model._meta.concrete_fields
+                if field.name not in ("id", "city", period_field_name)
+            ],
+        )
+
+    def __accumulate_daily_by_city_id(
+        self, query_set: QuerySet
+    ) -> dict[int, PeriodWeatherSeriesStats]:
+        accumulators_by_city_id = defaultdict(DailyWeatherStatsAccumulator)
+        rows = self.__stream_rows(query_set)
+
+        while chunk := list(islice(rows, self.__chunk_size)):
+            for city_id, weather_series in self.__to_series_by_city_id(chunk).items():
+                with self.__measure("aggregation"):
+                    accumulators_by_city_id[city_id].add(weather_series)
+
+        with self.__measure("aggregation"):
+            return {
+                city_id: accumulator.result()
+                for city_id, accumulator in accumulators_by_city_id.items()
+            }
+
+    def __to_utc(self, date_time: datetime) -> datetime:
+        if is_naive(date_time):
+            date_time = make_aware(date_time)
+        return date_time.astimezone(timezone.utc)
+
+    def __start_of_day(self, day: date) -> datetime:
+        return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+    def __stream_rows(
+        self, query_set: QuerySet
+    ) -> Iterator[tuple[int, datetime, float | None, float | None]]:
+        return (
+            query_set.order_by("city_id", "date_time")
+            .values_list("city_id", "date_time", "temperature", "precipitation")
+            .iterator(chunk_size=self.__chunk_size)
+        )
+
+    def __to_series_by_city_id(
+        self, rows: Iterable[tuple[int, datetime, float | None, float | None]]
+    ) -> dict[int, WeatherSeries]:
+        with self.__measure("series"):
+            series_rows = np.fromiter(
+                (
+                    (
+                        city_id,
+                        date_time.replace(tzinfo=None),
+                        temperature,
+                        precipitation,
+                    )
+                    for city_id, date_time, temperature, precipitation in rows
+                ),
+                dtype=[
+                    ("city_id", np.int64),
+                    ("date_time", "datetime64[us]"),
+                    ("temperature", np.float64),
+                    ("precipitation", np.float64),
+                ],
+            )
+            starts = np.flatnonzero(np.diff(series_rows["city_id"], prepend=-1))
+            ends = np.append(starts[1:], len(series_rows))
+
+            weather_series_by_city_id = {
+                int(series_rows["city_id"][start]): WeatherSeries(
+                    date_times=np.ascontiguousarray(
+                        series_rows["date_time"][start:end]
+                    ),
+                    temperatures=np.ascontiguousarray(
+                        series_rows["temperature"][start:end]
+                    ),
+                    precipitations=np.ascontiguousarray(
+                        series_rows["precipitation"][start:end]
+                    ),
+                )
+                for start, end in zip(starts, ends)
+            }
+
+        self.__count("rows", len(series_rows))
+        return weather_series_by_city_id
+
+    def __group_by_city_id(
+        self, query_set: QuerySet
+    ) -> dict[int, list[DjangoWeatherRollup]]:
+        django_weather_rollup_by_city_id = defaultdict(list)
+        for django_weather_rollup in query_set:
+            django_weather_rollup_by_city_id[django_weather_rollup.city_id].append(
+                django_weather_rollup
+            )
+        self.__count(
+            "rows",
+            sum(
+                len(django_weather_rollup_list)
+                for django_weather_rollup_list in django_weather_rollup_by_city_id.values()
+            ),
+        )
+        return dict(django_weather_rollup_by_city_id)
+
+    def __measure(self, metric: str) -> ContextManager[None]:
+        if self.__performance_recorder is None:
+            return nullcontext()
+
+        return self.__performance_recorder.measure(metric)
+
+    def __count(self, metric: str, value: int) -> None:
+        if self.__performance_recorder is not None:
+            self.__performance_recorder.count(metric, value)
+
+    def __get_extreme_date_times(
+        self,
+        city_ids: list[int],
+        start_date: datetime,
+        end_date: datetime,
+        fields: frozenset[str],
+    ) -> dict[int, dict[str, datetime | None]]:
+        orders_by_name = {}
+        if MAX_FIELD in fields:
+            orders_by_name["temperature_max_date_time"] = "-temperature"
+            orders_by_name["precipitation_max_date_time"] = "-precipitation"
+        if MIN_FIELD in fields:
+            orders_by_name["temperature_min_date_time"] = "temperature"
+            orders_by_name["precipitation_min_date_time"] = "precipitation"
+
+        if len(orders_by_name) == 0:
+            return defaultdict(dict)
+
+        range_query_set = self.__django_weather_data_manager.filter(
+            city_id=OuterRef("id"), date_time__gte=start_date, date_time__lte=end_date
+        )
+
+        return {
+            extremes["id"]: extremes
+            for extremes in self.__django_city_manager.filter(id__in=city_ids)
+            .annotate(
+                **{
+                    name: self.__first_date_time(range_query_set, order)
+                    for name, order in orders_by_name.items()
+                }
+            )
+            .values("id", *orders_by_name)
+        }
+
+    def __first_date_time(self, query_set: QuerySet, order: str) -> Subquery:
+        column_name = order.lstrip("-")
+        return Subquery(
+            query_set.filter(**{f"{column_name}__isnull": False})
+            .order_by(order, "date_time")
+            .values("date_time")[:1]
+        )
+
+    def __build_series_stats(
+        self,
+        rows: list[dict[str, Any]],
+        by_day: bool,
+        column_name: str,
+        max_date_time: datetime | None,
+        min_date_time: datetime | None,
+        above_column_name: str,
+        below_column_name: str | None = None,
+    ) -> SeriesStats:
+        total_by_row = np.array(
+            [row[f"{column_name}_sum"] or 0.0 for row in rows], dtype=np.float64
+        )
+        count_by_row = np.array(
+            [row[f"{column_name}_count"] for row in rows], dtype=np.int64
+        )
+        maxima = [
+            row[f"{column_name}_max"]
+            for row in rows
+            if row[f"{column_name}_max"] is not None
+        ]
+        minima = [
+            row[f"{column_name}_min"]
+            for row in rows
+            if row[f"{column_name}_min"] is not None
+        ]
+
+        count = int(count_by_row.sum())
+        total = float(total_by_row.sum())
+
+        return SeriesStats(
+            count=count,
+            total=total,
+            average=total / count if count > 0 else np.nan,
+            max=max(maxima) if maxima else None,
+            max_date_time=self.__format_date_time(max_date_time),
+            min=min(minima) if minima else None,
+            min_date_time=self.__format_date_time(min_date_time),
+            days=np.array(
+                [row["day"] for row in rows] if by_day else [], dtype="datetime64[D]"
+            ),
+            total_by_day=total_by_row if by_day else np.empty(0, dtype=np.float64),
+            count_by_day=count_by_row if by_day else np.empty(0, dtype=np.int64),
+            hours_above_threshold=sum(row[above_column_name] for row in rows),
+            hours_below_threshold=(
+                sum(row[below_column_name] for row in rows)
+                if below_column_name is not None
+                else 0
+            ),
+        )
+
+    def __format_date_time(self, date_time: datetime | None) -> str | None:
+        if date_time is None:
+            return None
+        return date_time.strftime("%Y-%m-%dT%H:%M")
@@ -0,0 +1,110 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from inspect import iscoroutinefunction
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db import close_old_connections
+from django.http import HttpRequest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+
+from core.infrastructure.views.renderers.orjson_renderer import ORJSONRenderer
+from MeteoAnalyzer.settings import STATS_EXECUTOR_MAX_WORKERS
+
+Result = TypeVar("Result")
+
+
+class AsyncAPIView(APIView):
+    renderer_classes = [
+        ORJSONRenderer,
+        *(
+            renderer_class
+            for renderer_class in api_settings.DEFAULT_RENDERER_CLASSES
+            if renderer_class is not JSONRenderer
+        ),
+    ]
+    __executor = (
+        ThreadPoolExecutor(max_workers=STATS_EXECUTOR_MAX_WORKERS)
+        if STATS_EXECUTOR_MAX_WORKERS > 0
+        else None
+    )
+
+    async def dispatch(self, request: HttpRequest, *args, **kwargs) -> Response:
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def run_in_executor(
+        self, function: Callable[..., Result], *args, **kwargs
+    ) -> Result:
+        if AsyncAPIView.__executor is None:
+            return await sync_to_async(function)(*args, **kwargs)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            AsyncAPIView.__executor,
+            partial(
+                copy_context().run,
+                self.__run_with_own_connection,
+                function,
+                *args,
+                **kwargs,
+            ),
+        )
+
+    def stream(
+        self, iterator: Iterator[Result]
+    ) -> Iterator[Result] | AsyncIterator[Result]:
+        if isinstance(self.request._request, ASGIRequest):
+            return self.__iterate_in_executor(iterator)
+
+        return iterator
+
+    async def __iterate_in_executor(
+        self, iterator: Iterator[Result]
+    ) -> AsyncIterator[Result]:
+        exhausted = object()
+
+        while True:
+            item = await self.run_in_executor(next, iterator, exhausted)
+            if item is exhausted:
+                return
+
+            yield item
+
+    @staticmethod
+    def __run_with_own_connection(
+        function: Callable[..., Result], *args, **kwargs
+    ) -> Result:
+        close_old_connections()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            close_old_connections()
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+from hashlib import sha256
+from typing import Awaitable, Callable
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.request import Request
+
+from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
+    GetStatsQueryFactory,
+)
+from core.infrastructure.views.async_api_view import AsyncAPIView
+from MeteoAnalyzer.settings import STATS_ARCHIVE_LAG_DAYS, STATS_HISTORICAL_MAX_AGE
+
+
+def condition_on_watermark(
+    stats_name: str,
+) -> Callable[
+    [Callable[..., Awaitable[HttpResponseBase]]],
+    Callable[..., Awaitable[HttpResponseBase]],
+]:
+    def decorator(
+        func: Callable[..., Awaitable[HttpResponseBase]],
+    ) -> Callable[..., Awaitable[HttpResponseBase]]:
+        @wraps(func)
+        async def wrapper(
+            self: AsyncAPIView, request: Request, *args, **kwargs
+        ) -> HttpResponseBase:
+            stats_query = kwargs["stats_query"]
+            query = GetStatsQueryFactory.create()
+            kwargs["cities"] = await self.run_in_executor(query.get_cities, stats_query)
+            watermark = query.get_watermark(stats_name, stats_query, kwargs["cities"])
+            etag = quote_etag(
+                sha256(
+                    "|".join(
+                        [
+                            watermark.tag,
+                            kwargs.get("daily_format", ""),
+                            request.accepted_media_type or "",
+                        ]
+                    ).encode()
+                ).hexdigest()
+            )
+            last_modified = (
+                int(watermark.last_modified.timestamp())
+                if watermark.last_modified is not None
+                else None
+            )
+
+            response = get_conditional_response(
+                request, etag=etag, last_modified=last_modified
+            )
+            if response is None:
+                response = await func(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            archived_until = datetime.now(timezone.utc).date() - timedelta(
+                days=STATS_ARCHIVE_LAG_DAYS
+            )
+            if stats_query.end_date.date() < archived_until:
+                patch_cache_control(
+                    response, public=True, max_age=STATS_HISTORICAL_MAX_AGE
+                )
+            else:
+                patch_cache_control(response, no_cache=True)
+
+            return response
+
+        return wrapper
+
+    return decorator
@@ -1,22 +1,45 @@
-from django.http import HttpRequest
+from typing import Iterator
+
+from django.http import StreamingHttpResponse
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
+from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
     GetStatsQueryFactory,
 )
+from core.domain.models.city_weather_stats import CityWeatherStats
+from core.infrastructure.views.async_api_view import AsyncAPIView
 from core.infrastructure.views.openapi_schemas.all_weather_stats_schema import (
     GetAllWeatherStatsViewSchema,
 )
 from core.infrastructure.views.openapi_schemas.bad_request_error_schema import (
     BadRequestErrorSchema,
 )
+from core.infrastructure.views.openapi_schemas.query_parameters import (
+    CursorParam,
+    StreamParam,
+)
+from core.infrastructure.views.paginations.city_cursor_pagination import (
+    CityCursorPagination,
+)
+from core.infrastructure.views.renderers.ndjson_renderer import NDJSONRenderer
+from core.infrastructure.views.renderers.orjson_renderer import ORJSONRenderer
+from MeteoAnalyzer.settings import STATS_ALL_STREAM_CHUNK_SIZE
+
+
+class GetAllWeatherStatsView(AsyncAPIView):
+    renderer_classes = [*AsyncAPIView.renderer_classes, NDJSONRenderer]
+    pagination_class = CityCursorPagination
 
+    @property
+    def paginator(self) -> CityCursorPagination:
+        if not hasattr(self, "_paginator"):
+            self._paginator = self.pagination_class()
+        return self._paginator
 
-class GetAllWeatherStatsView(APIView):
     @swagger_auto_schema(
         tags=["statistics"],
         operation_summary="Obtener estadísticas generales para todas las ciudades en todas las fechas",
@@ -33,11 +56,46 @@ class GetAllWeatherStatsView(APIView):
             ),
             400: BadRequestErrorSchema,
         },
+        manual_parameters=[StreamParam, CursorParam],
     )
-    def get(self, _: HttpRequest) -> Response:
+    async def get(self, request: Request) -> Response | StreamingHttpResponse:
+        after_city_id = self.paginator.get_after_city_id(request)
+
         try:
             query = GetStatsQueryFactory.create()
-            response = query.execute_for_all()
+
+            if request.accepted_renderer.format == NDJSONRenderer.format:
+                return StreamingHttpResponse(
+                    self.stream(
+                        self.__iterate_ndjson(
+                            query.iterate_for_all(STATS_ALL_STREAM_CHUNK_SIZE)
+                        )
+                    ),
+                    content_type=NDJSONRenderer.media_type,
+                )
+
+            if request.GET.get("stream") == "true":
+                return StreamingHttpResponse(
+                    self.stream(
+                        self.__iterate_json(
+                            query.iterate_for_all(STATS_ALL_STREAM_CHUNK_SIZE)
+                        )
+                    ),
+                    content_type="application/json",
+                )
+
+            page_size = self.paginator.get_page_size()
+            if page_size is not None:
+                response = await self.run_in_executor(
+                    query.execute_for_all_page, after_city_id, page_size
+                )
+
+                return self.paginator.get_paginated_response(
+                    response.weather_stats_by_city.to_dict(),
+                    response.next_after_city_id,
+                )
+
+            response = await self.run_in_executor(query.execute_for_all)
 
             return Response(
                 response.weather_stats_by_city.to_dict(),
@@ -48,3 +106,34 @@ class GetAllWeatherStatsView(APIView):
                 {"error": "An unexpected error happened"},
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @staticmethod
+    def __iterate_ndjson(
+        all_city_weather_stats: Iterator[tuple[str, CityWeatherStats]],
+    ) -> Iterator[bytes]:
+        for city_name, city_weather_stats in all_city_weather_stats:
+            yield NDJSONRenderer.render_line(
+                {"city": city_name, **city_weather_stats.to_dict()}
+            )
+
+    @staticmethod
+    def __iterate_json(
+        all_city_weather_stats: Iterator[tuple[str, CityWeatherStats]],
+    ) -> Iterator[bytes]:
+        previous_city_name = None
+
+        yield b"{"
+        for city_name, city_weather_stats in all_city_weather_stats:
+            if city_name == previous_city_name:
+                yield b","
+            else:
+                if previous_city_name is not None:
+                    yield b"],"
+                yield ORJSONRenderer.dumps(city_name) + b":["
+                previous_city_name = city_name
+
+            yield ORJSONRenderer.dumps(city_weather_stats.to_dict())
+
+        if previous_city_name is not None:
+            yield b"]"
+        yield b"}"
@@ -0,0 +1,90 @@
+from django.http import HttpRequest
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
+    GetStatsQueryFactory,
+)
+from core.domain.models.city import City
+from core.domain.models.stats_query import StatsQuery
+from core.infrastructure.views.async_api_view import AsyncAPIView
+from core.infrastructure.views.conditions.condition_on_watermark import (
+    condition_on_watermark,
+)
+from core.infrastructure.views.openapi_schemas.bad_request_error_schema import (
+    BadRequestErrorSchema,
+)
+from core.infrastructure.views.openapi_schemas.combined_schema import (
+    GetCombinedViewSchema,
+)
+from core.infrastructure.views.openapi_schemas.query_parameters import (
+    CityNameParam,
+    StartDateParam,
+    EndDateParam,
+    UpperThresholdParam,
+    LowerThresholdParam,
+    CityLatitudeParam,
+    CityLongitudeParam,
+    DailyFormatParam,
+    FieldsParam,
+)
+from core.infrastructure.views.validations.validate_daily_format import (
+    validate_daily_format,
+)
+from core.infrastructure.views.validations.validate_stats_query import (
+    validate_stats_query,
+)
+
+
+class GetCombinedStatsView(AsyncAPIView):
+    @swagger_auto_schema(
+        tags=["statistics"],
+        operation_summary="Obtener estadísticas de temperatura y precipitaciones para ciudad en un rango de fechas",
+        operation_description="Este endpoint obtiene a la vez las estadísticas de temperatura y de precipitaciones de las"
+        " ciudades que encajen con la query hecha dado un rango de fechas, leyendo los datos una sola vez. Las "
+        "ciudades se obtendrán mediante el nombre. Aunque también se puede filtrar por otros parámetros adicionales",
+        responses={
+            200: openapi.Response(
+                description="Ok",
+                schema=openapi.Schema(
+                    type=openapi.TYPE_ARRAY, items=GetCombinedViewSchema
+                ),
+            ),
+            400: BadRequestErrorSchema,
+        },
+        manual_parameters=[
+            CityNameParam,
+            StartDateParam,
+            EndDateParam,
+            UpperThresholdParam,
+            LowerThresholdParam,
+            CityLatitudeParam,
+            CityLongitudeParam,
+            DailyFormatParam,
+            FieldsParam,
+        ],
+    )
+    @validate_stats_query()
+    @validate_daily_format
+    @condition_on_watermark("combined")
+    async def get(
+        self,
+        _: HttpRequest,
+        stats_query: StatsQuery,
+        daily_format: str,
+        cities: list[City],
+    ) -> Response:
+        query = GetStatsQueryFactory.create()
+        response = await self.run_in_executor(
+            query.execute_for_combined, stats_query, cities
+        )
+
+        return Response(
+            [
+                city_combined_stat.to_dict(daily_format, stats_query.fields)
+                for city_combined_stat in response.combined_stats_for_cities
+            ],
+            status.HTTP_200_OK,
+        )
@@ -0,0 +1,21 @@
+from django.http import HttpRequest, HttpResponse
+from django.views import View
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+from prometheus_client.exposition import choose_encoder
+
+from MeteoAnalyzer.settings import PROMETHEUS_MULTIPROC_DIR
+
+
+class GetMetricsView(View):
+    def get(self, request: HttpRequest) -> HttpResponse:
+        encoder, content_type = choose_encoder(request.headers.get("Accept", ""))
+
+        return HttpResponse(encoder(self.__get_registry()), content_type=content_type)
+
+    def __get_registry(self) -> CollectorRegistry:
+        if PROMETHEUS_MULTIPROC_DIR is None:
+            return REGISTRY
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=PROMETHEUS_MULTIPROC_DIR)
+        return registry
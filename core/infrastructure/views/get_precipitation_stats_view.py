@@ -3,12 +3,16 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
     GetStatsQueryFactory,
 )
-from core.domain.models.stats_query import StatsQuery
+from core.domain.models.city import City
+from core.domain.models.stats_query import PRECIPITATION_STATS_FIELDS, StatsQuery
+from core.infrastructure.views.async_api_view import AsyncAPIView
+from core.infrastructure.views.conditions.condition_on_watermark import (
+    condition_on_watermark,
+)
 from core.infrastructure.views.openapi_schemas.bad_request_error_schema import (
     BadRequestErrorSchema,
 )
@@ -21,13 +25,18 @@ from core.infrastructure.views.openapi_schemas.query_parameters import (
     EndDateParam,
     CityLatitudeParam,
     CityLongitudeParam,
+    DailyFormatParam,
+    FieldsParam,
+)
+from core.infrastructure.views.validations.validate_daily_format import (
+    validate_daily_format,
 )
 from core.infrastructure.views.validations.validate_stats_query import (
     validate_stats_query,
 )
 
 
-class GetPrecipitationStatsView(APIView):
+class GetPrecipitationStatsView(AsyncAPIView):
     @swagger_auto_schema(
         tags=["statistics"],
         operation_summary="Obtener estadísticas de precipitaciones para ciudad en un rango de fechas",
@@ -49,16 +58,28 @@ class GetPrecipitationStatsView(APIView):
             EndDateParam,
             CityLatitudeParam,
             CityLongitudeParam,
+            DailyFormatParam,
+            FieldsParam,
         ],
     )
-    @validate_stats_query
-    def get(self, _: HttpRequest, stats_query: StatsQuery) -> Response:
+    @validate_stats_query(PRECIPITATION_STATS_FIELDS)
+    @validate_daily_format
+    @condition_on_watermark("precipitation")
+    async def get(
+        self,
+        _: HttpRequest,
+        stats_query: StatsQuery,
+        daily_format: str,
+        cities: list[City],
+    ) -> Response:
         query = GetStatsQueryFactory.create()
-        response = query.execute_for_precipitation(stats_query)
+        response = await self.run_in_executor(
+            query.execute_for_precipitation, stats_query, cities
+        )
 
         return Response(
             [
-                city_precipitation_stat.to_dict()
+                city_precipitation_stat.to_dict(daily_format, stats_query.fields)
                 for city_precipitation_stat in response.precipitation_stats_for_cities
             ],
             status.HTTP_200_OK,
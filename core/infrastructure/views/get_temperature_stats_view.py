@@ -3,12 +3,16 @@ from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
     GetStatsQueryFactory,
 )
-from core.domain.models.stats_query import StatsQuery
+from core.domain.models.city import City
+from core.domain.models.stats_query import TEMPERATURE_STATS_FIELDS, StatsQuery
+from core.infrastructure.views.async_api_view import AsyncAPIView
+from core.infrastructure.views.conditions.condition_on_watermark import (
+    condition_on_watermark,
+)
 from core.infrastructure.views.openapi_schemas.bad_request_error_schema import (
     BadRequestErrorSchema,
 )
@@ -20,16 +24,21 @@ from core.infrastructure.views.openapi_schemas.query_parameters import (
     LowerThresholdParam,
     CityLatitudeParam,
     CityLongitudeParam,
+    DailyFormatParam,
+    FieldsParam,
 )
 from core.infrastructure.views.openapi_schemas.temperature_schema import (
     GetTemperatureViewSchema,
 )
+from core.infrastructure.views.validations.validate_daily_format import (
+    validate_daily_format,
+)
 from core.infrastructure.views.validations.validate_stats_query import (
     validate_stats_query,
 )
 
 
-class GetTemperatureStatsView(APIView):
+class GetTemperatureStatsView(AsyncAPIView):
     @swagger_auto_schema(
         tags=["statistics"],
         operation_summary="Obtener estadísticas de temperatura para ciudad en un rango de fechas",
@@ -53,16 +62,28 @@ class GetTemperatureStatsView(APIView):
             LowerThresholdParam,
             CityLatitudeParam,
             CityLongitudeParam,
+            DailyFormatParam,
+            FieldsParam,
         ],
     )
-    @validate_stats_query
-    def get(self, _: HttpRequest, stats_query: StatsQuery) -> Response:
+    @validate_stats_query(TEMPERATURE_STATS_FIELDS)
+    @validate_daily_format
+    @condition_on_watermark("temperature")
+    async def get(
+        self,
+        _: HttpRequest,
+        stats_query: StatsQuery,
+        daily_format: str,
+        cities: list[City],
+    ) -> Response:
         query = GetStatsQueryFactory.create()
-        response = query.execute_for_temperature(stats_query)
+        response = await self.run_in_executor(
+            query.execute_for_temperature, stats_query, cities
+        )
 
         return Response(
             [
-                city_temperature_stat.to_dict()
+                city_temperature_stat.to_dict(daily_format, stats_query.fields)
                 for city_temperature_stat in response.temperature_stats_for_cities
             ],
             status.HTTP_200_OK,
@@ -0,0 +1,32 @@
+from drf_yasg import openapi
+
+from core.infrastructure.views.openapi_schemas.combined_schema import (
+    GetCombinedViewSchema,
+)
+
+BatchStatsQuerySchema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["city", "start_date", "end_date"],
+    properties={
+        "city": openapi.Schema(type=openapi.TYPE_STRING, example="Madrid"),
+        "start_date": openapi.Schema(type=openapi.TYPE_STRING, example="2018-01-01"),
+        "end_date": openapi.Schema(type=openapi.TYPE_STRING, example="2018-12-31"),
+        "latitude": openapi.Schema(type=openapi.TYPE_NUMBER, example=40.42),
+        "longitude": openapi.Schema(type=openapi.TYPE_NUMBER, example=-3.70),
+        "upper_threshold": openapi.Schema(type=openapi.TYPE_NUMBER, example=30.0),
+        "lower_threshold": openapi.Schema(type=openapi.TYPE_NUMBER, example=0.0),
+    },
+)
+
+PostBatchStatsRequestSchema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    required=["queries"],
+    properties={
+        "queries": openapi.Schema(type=openapi.TYPE_ARRAY, items=BatchStatsQuerySchema),
+    },
+)
+
+PostBatchStatsViewSchema = openapi.Schema(
+    type=openapi.TYPE_ARRAY,
+    items=openapi.Schema(type=openapi.TYPE_ARRAY, items=GetCombinedViewSchema),
+)
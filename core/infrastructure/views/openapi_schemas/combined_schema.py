@@ -0,0 +1,18 @@
+from drf_yasg import openapi
+
+from core.infrastructure.views.openapi_schemas.precipitation_schema import (
+    PrecipitationSchema,
+)
+from core.infrastructure.views.openapi_schemas.temperature_schema import (
+    TemperatureSchema,
+)
+
+GetCombinedViewSchema = openapi.Schema(
+    type=openapi.TYPE_OBJECT,
+    properties={
+        "latitude": openapi.Schema(type=openapi.TYPE_NUMBER, example=-3.12),
+        "longitude": openapi.Schema(type=openapi.TYPE_NUMBER, example=-70.23),
+        "temperature": TemperatureSchema,
+        "precipitation": PrecipitationSchema,
+    },
+)
@@ -55,3 +55,36 @@ LowerThresholdParam = openapi.Parameter(
     type=openapi.TYPE_NUMBER,
     required=False,
 )
+
+StreamParam = openapi.Parameter(
+    "stream",
+    openapi.IN_QUERY,
+    description="Si es `true`, la respuesta se envía ciudad a ciudad a medida que se calcula. Con `Accept: application/x-ndjson` se envía siempre así, una ciudad por línea.",
+    type=openapi.TYPE_BOOLEAN,
+    required=False,
+)
+
+DailyFormatParam = openapi.Parameter(
+    "daily_format",
+    openapi.IN_QUERY,
+    description="Formato de las series diarias: `map` (por defecto, objeto con una clave por día) o `compact` (objeto con `start`, `step` y la lista `values`, con `null` en los días sin datos). También puede pedirse con `Accept: application/json; daily_format=compact`.",
+    type=openapi.TYPE_STRING,
+    enum=["map", "compact"],
+    required=False,
+)
+
+FieldsParam = openapi.Parameter(
+    "fields",
+    openapi.IN_QUERY,
+    description="Lista separada por comas de las métricas a calcular y devolver: average, average_by_day, total, total_by_day, max, min, hours_above_threshold, hours_below_threshold, days_with_precipitation. Cada endpoint solo admite las métricas que devuelve. Por defecto, todas.",
+    type=openapi.TYPE_STRING,
+    required=False,
+)
+
+CursorParam = openapi.Parameter(
+    "cursor",
+    openapi.IN_QUERY,
+    description="Cursor opaco de la página siguiente, tal y como aparece en el campo `next` de la respuesta paginada. Solo se usa si la paginación está activada con `PAGE_SIZE`.",
+    type=openapi.TYPE_STRING,
+    required=False,
+)
@@ -0,0 +1,58 @@
+from base64 import b64decode, b64encode
+from binascii import Error as BinasciiError
+from typing import Any
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class CityCursorPagination(BasePagination):
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.__request = None
+        self.__next_after_city_id = None
+
+    def get_page_size(self) -> int | None:
+        return api_settings.PAGE_SIZE
+
+    def get_after_city_id(self, request: Request) -> int | None:
+        self.__request = request
+
+        encoded_cursor = request.query_params.get(self.cursor_query_param)
+        if encoded_cursor is None:
+            return None
+
+        try:
+            after_city_id = int(b64decode(encoded_cursor.encode("ascii")).decode())
+        except (BinasciiError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if after_city_id < 0:
+            raise NotFound(self.invalid_cursor_message)
+
+        return after_city_id
+
+    def get_paginated_response(
+        self, data: Any, next_after_city_id: int | None = None
+    ) -> Response:
+        self.__next_after_city_id = next_after_city_id
+
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self) -> str | None:
+        if self.__next_after_city_id is None:
+            return None
+
+        url = self.__request.build_absolute_uri()
+        encoded_cursor = b64encode(str(self.__next_after_city_id).encode()).decode()
+
+        return replace_query_param(url, self.cursor_query_param, encoded_cursor)
+
+    def get_previous_link(self) -> str | None:
+        return None
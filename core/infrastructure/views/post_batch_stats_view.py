@@ -0,0 +1,61 @@
+from django.http import HttpRequest
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import status
+from rest_framework.response import Response
+
+from core.dependency_injection_factories.application.get_stats.get_stats_query_factory import (
+    GetStatsQueryFactory,
+)
+from core.domain.models.stats_query import StatsQuery
+from core.infrastructure.views.async_api_view import AsyncAPIView
+from core.infrastructure.views.openapi_schemas.bad_request_error_schema import (
+    BadRequestErrorSchema,
+)
+from core.infrastructure.views.openapi_schemas.batch_schema import (
+    PostBatchStatsRequestSchema,
+    PostBatchStatsViewSchema,
+)
+from core.infrastructure.views.openapi_schemas.query_parameters import DailyFormatParam
+from core.infrastructure.views.validations.validate_daily_format import (
+    validate_daily_format,
+)
+from core.infrastructure.views.validations.validate_stats_queries import (
+    validate_stats_queries,
+)
+
+
+class PostBatchStatsView(AsyncAPIView):
+    @swagger_auto_schema(
+        tags=["statistics"],
+        operation_summary="Obtener estadísticas de temperatura y precipitaciones para varias consultas",
+        operation_description="Este endpoint recibe una lista de consultas, cada una con su ciudad, rango de fechas y"
+        " umbrales, y devuelve en el mismo orden las estadísticas de temperatura y de precipitaciones de las ciudades "
+        "que encajen con cada una. Los datos de cada ciudad se leen una sola vez para todas las consultas",
+        request_body=PostBatchStatsRequestSchema,
+        responses={
+            200: openapi.Response(description="Ok", schema=PostBatchStatsViewSchema),
+            400: BadRequestErrorSchema,
+        },
+        manual_parameters=[DailyFormatParam],
+    )
+    @validate_stats_queries
+    @validate_daily_format
+    async def post(
+        self, _: HttpRequest, stats_queries: list[StatsQuery], daily_format: str
+    ) -> Response:
+        query = GetStatsQueryFactory.create()
+        response = await self.run_in_executor(query.execute_for_batch, stats_queries)
+
+        return Response(
+            [
+                [
+                    city_combined_stat.to_dict(daily_format, stats_query.fields)
+                    for city_combined_stat in combined_stats
+                ]
+                for stats_query, combined_stats in zip(
+                    stats_queries, response.combined_stats_for_queries
+                )
+            ],
+            status.HTTP_200_OK,
+        )
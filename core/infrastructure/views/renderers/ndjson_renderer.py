@@ -0,0 +1,32 @@
+from typing import Any
+
+from rest_framework.renderers import BaseRenderer
+
+from core.dependency_injection_factories.infrastructure.instrumentation.performance_recorder_factory import (
+    PerformanceRecorderFactory,
+)
+from core.infrastructure.views.renderers.orjson_renderer import ORJSONRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        lines = data if isinstance(data, list) else [data]
+
+        with PerformanceRecorderFactory.create().measure("serialization"):
+            return b"".join(self.render_line(line) for line in lines)
+
+    @staticmethod
+    def render_line(data: Any) -> bytes:
+        return ORJSONRenderer.dumps(data) + b"\n"
@@ -0,0 +1,31 @@
+from typing import Any
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+from core.dependency_injection_factories.infrastructure.instrumentation.performance_recorder_factory import (
+    PerformanceRecorderFactory,
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: str | None = None,
+        renderer_context: dict | None = None,
+    ) -> bytes:
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+
+        with PerformanceRecorderFactory.create().measure("serialization"):
+            return self.dumps(data, indent=bool(indent))
+
+    @staticmethod
+    def dumps(data: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
@@ -0,0 +1,31 @@
+from functools import wraps
+from typing import Awaitable, Callable
+
+from django.utils.http import parse_header_parameters
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.domain.exceptions.validation_error import ValidationError
+from core.domain.validators.validator_service import ValidatorService
+
+
+def validate_daily_format(
+    func: Callable[[APIView, Request, ...], Awaitable[Response]],
+) -> Callable[[APIView, Request, str, ...], Awaitable[Response]]:
+    @wraps(func)
+    async def wrapper(self, request: Request, *args, **kwargs) -> Response:
+        try:
+            _, media_type_params = parse_header_parameters(
+                request.accepted_media_type or ""
+            )
+            kwargs["daily_format"] = ValidatorService.validate_daily_format(
+                request.GET.get("daily_format") or media_type_params.get("daily_format")
+            )
+        except ValidationError as error:
+            return Response({"error": str(error)}, status.HTTP_400_BAD_REQUEST)
+
+        return await func(self, request, *args, **kwargs)
+
+    return wrapper
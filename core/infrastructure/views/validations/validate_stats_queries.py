@@ -0,0 +1,39 @@
+from functools import wraps
+from typing import Awaitable, Callable
+
+from django.http import HttpRequest
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from MeteoAnalyzer.settings import STATS_BATCH_MAX_QUERIES
+from core.domain.exceptions.validation_error import ValidationError
+from core.domain.validators.validator_service import ValidatorService
+
+
+def validate_stats_queries(
+    func: Callable[[APIView, HttpRequest, ...], Awaitable[Response]],
+) -> Callable[[APIView, HttpRequest, dict, ...], Awaitable[Response]]:
+    @wraps(func)
+    async def wrapper(self, request: HttpRequest, *args, **kwargs) -> Response:
+        try:
+            kwargs["stats_queries"] = ValidatorService.validate_batch_params(
+                queries=(
+                    request.data.get("queries")
+                    if isinstance(request.data, dict)
+                    else None
+                ),
+                max_queries=STATS_BATCH_MAX_QUERIES,
+            )
+
+            return await func(self, request, *args, **kwargs)
+        except (ValidationError, ParseError) as error:
+            return Response({"error": str(error)}, status.HTTP_400_BAD_REQUEST)
+        except Exception:
+            return Response(
+                {"error": "An unexpected error happened"},
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    return wrapper
@@ -1,5 +1,5 @@
 from functools import wraps
-from typing import Callable
+from typing import Awaitable, Callable
 
 from django.http import HttpRequest
 from rest_framework import status
@@ -7,34 +7,43 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.domain.exceptions.validation_error import ValidationError
+from core.domain.models.stats_query import STATS_FIELDS
 from core.domain.validators.validator_service import ValidatorService
 
 
 def validate_stats_query(
-    func: Callable[[APIView, HttpRequest, ...], Response]
-) -> Callable[[APIView, HttpRequest, dict, ...], Response] | Response:
-    @wraps(func)
-    def wrapper(
-        self, request: HttpRequest, *args, **kwargs
-    ) -> Callable[[APIView, HttpRequest, dict, ...], Response] | Response:
-        try:
-            kwargs["stats_query"] = ValidatorService.validate_params(
-                city_name=request.GET.get("city"),
-                start_date_str=request.GET.get("start_date"),
-                end_date_str=request.GET.get("end_date"),
-                latitude_str=request.GET.get("latitude"),
-                longitude_str=request.GET.get("longitude"),
-                upper_threshold_str=request.GET.get("upper_threshold"),
-                lower_threshold_str=request.GET.get("lower_threshold"),
-            )
+    stats_fields: list[str] = STATS_FIELDS,
+) -> Callable[
+    [Callable[[APIView, HttpRequest, ...], Awaitable[Response]]],
+    Callable[[APIView, HttpRequest, dict, ...], Awaitable[Response]],
+]:
+    def decorator(
+        func: Callable[[APIView, HttpRequest, ...], Awaitable[Response]],
+    ) -> Callable[[APIView, HttpRequest, dict, ...], Awaitable[Response]]:
+        @wraps(func)
+        async def wrapper(self, request: HttpRequest, *args, **kwargs) -> Response:
+            try:
+                kwargs["stats_query"] = ValidatorService.validate_params(
+                    city_name=request.GET.get("city"),
+                    start_date_str=request.GET.get("start_date"),
+                    end_date_str=request.GET.get("end_date"),
+                    latitude_str=request.GET.get("latitude"),
+                    longitude_str=request.GET.get("longitude"),
+                    upper_threshold_str=request.GET.get("upper_threshold"),
+                    lower_threshold_str=request.GET.get("lower_threshold"),
+                    fields_str=request.GET.get("fields"),
+                    stats_fields=stats_fields,
+                )
 
-            return func(self, request, *args, **kwargs)
-        except ValidationError as error:
-            return Response({"error": str(error)}, status.HTTP_400_BAD_REQUEST)
-        except Exception:
-            return Response(
-                {"error": "An unexpected error happened"},
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+                return await func(self, request, *args, **kwargs)
+            except ValidationError as error:
+                return Response({"error": str(error)}, status.HTTP_400_BAD_REQUEST)
+            except Exception:
+                return Response(
+                    {"error": "An unexpected error happened"},
+                    status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
 
-    return wrapper
+        return wrapper
+
+    return decorator
@@ -0,0 +1,141 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:27
+
+from datetime import timezone
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+UPPER_THRESHOLD = 30.0
+LOWER_THRESHOLD = 0.0
+
+
+def backfill_weather_daily(apps, _) -> None:
+    weather_data_model = apps.get_model("core", "DjangoWeatherData")
+    weather_daily_model = apps.get_model("core", "DjangoWeatherDaily")
+
+    city_id, weather_daily_by_day = None, {}
+    for row_city_id, date_time, temperature, precipitation in (
+        weather_data_model.objects.order_by("city_id", "date_time")
+        .values_list("city_id", "date_time", "temperature", "precipitation")
+        .iterator(chunk_size=10000)
+    ):
+        if row_city_id != city_id:
+            weather_daily_model.objects.bulk_create(weather_daily_by_day.values())
+            city_id, weather_daily_by_day = row_city_id, {}
+
+        day = date_time.astimezone(timezone.utc).date()
+        weather_daily = weather_daily_by_day.get(day)
+        if weather_daily is None:
+            weather_daily = weather_daily_by_day[day] = weather_daily_model(
+                city_id=city_id, day=day
+            )
+
+        _add(weather_daily, "temperature", temperature, date_time)
+        _add(weather_daily, "precipitation", precipitation, date_time)
+        if temperature is not None and temperature > UPPER_THRESHOLD:
+            weather_daily.hours_above_threshold += 1
+        if temperature is not None and temperature < LOWER_THRESHOLD:
+            weather_daily.hours_below_threshold += 1
+        if precipitation is not None and precipitation > 0.0:
+            weather_daily.hours_with_precipitation += 1
+
+    weather_daily_model.objects.bulk_create(weather_daily_by_day.values())
+
+
+def _add(weather_daily, column_name, value, date_time) -> None:
+    if value is None:
+        return
+
+    setattr(
+        weather_daily,
+        f"{column_name}_count",
+        getattr(weather_daily, f"{column_name}_count") + 1,
+    )
+    setattr(
+        weather_daily,
+        f"{column_name}_sum",
+        getattr(weather_daily, f"{column_name}_sum") + value,
+    )
+
+    max_value = getattr(weather_daily, f"{column_name}_max")
+    if max_value is None or value > max_value:
+        setattr(weather_daily, f"{column_name}_max", value)
+        setattr(weather_daily, f"{column_name}_max_date_time", date_time)
+
+    min_value = getattr(weather_daily, f"{column_name}_min")
+    if min_value is None or value < min_value:
+        setattr(weather_daily, f"{column_name}_min", value)
+        setattr(weather_daily, f"{column_name}_min_date_time", date_time)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_alter_djangocity_unique_together"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoWeatherDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("temperature_count", models.IntegerField(default=0)),
+                ("temperature_sum", models.FloatField(default=0.0)),
+                ("temperature_max", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("temperature_min", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_above_threshold", models.IntegerField(default=0)),
+                ("hours_below_threshold", models.IntegerField(default=0)),
+                ("precipitation_count", models.IntegerField(default=0)),
+                ("precipitation_sum", models.FloatField(default=0.0)),
+                ("precipitation_max", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("precipitation_min", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_with_precipitation", models.IntegerField(default=0)),
+                (
+                    "city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weather_daily",
+                        to="core.djangocity",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "weather daily rollup",
+                "verbose_name_plural": "weather daily rollups",
+                "db_table": "weather_daily",
+                "ordering": ["day"],
+                "indexes": [
+                    models.Index(
+                        fields=["city", "day"], name="weather_dai_city_id_56ab57_idx"
+                    )
+                ],
+                "unique_together": {("city", "day")},
+            },
+        ),
+        migrations.RunPython(backfill_weather_daily, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,227 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SUM_FIELD_NAMES = (
+    "temperature_count",
+    "temperature_sum",
+    "hours_above_threshold",
+    "hours_below_threshold",
+    "precipitation_count",
+    "precipitation_sum",
+    "hours_with_precipitation",
+)
+COLUMN_NAMES = ("temperature", "precipitation")
+
+
+def backfill_weather_monthly_yearly(apps, _) -> None:
+    weather_daily_model = apps.get_model("core", "DjangoWeatherDaily")
+    weather_monthly_model = apps.get_model("core", "DjangoWeatherMonthly")
+    weather_yearly_model = apps.get_model("core", "DjangoWeatherYearly")
+
+    city_id, weather_monthly_by_month = None, {}
+    for weather_daily in weather_daily_model.objects.order_by(
+        "city_id", "day"
+    ).iterator(chunk_size=10000):
+        if weather_daily.city_id != city_id:
+            _save(weather_monthly_model, weather_yearly_model, weather_monthly_by_month)
+            city_id, weather_monthly_by_month = weather_daily.city_id, {}
+
+        month = weather_daily.day.replace(day=1)
+        weather_monthly = weather_monthly_by_month.get(month)
+        if weather_monthly is None:
+            weather_monthly = weather_monthly_by_month[month] = weather_monthly_model(
+                city_id=city_id, month=month
+            )
+        _add(weather_monthly, weather_daily)
+
+    _save(weather_monthly_model, weather_yearly_model, weather_monthly_by_month)
+
+
+def _save(
+    weather_monthly_model, weather_yearly_model, weather_monthly_by_month
+) -> None:
+    weather_yearly_by_year = {}
+    for month, weather_monthly in weather_monthly_by_month.items():
+        year = month.replace(month=1)
+        weather_yearly = weather_yearly_by_year.get(year)
+        if weather_yearly is None:
+            weather_yearly = weather_yearly_by_year[year] = weather_yearly_model(
+                city_id=weather_monthly.city_id, year=year
+            )
+        _add(weather_yearly, weather_monthly)
+
+    weather_monthly_model.objects.bulk_create(weather_monthly_by_month.values())
+    weather_yearly_model.objects.bulk_create(weather_yearly_by_year.values())
+
+
+def _add(target, source) -> None:
+    for field_name in SUM_FIELD_NAMES:
+        setattr(
+            target,
+            field_name,
+            getattr(target, field_name) + getattr(source, field_name),
+        )
+
+    for column_name in COLUMN_NAMES:
+        max_value = getattr(source, f"{column_name}_max")
+        target_max_value = getattr(target, f"{column_name}_max")
+        if max_value is not None and (
+            target_max_value is None or max_value > target_max_value
+        ):
+            setattr(target, f"{column_name}_max", max_value)
+            setattr(
+                target,
+                f"{column_name}_max_date_time",
+                getattr(source, f"{column_name}_max_date_time"),
+            )
+
+        min_value = getattr(source, f"{column_name}_min")
+        target_min_value = getattr(target, f"{column_name}_min")
+        if min_value is not None and (
+            target_min_value is None or min_value < target_min_value
+        ):
+            setattr(target, f"{column_name}_min", min_value)
+            setattr(
+                target,
+                f"{column_name}_min_date_time",
+                getattr(source, f"{column_name}_min_date_time"),
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_weather_daily"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoWeatherMonthly",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("temperature_count", models.IntegerField(default=0)),
+                ("temperature_sum", models.FloatField(default=0.0)),
+                ("temperature_max", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("temperature_min", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_above_threshold", models.IntegerField(default=0)),
+                ("hours_below_threshold", models.IntegerField(default=0)),
+                ("precipitation_count", models.IntegerField(default=0)),
+                ("precipitation_sum", models.FloatField(default=0.0)),
+                ("precipitation_max", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("precipitation_min", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_with_precipitation", models.IntegerField(default=0)),
+                ("month", models.DateField()),
+                (
+                    "city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weather_monthly",
+                        to="core.djangocity",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "weather monthly rollup",
+                "verbose_name_plural": "weather monthly rollups",
+                "db_table": "weather_monthly",
+                "ordering": ["month"],
+                "indexes": [
+                    models.Index(
+                        fields=["city", "month"], name="weather_mon_city_id_42b59f_idx"
+                    )
+                ],
+                "unique_together": {("city", "month")},
+            },
+        ),
+        migrations.CreateModel(
+            name="DjangoWeatherYearly",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("temperature_count", models.IntegerField(default=0)),
+                ("temperature_sum", models.FloatField(default=0.0)),
+                ("temperature_max", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("temperature_min", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_above_threshold", models.IntegerField(default=0)),
+                ("hours_below_threshold", models.IntegerField(default=0)),
+                ("precipitation_count", models.IntegerField(default=0)),
+                ("precipitation_sum", models.FloatField(default=0.0)),
+                ("precipitation_max", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("precipitation_min", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("hours_with_precipitation", models.IntegerField(default=0)),
+                ("year", models.DateField()),
+                (
+                    "city",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="weather_yearly",
+                        to="core.djangocity",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "weather yearly rollup",
+                "verbose_name_plural": "weather yearly rollups",
+                "db_table": "weather_yearly",
+                "ordering": ["year"],
+                "indexes": [
+                    models.Index(
+                        fields=["city", "year"], name="weather_yea_city_id_278a7b_idx"
+                    )
+                ],
+                "unique_together": {("city", "year")},
+            },
+        ),
+        migrations.RunPython(
+            backfill_weather_monthly_yearly, migrations.RunPython.noop
+        ),
+    ]
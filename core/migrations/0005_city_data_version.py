@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_weather_monthly_yearly"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="djangocity",
+            name="data_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
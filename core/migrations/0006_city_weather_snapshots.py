@@ -0,0 +1,55 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0005_city_data_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DjangoCityWeatherSnapshot",
+            fields=[
+                (
+                    "city",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="weather_snapshot",
+                        serialize=False,
+                        to="core.djangocity",
+                    ),
+                ),
+                ("data_version", models.PositiveIntegerField()),
+                ("start_date", models.DateField(blank=True, null=True)),
+                ("end_date", models.DateField(blank=True, null=True)),
+                ("temperature_average", models.FloatField(blank=True, null=True)),
+                ("precipitation_total", models.FloatField(blank=True, null=True)),
+                ("days_with_precipitation", models.IntegerField(blank=True, null=True)),
+                ("precipitation_max", models.FloatField(blank=True, null=True)),
+                (
+                    "precipitation_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("temperature_max", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_max_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+                ("temperature_min", models.FloatField(blank=True, null=True)),
+                (
+                    "temperature_min_date_time",
+                    models.DateTimeField(blank=True, null=True),
+                ),
+            ],
+            options={
+                "verbose_name": "city weather snapshot",
+                "verbose_name_plural": "city weather snapshots",
+                "db_table": "city_weather_snapshots",
+            },
+        ),
+    ]
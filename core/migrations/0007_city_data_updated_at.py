@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 14:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_city_weather_snapshots"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="djangocity",
+            name="data_updated_at",
+            field=models.DateTimeField(null=True),
+        ),
+    ]
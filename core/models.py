@@ -1,4 +1,16 @@
 from core.infrastructure.persistence.models.django_city import DjangoCity  # noqa: F401
+from core.infrastructure.persistence.models.django_city_weather_snapshot import (  # noqa: F401
+    DjangoCityWeatherSnapshot,
+)
+from core.infrastructure.persistence.models.django_weather_daily import (  # noqa: F401
+    DjangoWeatherDaily,
+)
 from core.infrastructure.persistence.models.django_weather_data import (  # noqa: F401
     DjangoWeatherData,
 )
+from core.infrastructure.persistence.models.django_weather_monthly import (  # noqa: F401
+    DjangoWeatherMonthly,
+)
+from core.infrastructure.persistence.models.django_weather_yearly import (  # noqa: F401
+    DjangoWeatherYearly,
+)
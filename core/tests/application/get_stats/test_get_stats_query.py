@@ -1,17 +1,48 @@
 from datetime import datetime
 from unittest import TestCase
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
+import numpy as np
+
+from core.application.get_stats.get_all_weather_stats_response import (
+    GetAllWeatherStatsResponse,
+)
+from core.application.get_stats.get_precipitation_stats_response import (
+    GetPrecipitationStatsResponse,
+)
 from core.application.get_stats.get_stats_query import GetStatsQuery
+from core.application.get_stats.get_temperature_stats_response import (
+    GetTemperatureStatsResponse,
+)
+from core.domain.caches.stats_cache import StatsCache
+from core.domain.caches.weather_series_cache import WeatherSeriesCache
+from core.domain.locks.single_flight import SingleFlight
+from core.domain.models.all_weather_stats_by_city import AllWeatherStatsByCity
 from core.domain.models.city import City
+from core.domain.models.city_combined_stats import CityCombinedStats
 from core.domain.models.city_precipitation_stats import CityPrecipitationStats
 from core.domain.models.city_temperature_stats import CityTemperatureStats
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
+from core.domain.models.city_weather_stats import CityWeatherStats
+from core.domain.models.daily_series import DailySeries
 from core.domain.models.precipitation_stats import PrecipitationStats
-from core.domain.models.stats_query import StatsQuery
+from core.domain.models.stats_query import (
+    ALL_STATS_FIELDS,
+    DEFAULT_LOWER_THRESHOLD,
+    DEFAULT_UPPER_THRESHOLD,
+    StatsQuery,
+)
 from core.domain.models.temperature_stats import TemperatureStats
 from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.models.weather_series_stats import WeatherSeriesStats
 from core.domain.repositories.city_repository import CityRepository
+from core.domain.repositories.city_weather_snapshot_repository import (
+    CityWeatherSnapshotRepository,
+)
 from core.domain.repositories.weather_data_repository import WeatherDataRepository
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
+from core.domain.services.weather_series_index import WeatherSeriesIndex
 
 
 class TestGetStatsQuery(TestCase):
@@ -72,11 +103,6 @@ class TestGetStatsQuery(TestCase):
             self.madrid_city_2,
             self.madrid_city_3,
         ]
-        self.weather_data_repository.get_by_city_id_and_date_range.side_effect = [
-            self.madrid_city_1_weather,
-            [],
-            self.madrid_city_3_weather,
-        ]
         stats_query = StatsQuery(
             "Madrid",
             datetime(2001, 1, 1, 0, 0, 0),
@@ -86,6 +112,18 @@ class TestGetStatsQuery(TestCase):
             20.0,
             -1.0,
         )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.return_value = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather,
+                stats_query.upper_threshold,
+                stats_query.lower_threshold,
+            ),
+            self.madrid_city_3.id: self.__to_weather_series_stats(
+                self.madrid_city_3_weather,
+                stats_query.upper_threshold,
+                stats_query.lower_threshold,
+            ),
+        }
 
         result = self.query.execute_for_temperature(stats_query)
 
@@ -97,7 +135,10 @@ class TestGetStatsQuery(TestCase):
                 longitude=1.0,
                 temperature_stats=TemperatureStats(
                     average=10.0,
-                    average_by_day={"2010-01-01": 10.0},
+                    average_by_day=DailySeries(
+                        np.array(["2010-01-01"], dtype="datetime64[D]"),
+                        np.array([10.0]),
+                    ),
                     max={"temperature": 12.0, "date_time": "2010-01-01T01:00"},
                     min={"temperature": 8.0, "date_time": "2010-01-01T02:00"},
                     hours_above_threshold=0,
@@ -112,7 +153,10 @@ class TestGetStatsQuery(TestCase):
                 longitude=3.0,
                 temperature_stats=TemperatureStats(
                     average=10.0,
-                    average_by_day={"2010-01-06": 10.0},
+                    average_by_day=DailySeries(
+                        np.array(["2010-01-06"], dtype="datetime64[D]"),
+                        np.array([10.0]),
+                    ),
                     max={"temperature": 15.0, "date_time": "2010-01-06T01:00"},
                     min={"temperature": 5.0, "date_time": "2010-01-06T00:00"},
                     hours_above_threshold=0,
@@ -124,18 +168,13 @@ class TestGetStatsQuery(TestCase):
         self.city_repository.get_cities_by_match.assert_called_once_with(
             "Madrid", None, None
         )
-        self.weather_data_repository.get_by_city_id_and_date_range.assert_has_calls(
-            [
-                call(
-                    self.madrid_city_1.id, stats_query.start_date, stats_query.end_date
-                ),
-                call(
-                    self.madrid_city_2.id, stats_query.start_date, stats_query.end_date
-                ),
-                call(
-                    self.madrid_city_3.id, stats_query.start_date, stats_query.end_date
-                ),
-            ]
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_called_once_with(
+            [self.madrid_city_1.id, self.madrid_city_2.id, self.madrid_city_3.id],
+            stats_query.start_date,
+            stats_query.end_date,
+            stats_query.upper_threshold,
+            stats_query.lower_threshold,
+            stats_query.fields,
         )
 
     def test_execute_for_precipitation(self) -> None:
@@ -143,10 +182,6 @@ class TestGetStatsQuery(TestCase):
             self.barcelona_city_1,
             self.barcelona_city_2,
         ]
-        self.weather_data_repository.get_by_city_id_and_date_range.side_effect = [
-            self.barcelona_city_1_weather,
-            self.barcelona_city_2_weather,
-        ]
         stats_query = StatsQuery(
             "Barcelona",
             datetime(2001, 1, 1, 0, 0, 0),
@@ -156,6 +191,18 @@ class TestGetStatsQuery(TestCase):
             30.0,
             0.0,
         )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.return_value = {
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather,
+                stats_query.upper_threshold,
+                stats_query.lower_threshold,
+            ),
+            self.barcelona_city_2.id: self.__to_weather_series_stats(
+                self.barcelona_city_2_weather,
+                stats_query.upper_threshold,
+                stats_query.lower_threshold,
+            ),
+        }
 
         result = self.query.execute_for_precipitation(stats_query)
 
@@ -167,7 +214,10 @@ class TestGetStatsQuery(TestCase):
                 precipitation_stats=PrecipitationStats(
                     average=0.1,
                     total=0.2,
-                    total_by_day={"2011-01-02": 0.2},
+                    total_by_day=DailySeries(
+                        np.array(["2011-01-02"], dtype="datetime64[D]"),
+                        np.array([0.2]),
+                    ),
                     days_with_precipitation=1,
                     max={"date_time": "2011-01-02T00:00", "precipitation": 0.2},
                 ),
@@ -181,7 +231,10 @@ class TestGetStatsQuery(TestCase):
                 precipitation_stats=PrecipitationStats(
                     average=0.5,
                     total=1.5,
-                    total_by_day={"2010-02-02": 0.5, "2011-02-02": 1.0},
+                    total_by_day=DailySeries(
+                        np.array(["2010-02-02", "2011-02-02"], dtype="datetime64[D]"),
+                        np.array([0.5, 1.0]),
+                    ),
                     days_with_precipitation=2,
                     max={"date_time": "2011-02-02T01:00", "precipitation": 1.0},
                 ),
@@ -191,29 +244,245 @@ class TestGetStatsQuery(TestCase):
         self.city_repository.get_cities_by_match.assert_called_once_with(
             "Barcelona", None, None
         )
-        self.weather_data_repository.get_by_city_id_and_date_range.assert_has_calls(
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_called_once_with(
+            [self.barcelona_city_1.id, self.barcelona_city_2.id],
+            stats_query.start_date,
+            stats_query.end_date,
+            stats_query.upper_threshold,
+            stats_query.lower_threshold,
+            stats_query.fields,
+        )
+
+    def test_execute_for_combined(self) -> None:
+        self.city_repository.get_cities_by_match.return_value = [
+            self.barcelona_city_1,
+        ]
+        stats_query = StatsQuery(
+            "Barcelona",
+            datetime(2001, 1, 1, 0, 0, 0),
+            datetime(2020, 1, 1, 0, 0, 0),
+            None,
+            None,
+            5.0,
+            1.0,
+        )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.return_value = {
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather,
+                stats_query.upper_threshold,
+                stats_query.lower_threshold,
+            ),
+        }
+
+        result = self.query.execute_for_combined(stats_query)
+
+        self.assertEqual(
             [
-                call(
-                    self.barcelona_city_1.id,
-                    stats_query.start_date,
-                    stats_query.end_date,
-                ),
-                call(
-                    self.barcelona_city_2.id,
-                    stats_query.start_date,
-                    stats_query.end_date,
+                CityCombinedStats(
+                    latitude=4.0,
+                    longitude=4.0,
+                    temperature_stats=TemperatureStats(
+                        average=5.0,
+                        average_by_day=DailySeries(
+                            np.array(["2011-01-02"], dtype="datetime64[D]"),
+                            np.array([5.0]),
+                        ),
+                        max={"temperature": 10.0, "date_time": "2011-01-02T01:00"},
+                        min={"temperature": 0.0, "date_time": "2011-01-02T00:00"},
+                        hours_above_threshold=1,
+                        hours_below_threshold=1,
+                    ),
+                    precipitation_stats=PrecipitationStats(
+                        average=0.1,
+                        total=0.2,
+                        total_by_day=DailySeries(
+                            np.array(["2011-01-02"], dtype="datetime64[D]"),
+                            np.array([0.2]),
+                        ),
+                        days_with_precipitation=1,
+                        max={"date_time": "2011-01-02T00:00", "precipitation": 0.2},
+                    ),
+                ).to_dict()
+            ],
+            [
+                city_combined_stats.to_dict()
+                for city_combined_stats in result.combined_stats_for_cities
+            ],
+        )
+        self.city_repository.get_cities_by_match.assert_called_once_with(
+            "Barcelona", None, None
+        )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_called_once_with(
+            [self.barcelona_city_1.id],
+            stats_query.start_date,
+            stats_query.end_date,
+            stats_query.upper_threshold,
+            stats_query.lower_threshold,
+            stats_query.fields,
+        )
+
+    def test_execute_for_batch(self) -> None:
+        self.city_repository.get_cities_by_match.side_effect = (
+            lambda city_name, latitude, longitude: {
+                "Madrid": [self.madrid_city_1, self.madrid_city_3],
+                "Barcelona": [self.barcelona_city_1],
+            }[city_name]
+        )
+        stats_queries = [
+            StatsQuery(
+                "Madrid",
+                datetime(2010, 1, 1, 0, 0, 0),
+                datetime(2010, 1, 2, 0, 0, 0),
+                None,
+                None,
+                11.0,
+                9.0,
+            ),
+            StatsQuery(
+                "Barcelona",
+                datetime(2011, 1, 1, 0, 0, 0),
+                datetime(2011, 1, 3, 0, 0, 0),
+                None,
+                None,
+                30.0,
+                0.0,
+            ),
+            StatsQuery(
+                "Madrid",
+                datetime(2010, 1, 6, 0, 0, 0),
+                datetime(2010, 1, 7, 0, 0, 0),
+                None,
+                None,
+                30.0,
+                0.0,
+            ),
+        ]
+        self.weather_data_repository.get_series_by_city_date_ranges.return_value = {
+            self.madrid_city_1.id: WeatherSeries.from_weather_data(
+                self.madrid_city_1_weather
+            ),
+            self.madrid_city_3.id: WeatherSeries.from_weather_data(
+                self.madrid_city_3_weather
+            ),
+            self.barcelona_city_1.id: WeatherSeries.from_weather_data(
+                self.barcelona_city_1_weather
+            ),
+        }
+
+        result = self.query.execute_for_batch(stats_queries)
+
+        self.assertEqual(
+            [[1.0], [4.0], [3.0]],
+            [
+                [city_combined_stats.latitude for city_combined_stats in combined_stats]
+                for combined_stats in result.combined_stats_for_queries
+            ],
+        )
+        self.assertEqual(
+            {
+                "average": 10.0,
+                "average_by_day": {"2010-01-01": 10.0},
+                "max": {"value": 12.0, "date": "2010-01-01T01:00"},
+                "min": {"value": 8.0, "date": "2010-01-01T02:00"},
+                "hours_above_threshold": 1,
+                "hours_below_threshold": 1,
+            },
+            result.combined_stats_for_queries[0][0].temperature_stats.to_dict(),
+        )
+        self.assertEqual(
+            {
+                "total": 0.2,
+                "total_by_day": {"2011-01-02": 0.2},
+                "days_with_precipitation": 1,
+                "max": {"value": 0.2, "date": "2011-01-02T00:00"},
+                "average": 0.1,
+            },
+            result.combined_stats_for_queries[1][0].precipitation_stats.to_dict(),
+        )
+        self.assertEqual(2, self.city_repository.get_cities_by_match.call_count)
+        madrid_date_ranges = [
+            (datetime(2010, 1, 1, 0, 0, 0), datetime(2010, 1, 2, 0, 0, 0)),
+            (datetime(2010, 1, 6, 0, 0, 0), datetime(2010, 1, 7, 0, 0, 0)),
+        ]
+        self.weather_data_repository.get_series_by_city_date_ranges.assert_called_once_with(
+            {
+                self.madrid_city_1.id: madrid_date_ranges,
+                self.madrid_city_3.id: madrid_date_ranges,
+                self.barcelona_city_1.id: [
+                    (datetime(2011, 1, 1, 0, 0, 0), datetime(2011, 1, 3, 0, 0, 0))
+                ],
+            }
+        )
+
+    def test_get_watermark(self) -> None:
+        stats_query = StatsQuery(
+            "Madrid",
+            datetime(2001, 1, 1, 0, 0, 0),
+            datetime(2020, 1, 1, 0, 0, 0),
+            None,
+            None,
+            30.0,
+            0.0,
+        )
+        updated_city = City(
+            "Madrid",
+            3.0,
+            3.0,
+            id=3,
+            data_version=1,
+            data_updated_at=datetime(2024, 5, 1, 0, 0, 0),
+        )
+
+        watermark = self.query.get_watermark(
+            "temperature", stats_query, [self.madrid_city_1, updated_city]
+        )
+        refreshed_watermark = self.query.get_watermark(
+            "temperature",
+            stats_query,
+            [
+                self.madrid_city_1,
+                City(
+                    "Madrid",
+                    3.0,
+                    3.0,
+                    id=3,
+                    data_version=2,
+                    data_updated_at=datetime(2024, 6, 1, 0, 0, 0),
                 ),
-            ]
+            ],
         )
 
+        self.assertEqual(datetime(2024, 5, 1, 0, 0, 0), watermark.last_modified)
+        self.assertEqual(
+            watermark,
+            self.query.get_watermark(
+                "temperature", stats_query, [self.madrid_city_1, updated_city]
+            ),
+        )
+        self.assertNotEqual(watermark.tag, refreshed_watermark.tag)
+        self.assertNotEqual(
+            watermark.tag,
+            self.query.get_watermark(
+                "precipitation", stats_query, [self.madrid_city_1, updated_city]
+            ).tag,
+        )
+        self.city_repository.get_cities_by_match.assert_not_called()
+
     def test_execute_for_all(self) -> None:
-        self.weather_data_repository.get_by_city_id.side_effect = [
-            self.madrid_city_1_weather,
-            [],
-            self.madrid_city_3_weather,
-            self.barcelona_city_1_weather,
-            self.barcelona_city_2_weather,
-        ]
+        self.weather_data_repository.get_summary_stats_by_city_ids.return_value = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather
+            ),
+            self.madrid_city_3.id: self.__to_weather_series_stats(
+                self.madrid_city_3_weather
+            ),
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather
+            ),
+            self.barcelona_city_2.id: self.__to_weather_series_stats(
+                self.barcelona_city_2_weather
+            ),
+        }
 
         result = self.query.execute_for_all()
 
@@ -283,3 +552,455 @@ class TestGetStatsQuery(TestCase):
             },
             result.weather_stats_by_city.to_dict(),
         )
+        self.weather_data_repository.get_summary_stats_by_city_ids.assert_called_once_with(
+            [
+                self.madrid_city_1.id,
+                self.madrid_city_2.id,
+                self.madrid_city_3.id,
+                self.barcelona_city_1.id,
+                self.barcelona_city_2.id,
+            ]
+        )
+
+    def test_execute_for_all_page(self) -> None:
+        self.city_repository.get_cities_page.return_value = [
+            self.madrid_city_1,
+            self.madrid_city_2,
+            self.madrid_city_3,
+        ]
+        self.weather_data_repository.get_summary_stats_by_city_ids.return_value = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather
+            ),
+        }
+
+        result = self.query.execute_for_all_page(None, 2)
+
+        self.assertEqual(
+            [1.0],
+            [
+                city_weather_stats.latitude
+                for city_weather_stats in result.weather_stats_by_city.all_city_weather_stats[
+                    "Madrid"
+                ]
+            ],
+        )
+        self.assertEqual(self.madrid_city_2.id, result.next_after_city_id)
+        self.city_repository.get_cities_page.assert_called_once_with(None, 3)
+        self.weather_data_repository.get_summary_stats_by_city_ids.assert_called_once_with(
+            [self.madrid_city_1.id, self.madrid_city_2.id]
+        )
+
+    def test_execute_for_all_last_page(self) -> None:
+        self.city_repository.get_cities_page.return_value = [self.barcelona_city_2]
+        self.weather_data_repository.get_summary_stats_by_city_ids.return_value = {}
+
+        result = self.query.execute_for_all_page(self.barcelona_city_1.id, 2)
+
+        self.assertIsNone(result.next_after_city_id)
+        self.city_repository.get_cities_page.assert_called_once_with(
+            self.barcelona_city_1.id, 3
+        )
+
+    def test_iterate_for_all_by_chunks(self) -> None:
+        weather_series_stats_by_city_id = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather
+            ),
+            self.madrid_city_3.id: self.__to_weather_series_stats(
+                self.madrid_city_3_weather
+            ),
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather
+            ),
+            self.barcelona_city_2.id: self.__to_weather_series_stats(
+                self.barcelona_city_2_weather
+            ),
+        }
+        self.weather_data_repository.get_summary_stats_by_city_ids.side_effect = (
+            lambda city_ids: {
+                city_id: weather_series_stats_by_city_id[city_id]
+                for city_id in city_ids
+                if city_id in weather_series_stats_by_city_id
+            }
+        )
+
+        all_city_weather_stats = self.query.iterate_for_all(chunk_size=2)
+
+        self.assertEqual(
+            ("Madrid", 1.0), self.__to_name_and_latitude(next(all_city_weather_stats))
+        )
+        self.weather_data_repository.get_summary_stats_by_city_ids.assert_called_once_with(
+            [self.madrid_city_1.id, self.madrid_city_2.id]
+        )
+        self.assertEqual(
+            [("Madrid", 3.0), ("Barcelona", 4.0), ("Barcelona", 5.0)],
+            [
+                self.__to_name_and_latitude(city_weather_stats)
+                for city_weather_stats in all_city_weather_stats
+            ],
+        )
+        self.assertEqual(
+            3, self.weather_data_repository.get_summary_stats_by_city_ids.call_count
+        )
+
+    @patch("core.application.get_stats.get_stats_query.connections")
+    def test_execute_for_all_with_workers(self, mock_connections) -> None:
+        weather_series_stats_by_city_id = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather
+            ),
+            self.madrid_city_3.id: self.__to_weather_series_stats(
+                self.madrid_city_3_weather
+            ),
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather
+            ),
+            self.barcelona_city_2.id: self.__to_weather_series_stats(
+                self.barcelona_city_2_weather
+            ),
+        }
+        self.weather_data_repository.get_summary_stats_by_city_ids.side_effect = (
+            lambda city_ids: {
+                city_id: weather_series_stats_by_city_id[city_id]
+                for city_id in city_ids
+                if city_id in weather_series_stats_by_city_id
+            }
+        )
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            max_workers=2,
+        )
+
+        result = query.execute_for_all()
+
+        self.assertEqual(
+            self.query.execute_for_all().weather_stats_by_city.to_dict(),
+            result.weather_stats_by_city.to_dict(),
+        )
+        self.assertEqual(
+            ["Madrid", "Barcelona"],
+            list(result.weather_stats_by_city.all_city_weather_stats.keys()),
+        )
+        self.weather_data_repository.get_summary_stats_by_city_ids.assert_has_calls(
+            [call([1, 3, 5]), call([2, 4])], any_order=True
+        )
+        self.assertEqual(2, mock_connections.close_all.call_count)
+
+    def test_execute_for_all_with_snapshots(self) -> None:
+        madrid_city_1_weather_stats = CityWeatherStats(
+            latitude=1.0,
+            longitude=1.0,
+            start_date="2010-01-01",
+            end_date="2010-01-01",
+            temperature_average=1.0,
+            precipitation_total=1.0,
+            days_with_precipitation=1,
+            precipitation_max={"date_time": "2010-01-01T00:00", "precipitation": 1.0},
+            temperature_max={"date_time": "2010-01-01T00:00", "temperature": 1.0},
+            temperature_min={"date_time": "2010-01-01T00:00", "temperature": 1.0},
+        )
+        city_weather_snapshot_repository = Mock(spec=CityWeatherSnapshotRepository)
+        city_weather_snapshot_repository.get_by_city_ids.return_value = {
+            self.madrid_city_1.id: CityWeatherSnapshot(
+                self.madrid_city_1.id, 0, madrid_city_1_weather_stats
+            ),
+            self.madrid_city_3.id: CityWeatherSnapshot(
+                self.madrid_city_3.id, -1, madrid_city_1_weather_stats
+            ),
+        }
+        self.weather_data_repository.get_summary_stats_by_city_ids.return_value = {
+            self.madrid_city_3.id: self.__to_weather_series_stats(
+                self.madrid_city_3_weather
+            ),
+            self.barcelona_city_1.id: self.__to_weather_series_stats(
+                self.barcelona_city_1_weather
+            ),
+            self.barcelona_city_2.id: self.__to_weather_series_stats(
+                self.barcelona_city_2_weather
+            ),
+        }
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            city_weather_snapshot_repository=city_weather_snapshot_repository,
+        )
+
+        result = query.execute_for_all()
+
+        madrid_weather_stats = result.weather_stats_by_city.all_city_weather_stats[
+            "Madrid"
+        ]
+        self.assertEqual(2, len(madrid_weather_stats))
+        self.assertIs(madrid_city_1_weather_stats, madrid_weather_stats[0])
+        self.assertEqual("2010-01-06", madrid_weather_stats[1].start_date)
+        self.weather_data_repository.get_summary_stats_by_city_ids.assert_called_once_with(
+            [
+                self.madrid_city_2.id,
+                self.madrid_city_3.id,
+                self.barcelona_city_1.id,
+                self.barcelona_city_2.id,
+            ]
+        )
+        city_weather_snapshot_repository.get_by_city_ids.assert_called_once_with(
+            [1, 2, 3, 4, 5]
+        )
+        saved_city_weather_snapshots = (
+            city_weather_snapshot_repository.bulk_save.call_args.args[0]
+        )
+        self.assertEqual(
+            [2, 3, 4, 5],
+            [
+                city_weather_snapshot.city_id
+                for city_weather_snapshot in saved_city_weather_snapshots
+            ],
+        )
+        self.assertIsNone(saved_city_weather_snapshots[0].city_weather_stats)
+        self.assertEqual(
+            madrid_weather_stats[1], saved_city_weather_snapshots[1].city_weather_stats
+        )
+
+    def test_execute_for_temperature_cache_miss(self) -> None:
+        stats_cache = Mock(spec=StatsCache)
+        stats_cache.get.return_value = None
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            stats_cache=stats_cache,
+        )
+        self.city_repository.get_cities_by_match.return_value = [
+            self.madrid_city_1,
+            self.madrid_city_2,
+        ]
+        stats_query = StatsQuery(
+            "MADRID",
+            datetime(2001, 1, 1, 0, 0, 0),
+            datetime(2020, 1, 1, 0, 0, 0),
+            None,
+            None,
+            30.0,
+            0.0,
+        )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.return_value = {
+            self.madrid_city_1.id: self.__to_weather_series_stats(
+                self.madrid_city_1_weather
+            ),
+        }
+
+        result = query.execute_for_temperature(stats_query)
+
+        key = (
+            "temperature|madrid|2001-01-01T00:00:00|2020-01-01T00:00:00"
+            "|None|None|30.0|0.0|*|1:0,2:0"
+        )
+        stats_cache.get.assert_called_once_with(key)
+        stats_cache.set.assert_called_once_with(key, result)
+        self.assertEqual(1, len(result.temperature_stats_for_cities))
+
+    def test_execute_for_precipitation_cache_hit(self) -> None:
+        cached_response = GetPrecipitationStatsResponse(
+            precipitation_stats_for_cities=[]
+        )
+        stats_cache = Mock(spec=StatsCache)
+        stats_cache.get.return_value = cached_response
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            stats_cache=stats_cache,
+        )
+        self.city_repository.get_cities_by_match.return_value = [
+            City("Madrid", 1.0, 1.0, id=1, data_version=3),
+        ]
+        stats_query = StatsQuery(
+            "Madrid",
+            datetime(2001, 1, 1, 0, 0, 0),
+            datetime(2020, 1, 1, 0, 0, 0),
+            1.0,
+            None,
+            30.0,
+            0.0,
+        )
+
+        result = query.execute_for_precipitation(stats_query)
+
+        self.assertIs(cached_response, result)
+        stats_cache.get.assert_called_once_with(
+            "precipitation|madrid|2001-01-01T00:00:00|2020-01-01T00:00:00"
+            "|1.0|None|30.0|0.0|*|1:3"
+        )
+        stats_cache.set.assert_not_called()
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_not_called()
+
+    def test_execute_for_temperature_with_single_flight(self) -> None:
+        cached_response = GetTemperatureStatsResponse(temperature_stats_for_cities=[])
+        stats_cache = Mock(spec=StatsCache)
+        stats_cache.get.side_effect = [None, cached_response]
+        single_flight = Mock(spec=SingleFlight)
+        single_flight.run.side_effect = lambda key, function: function()
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            stats_cache=stats_cache,
+            single_flight=single_flight,
+        )
+        self.city_repository.get_cities_by_match.return_value = [self.madrid_city_1]
+        stats_query = StatsQuery(
+            "Madrid",
+            datetime(2001, 1, 1, 0, 0, 0),
+            datetime(2020, 1, 1, 0, 0, 0),
+            None,
+            None,
+            30.0,
+            0.0,
+        )
+
+        result = query.execute_for_temperature(stats_query)
+
+        key = (
+            "temperature|madrid|2001-01-01T00:00:00|2020-01-01T00:00:00"
+            "|None|None|30.0|0.0|*|1:0"
+        )
+        self.assertIs(cached_response, result)
+        self.assertEqual(key, single_flight.run.call_args.args[0])
+        stats_cache.get.assert_has_calls([call(key), call(key)])
+        stats_cache.set.assert_not_called()
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_not_called()
+
+    def test_execute_for_all_with_single_flight(self) -> None:
+        cached_response = GetAllWeatherStatsResponse(
+            weather_stats_by_city=AllWeatherStatsByCity()
+        )
+        single_flight = Mock(spec=SingleFlight)
+        single_flight.run.return_value = cached_response
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            single_flight=single_flight,
+        )
+
+        result = query.execute_for_all()
+
+        self.assertIs(cached_response, result)
+        self.assertEqual("all", single_flight.run.call_args.args[0])
+        self.city_repository.get_all_cities.assert_not_called()
+
+    def test_execute_for_temperature_with_weather_series_cache(self) -> None:
+        weather_series_cache = Mock(spec=WeatherSeriesCache)
+        weather_series_cache.get.side_effect = lambda city_id, data_version: (
+            WeatherSeriesIndex(
+                WeatherSeries.from_weather_data(self.madrid_city_1_weather)
+            )
+            if city_id == self.madrid_city_1.id
+            else None
+        )
+        weather_series_cache.admit.side_effect = lambda city_id, data_version: (
+            city_id == self.madrid_city_3.id
+        )
+        query = GetStatsQuery(
+            city_repository=self.city_repository,
+            weather_data_repository=self.weather_data_repository,
+            weather_series_cache=weather_series_cache,
+        )
+        self.city_repository.get_cities_by_match.return_value = [
+            self.madrid_city_1,
+            self.madrid_city_2,
+            self.madrid_city_3,
+        ]
+        stats_query = StatsQuery(
+            "Madrid",
+            datetime(2010, 1, 1, 0, 0, 0),
+            datetime(2010, 1, 6, 0, 0, 0),
+            None,
+            None,
+            11.0,
+            9.0,
+        )
+        self.weather_data_repository.get_series_by_city_ids.return_value = {
+            self.madrid_city_3.id: WeatherSeries.from_weather_data(
+                self.madrid_city_3_weather
+            ),
+        }
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.return_value = (
+            {}
+        )
+
+        result = query.execute_for_temperature(stats_query)
+
+        self.assertEqual(2, len(result.temperature_stats_for_cities))
+        self.assertEqual(
+            CityTemperatureStats(
+                latitude=1.0,
+                longitude=1.0,
+                temperature_stats=TemperatureStats(
+                    average=10.0,
+                    average_by_day=DailySeries(
+                        np.array(["2010-01-01"], dtype="datetime64[D]"),
+                        np.array([10.0]),
+                    ),
+                    max={"temperature": 12.0, "date_time": "2010-01-01T01:00"},
+                    min={"temperature": 8.0, "date_time": "2010-01-01T02:00"},
+                    hours_above_threshold=1,
+                    hours_below_threshold=1,
+                ),
+            ).to_dict(),
+            result.temperature_stats_for_cities[0].to_dict(),
+        )
+        self.assertEqual(
+            CityTemperatureStats(
+                latitude=3.0,
+                longitude=3.0,
+                temperature_stats=TemperatureStats(
+                    average=5.0,
+                    average_by_day=DailySeries(
+                        np.array(["2010-01-06"], dtype="datetime64[D]"),
+                        np.array([5.0]),
+                    ),
+                    max={"temperature": 5.0, "date_time": "2010-01-06T00:00"},
+                    min={"temperature": 5.0, "date_time": "2010-01-06T00:00"},
+                    hours_above_threshold=0,
+                    hours_below_threshold=1,
+                ),
+            ).to_dict(),
+            result.temperature_stats_for_cities[1].to_dict(),
+        )
+        self.weather_data_repository.get_series_by_city_ids.assert_called_once_with(
+            [self.madrid_city_3.id]
+        )
+        self.assertEqual(
+            [self.madrid_city_3.id],
+            [args[0] for args, _ in weather_series_cache.set.call_args_list],
+        )
+        self.weather_data_repository.get_stats_by_city_ids_and_date_range.assert_called_once_with(
+            [self.madrid_city_2.id],
+            datetime(2010, 1, 1, 0, 0, 0),
+            datetime(2010, 1, 6, 0, 0, 0),
+            11.0,
+            9.0,
+            ALL_STATS_FIELDS,
+        )
+
+    @staticmethod
+    def __to_name_and_latitude(
+        city_weather_stats: tuple[str, CityWeatherStats],
+    ) -> tuple[str, float]:
+        return city_weather_stats[0], city_weather_stats[1].latitude
+
+    @staticmethod
+    def __to_weather_series_stats(
+        weather_data_list: list[WeatherData],
+        upper_threshold: float = DEFAULT_UPPER_THRESHOLD,
+        lower_threshold: float = DEFAULT_LOWER_THRESHOLD,
+    ) -> WeatherSeriesStats:
+        weather_series = WeatherSeries.from_weather_data(weather_data_list)
+        kernel = SeriesStatsKernel(weather_series.date_times)
+        return WeatherSeriesStats(
+            temperature=kernel.compute(
+                weather_series.temperatures,
+                upper_threshold=upper_threshold,
+                lower_threshold=lower_threshold,
+            ),
+            precipitation=kernel.compute(
+                weather_series.precipitations, upper_threshold=0.0
+            ),
+        )
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import numpy as np
+
+from core.domain.models.daily_series import COMPACT_DAILY_FORMAT, DailySeries
+
+
+class TestDailySeries(TestCase):
+    def setUp(self) -> None:
+        self.daily_series = DailySeries(
+            np.array(["2010-01-01", "2010-01-02", "2010-01-04"], dtype="datetime64[D]"),
+            np.array([1.5, 2.0, 0.5]),
+        )
+
+    def test_to_dict(self) -> None:
+        self.assertEqual(
+            {"2010-01-01": 1.5, "2010-01-02": 2.0, "2010-01-04": 0.5},
+            self.daily_series.to_dict(),
+        )
+
+    def test_to_dict_compact(self) -> None:
+        compact_dict = self.daily_series.to_dict(COMPACT_DAILY_FORMAT)
+
+        self.assertEqual("2010-01-01", compact_dict["start"])
+        self.assertEqual("P1D", compact_dict["step"])
+        np.testing.assert_array_equal(
+            np.array([1.5, 2.0, np.nan, 0.5]), compact_dict["values"]
+        )
+
+    def test_to_dict_compact_without_days(self) -> None:
+        daily_series = DailySeries(
+            np.array([], dtype="datetime64[D]"), np.array([], dtype=np.float64)
+        )
+
+        compact_dict = daily_series.to_dict(COMPACT_DAILY_FORMAT)
+
+        self.assertIsNone(compact_dict["start"])
+        self.assertEqual("P1D", compact_dict["step"])
+        self.assertEqual(0, len(compact_dict["values"]))
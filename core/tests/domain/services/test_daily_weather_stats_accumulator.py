@@ -0,0 +1,76 @@
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+
+from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.daily_weather_stats_accumulator import (
+    DailyWeatherStatsAccumulator,
+)
+
+
+class TestDailyWeatherStatsAccumulator(TestCase):
+    def setUp(self) -> None:
+        self.weather_data_list = [
+            WeatherData(1, datetime(2010, 1, 1, 0, 0, 0), 31.0, 1.0),
+            WeatherData(1, datetime(2010, 1, 1, 1, 0, 0), 33.0, 0.0),
+            WeatherData(1, datetime(2010, 1, 1, 2, 0, 0), -1.0, 2.0),
+            WeatherData(1, datetime(2010, 1, 2, 0, 0, 0), None, None),
+            WeatherData(1, datetime(2010, 1, 3, 0, 0, 0), 20.0, 0.5),
+        ]
+
+    def test_result_with_chunks_splitting_days(self) -> None:
+        accumulator = DailyWeatherStatsAccumulator()
+        accumulator.add(WeatherSeries.from_weather_data(self.weather_data_list[:2]))
+        accumulator.add(WeatherSeries.from_weather_data(self.weather_data_list[2:4]))
+        accumulator.add(WeatherSeries.from_weather_data([]))
+        accumulator.add(WeatherSeries.from_weather_data(self.weather_data_list[4:]))
+
+        whole_accumulator = DailyWeatherStatsAccumulator()
+        whole_accumulator.add(WeatherSeries.from_weather_data(self.weather_data_list))
+
+        result = accumulator.result()
+        expected = whole_accumulator.result()
+
+        self.assertEqual(
+            ["2010-01-01", "2010-01-02", "2010-01-03"],
+            [str(day) for day in result.temperature.periods],
+        )
+        for series_stats, expected_series_stats in (
+            (result.temperature, expected.temperature),
+            (result.precipitation, expected.precipitation),
+        ):
+            np.testing.assert_array_equal(
+                expected_series_stats.count, series_stats.count
+            )
+            np.testing.assert_array_equal(
+                expected_series_stats.total, series_stats.total
+            )
+            np.testing.assert_array_equal(expected_series_stats.max, series_stats.max)
+            np.testing.assert_array_equal(
+                expected_series_stats.max_date_time, series_stats.max_date_time
+            )
+            np.testing.assert_array_equal(expected_series_stats.min, series_stats.min)
+            np.testing.assert_array_equal(
+                expected_series_stats.min_date_time, series_stats.min_date_time
+            )
+            np.testing.assert_array_equal(
+                expected_series_stats.hours_above_threshold,
+                series_stats.hours_above_threshold,
+            )
+            np.testing.assert_array_equal(
+                expected_series_stats.hours_below_threshold,
+                series_stats.hours_below_threshold,
+            )
+
+        self.assertEqual([3, 0, 1], list(result.temperature.count))
+        self.assertEqual([63.0, 0.0, 20.0], list(result.temperature.total))
+        self.assertEqual([2, 0, 0], list(result.temperature.hours_above_threshold))
+        self.assertEqual([1, 0, 0], list(result.temperature.hours_below_threshold))
+        self.assertEqual([2, 0, 1], list(result.precipitation.hours_above_threshold))
+
+    def test_result_without_chunks(self) -> None:
+        result = DailyWeatherStatsAccumulator().result()
+
+        self.assertEqual(0, len(result))
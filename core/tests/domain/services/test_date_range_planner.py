@@ -0,0 +1,79 @@
+from datetime import date, datetime, timezone
+from unittest import TestCase
+
+from core.domain.models.date_time_range import DateTimeRange
+from core.domain.models.period_range import PeriodRange
+from core.domain.services.date_range_planner import DateRangePlanner
+
+
+class TestDateRangePlanner(TestCase):
+    def test_plan(self) -> None:
+        result = DateRangePlanner.plan(
+            datetime(2010, 11, 30, 12, tzinfo=timezone.utc),
+            datetime(2013, 3, 2, 6, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(
+            [
+                DateTimeRange(
+                    datetime(2010, 11, 30, 12, tzinfo=timezone.utc),
+                    datetime(2010, 12, 1, tzinfo=timezone.utc),
+                    include_end=False,
+                ),
+                DateTimeRange(
+                    datetime(2013, 3, 2, tzinfo=timezone.utc),
+                    datetime(2013, 3, 2, 6, tzinfo=timezone.utc),
+                    include_end=True,
+                ),
+            ],
+            result.hourly_ranges,
+        )
+        self.assertEqual(
+            [
+                PeriodRange("month", date(2010, 12, 1), date(2011, 1, 1)),
+                PeriodRange("year", date(2011, 1, 1), date(2013, 1, 1)),
+                PeriodRange("month", date(2013, 1, 1), date(2013, 3, 1)),
+                PeriodRange("day", date(2013, 3, 1), date(2013, 3, 2)),
+            ],
+            result.period_ranges,
+        )
+
+    def test_plan_with_day_resolution(self) -> None:
+        result = DateRangePlanner.plan(
+            datetime(2010, 1, 1, tzinfo=timezone.utc),
+            datetime(2011, 1, 1, tzinfo=timezone.utc),
+            "day",
+        )
+
+        self.assertEqual(
+            [
+                DateTimeRange(
+                    datetime(2011, 1, 1, tzinfo=timezone.utc),
+                    datetime(2011, 1, 1, tzinfo=timezone.utc),
+                    include_end=True,
+                )
+            ],
+            result.hourly_ranges,
+        )
+        self.assertEqual(
+            [PeriodRange("day", date(2010, 1, 1), date(2011, 1, 1))],
+            result.period_ranges,
+        )
+
+    def test_plan_without_full_days(self) -> None:
+        result = DateRangePlanner.plan(
+            datetime(2010, 1, 1, 6, tzinfo=timezone.utc),
+            datetime(2010, 1, 2, 18, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(
+            [
+                DateTimeRange(
+                    datetime(2010, 1, 1, 6, tzinfo=timezone.utc),
+                    datetime(2010, 1, 2, 18, tzinfo=timezone.utc),
+                    include_end=True,
+                )
+            ],
+            result.hourly_ranges,
+        )
+        self.assertEqual([], result.period_ranges)
@@ -0,0 +1,196 @@
+from datetime import datetime, timezone
+from unittest import TestCase
+
+import numpy as np
+
+from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.series_range_index import SeriesRangeIndex
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
+
+
+class TestSeriesRangeIndex(TestCase):
+    def setUp(self) -> None:
+        self.weather_series = WeatherSeries.from_weather_data(
+            [
+                WeatherData(1, datetime(2010, 1, 1, 22, 0, 0), 31.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 1, 23, 0, 0), 12.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 2, 0, 0, 0), 33.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 2, 1, 0, 0), None, 0.0),
+                WeatherData(1, datetime(2010, 1, 3, 0, 0, 0), -2.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 3, 5, 0, 0), 33.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 4, 0, 0, 0), None, 0.0),
+                WeatherData(1, datetime(2010, 1, 5, 0, 0, 0), -2.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 5, 1, 0, 0), 8.0, 0.0),
+            ]
+        )
+        self.index = SeriesRangeIndex(
+            self.weather_series.date_times, self.weather_series.temperatures
+        )
+
+    def test_compute_matches_kernel(self) -> None:
+        for start_date, end_date in [
+            (datetime(2010, 1, 1), datetime(2010, 1, 6)),
+            (datetime(2010, 1, 1, 23), datetime(2010, 1, 5)),
+            (datetime(2010, 1, 2, 1), datetime(2010, 1, 3, 4)),
+            (datetime(2010, 1, 3, 1), datetime(2010, 1, 3, 5)),
+            (datetime(2010, 1, 2, 1), datetime(2010, 1, 4, 12)),
+        ]:
+            with self.subTest(start_date=start_date, end_date=end_date):
+                weather_series = self.weather_series.between(start_date, end_date)
+                expected = SeriesStatsKernel(weather_series.date_times).compute(
+                    weather_series.temperatures,
+                    upper_threshold=30.0,
+                    lower_threshold=0.0,
+                )
+
+                result = self.index.compute(
+                    start_date, end_date, upper_threshold=30.0, lower_threshold=0.0
+                )
+
+                self.assertEqual(expected.count, result.count)
+                self.assertEqual(expected.total, result.total)
+                self.assertEqual(expected.average, result.average)
+                self.assertEqual(expected.max, result.max)
+                self.assertEqual(expected.max_date_time, result.max_date_time)
+                self.assertEqual(expected.min, result.min)
+                self.assertEqual(expected.min_date_time, result.min_date_time)
+                self.assertEqual(
+                    expected.hours_above_threshold, result.hours_above_threshold
+                )
+                self.assertEqual(
+                    expected.hours_below_threshold, result.hours_below_threshold
+                )
+                self.assertEqual(
+                    expected.total_by_day_as_dict(), result.total_by_day_as_dict()
+                )
+                np.testing.assert_array_equal(
+                    expected.count_by_day, result.count_by_day
+                )
+
+    def test_compute_with_threshold_sweep(self) -> None:
+        for threshold in [-3.0, -2.0, 0.0, 8.0, 12.0, 31.0, 33.0, 40.0]:
+            with self.subTest(threshold=threshold):
+                expected = SeriesStatsKernel(self.weather_series.date_times).compute(
+                    self.weather_series.temperatures,
+                    upper_threshold=threshold,
+                    lower_threshold=threshold,
+                )
+
+                result = self.index.compute(
+                    datetime(2010, 1, 1, 23),
+                    datetime(2010, 1, 6),
+                    upper_threshold=threshold,
+                    lower_threshold=threshold,
+                )
+                expected_from_second_hour = SeriesStatsKernel(
+                    self.weather_series.date_times[1:]
+                ).compute(
+                    self.weather_series.temperatures[1:],
+                    upper_threshold=threshold,
+                    lower_threshold=threshold,
+                )
+
+                self.assertEqual(
+                    expected_from_second_hour.hours_above_threshold,
+                    result.hours_above_threshold,
+                )
+                self.assertEqual(
+                    expected_from_second_hour.hours_below_threshold,
+                    result.hours_below_threshold,
+                )
+                self.assertEqual(
+                    expected.hours_above_threshold,
+                    self.index.compute(
+                        datetime(2010, 1, 1),
+                        datetime(2010, 1, 6),
+                        upper_threshold=threshold,
+                    ).hours_above_threshold,
+                )
+
+    def test_compute_with_threshold_across_months_and_years(self) -> None:
+        date_times = np.arange(
+            np.datetime64("2009-11-20T00", "us"),
+            np.datetime64("2011-02-10T00", "us"),
+            np.timedelta64(7, "h"),
+        )
+        values = np.sin(np.arange(len(date_times)) * 0.7) * 20.0
+        values[::11] = np.nan
+        index = SeriesRangeIndex(date_times, values)
+
+        for start_date, end_date in [
+            (datetime(2009, 11, 20), datetime(2011, 2, 10)),
+            (datetime(2009, 12, 1), datetime(2010, 12, 31, 23)),
+            (datetime(2009, 11, 25, 5), datetime(2011, 1, 3, 2)),
+            (datetime(2010, 3, 1), datetime(2010, 3, 31, 23)),
+        ]:
+            with self.subTest(start_date=start_date, end_date=end_date):
+                in_range = (date_times >= np.datetime64(start_date, "us")) & (
+                    date_times <= np.datetime64(end_date, "us")
+                )
+                expected = SeriesStatsKernel(date_times[in_range]).compute(
+                    values[in_range], upper_threshold=5.0, lower_threshold=-5.0
+                )
+
+                result = index.compute(
+                    start_date, end_date, upper_threshold=5.0, lower_threshold=-5.0
+                )
+
+                self.assertEqual(
+                    expected.hours_above_threshold, result.hours_above_threshold
+                )
+                self.assertEqual(
+                    expected.hours_below_threshold, result.hours_below_threshold
+                )
+
+    def test_compute_without_thresholds(self) -> None:
+        result = self.index.compute(datetime(2010, 1, 1), datetime(2010, 1, 6))
+
+        self.assertEqual(0, result.hours_above_threshold)
+        self.assertEqual(0, result.hours_below_threshold)
+
+    def test_compute_without_extremes(self) -> None:
+        result = self.index.compute(
+            datetime(2010, 1, 1, 23), datetime(2010, 1, 5), extremes=False
+        )
+
+        self.assertIsNone(result.max)
+        self.assertIsNone(result.max_date_time)
+        self.assertIsNone(result.min)
+        self.assertIsNone(result.min_date_time)
+        self.assertEqual(
+            self.index.compute(datetime(2010, 1, 1, 23), datetime(2010, 1, 5)).total,
+            result.total,
+        )
+
+    def test_compute_breaks_ties_on_first_occurrence(self) -> None:
+        result = self.index.compute(datetime(2010, 1, 1), datetime(2010, 1, 6))
+
+        self.assertEqual(33.0, result.max)
+        self.assertEqual("2010-01-02T00:00", result.max_date_time)
+        self.assertEqual(-2.0, result.min)
+        self.assertEqual("2010-01-03T00:00", result.min_date_time)
+
+    def test_compute_with_aware_dates(self) -> None:
+        result = self.index.compute(
+            datetime(2010, 1, 5, tzinfo=timezone.utc),
+            datetime(2010, 1, 5, 1, tzinfo=timezone.utc),
+        )
+
+        self.assertEqual(2, result.count)
+        self.assertEqual(3.0, result.average)
+
+    def test_compute_without_values_in_range(self) -> None:
+        self.assertIsNone(
+            self.index.compute(datetime(2010, 1, 6), datetime(2010, 1, 7))
+        )
+        self.assertIsNone(
+            self.index.compute(datetime(2010, 1, 3, 6), datetime(2010, 1, 3, 23))
+        )
+
+    def test_compute_with_only_missing_values(self) -> None:
+        result = self.index.compute(datetime(2010, 1, 4), datetime(2010, 1, 4, 23))
+
+        self.assertEqual(0, result.count)
+        self.assertIsNone(result.max)
+        self.assertIsNone(result.min_date_time)
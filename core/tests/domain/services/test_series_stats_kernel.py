@@ -0,0 +1,73 @@
+from datetime import datetime
+from unittest import TestCase
+
+import numpy as np
+
+from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
+
+
+class TestSeriesStatsKernel(TestCase):
+    def setUp(self) -> None:
+        self.weather_series = WeatherSeries.from_weather_data(
+            [
+                WeatherData(1, datetime(2010, 1, 1, 0, 0, 0), 10.0, 0.1),
+                WeatherData(1, datetime(2010, 1, 1, 1, 0, 0), 12.0, 0.2),
+                WeatherData(1, datetime(2010, 1, 1, 2, 0, 0), 8.0, 0.0),
+                WeatherData(1, datetime(2010, 1, 3, 0, 0, 0), 20.0, None),
+                WeatherData(1, datetime(2010, 1, 3, 1, 0, 0), None, 1.0),
+            ]
+        )
+        self.kernel = SeriesStatsKernel(self.weather_series.date_times)
+
+    def test_compute(self) -> None:
+        result = self.kernel.compute(
+            self.weather_series.temperatures, upper_threshold=11.0, lower_threshold=9.0
+        )
+
+        self.assertEqual(4, result.count)
+        self.assertEqual(50.0, result.total)
+        self.assertEqual(12.5, result.average)
+        self.assertEqual(20.0, result.max)
+        self.assertEqual("2010-01-03T00:00", result.max_date_time)
+        self.assertEqual(8.0, result.min)
+        self.assertEqual("2010-01-01T02:00", result.min_date_time)
+        self.assertEqual(2, result.hours_above_threshold)
+        self.assertEqual(1, result.hours_below_threshold)
+        self.assertEqual("2010-01-01", result.start_day)
+        self.assertEqual("2010-01-03", result.end_day)
+        self.assertEqual(
+            {"2010-01-01": 30.0, "2010-01-03": 20.0}, result.total_by_day_as_dict()
+        )
+        self.assertEqual(
+            {"2010-01-01": 10.0, "2010-01-03": 20.0}, result.average_by_day_as_dict()
+        )
+
+    def test_compute_without_thresholds(self) -> None:
+        result = self.kernel.compute(self.weather_series.precipitations)
+
+        self.assertEqual(4, result.count)
+        self.assertAlmostEqual(1.3, result.total)
+        self.assertEqual(1.0, result.max)
+        self.assertEqual("2010-01-03T01:00", result.max_date_time)
+        self.assertEqual(0.0, result.min)
+        self.assertEqual("2010-01-01T02:00", result.min_date_time)
+        self.assertEqual(0, result.hours_above_threshold)
+        self.assertEqual(0, result.hours_below_threshold)
+
+    def test_compute_without_valid_values(self) -> None:
+        kernel = SeriesStatsKernel(
+            np.array(["2010-01-01T00:00"], dtype="datetime64[us]")
+        )
+
+        result = kernel.compute(np.array([np.nan]))
+
+        self.assertEqual(0, result.count)
+        self.assertEqual(0.0, result.total)
+        self.assertTrue(np.isnan(result.average))
+        self.assertIsNone(result.max)
+        self.assertIsNone(result.max_date_time)
+        self.assertIsNone(result.min)
+        self.assertIsNone(result.min_date_time)
+        self.assertEqual("2010-01-01", result.start_day)
@@ -0,0 +1,59 @@
+from datetime import datetime
+from unittest import TestCase
+
+from core.domain.models.stats_query import PRECIPITATION_SERIES, TEMPERATURE_SERIES
+from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.weather_series_index import WeatherSeriesIndex
+
+
+class TestWeatherSeriesIndex(TestCase):
+    def setUp(self) -> None:
+        self.index = WeatherSeriesIndex(
+            WeatherSeries.from_weather_data(
+                [
+                    WeatherData(1, datetime(2010, 1, 1, 22, 0, 0), 31.0, 0.0),
+                    WeatherData(1, datetime(2010, 1, 1, 23, 0, 0), 12.0, 1.5),
+                    WeatherData(1, datetime(2010, 1, 2, 0, 0, 0), -2.0, 0.5),
+                ]
+            )
+        )
+        self.start_date = datetime(2010, 1, 1)
+        self.end_date = datetime(2010, 1, 3)
+
+    def test_compute(self) -> None:
+        result = self.index.compute(self.start_date, self.end_date)
+
+        self.assertEqual(41.0, result.temperature.total)
+        self.assertEqual(1, result.temperature.hours_above_threshold)
+        self.assertEqual(1, result.temperature.hours_below_threshold)
+        self.assertEqual(2.0, result.precipitation.total)
+        self.assertEqual(1.5, result.precipitation.max)
+
+    def test_compute_only_temperature(self) -> None:
+        result = self.index.compute(
+            self.start_date, self.end_date, series=frozenset([TEMPERATURE_SERIES])
+        )
+
+        self.assertEqual(41.0, result.temperature.total)
+        self.assertIsNone(result.precipitation)
+
+    def test_compute_only_precipitation(self) -> None:
+        result = self.index.compute(
+            self.start_date, self.end_date, series=frozenset([PRECIPITATION_SERIES])
+        )
+
+        self.assertIsNone(result.temperature)
+        self.assertEqual(2.0, result.precipitation.total)
+
+    def test_compute_out_of_range(self) -> None:
+        for series in [
+            frozenset([TEMPERATURE_SERIES]),
+            frozenset([PRECIPITATION_SERIES]),
+        ]:
+            with self.subTest(series=series):
+                self.assertIsNone(
+                    self.index.compute(
+                        datetime(2011, 1, 1), datetime(2011, 1, 2), series=series
+                    )
+                )
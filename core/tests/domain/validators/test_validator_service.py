@@ -2,6 +2,7 @@ from datetime import datetime
 from unittest import TestCase
 
 from core.domain.exceptions.validation_error import ValidationError
+from core.domain.models.stats_query import ALL_STATS_FIELDS, TEMPERATURE_STATS_FIELDS
 from core.domain.validators.validator_service import ValidatorService
 
 
@@ -244,3 +245,86 @@ class TestValidatorService(TestCase):
                 None,
                 None,
             )
+
+    def test_validate_batch_params(self):
+        result = ValidatorService.validate_batch_params(
+            [
+                {
+                    "city": "New York",
+                    "start_date": self.valid_start_date,
+                    "end_date": self.valid_end_date,
+                    "latitude": 40.7128,
+                    "upper_threshold": 25,
+                },
+                {
+                    "city": "Boston",
+                    "start_date": self.valid_start_date,
+                    "end_date": self.valid_start_date,
+                },
+            ],
+            max_queries=2,
+        )
+
+        self.assertEqual(2, len(result))
+        self.assertEqual("New York", result[0].city_name)
+        self.assertEqual(self.latitude, result[0].latitude)
+        self.assertEqual(self.upper, result[0].upper_threshold)
+        self.assertEqual(self.start_date, result[1].end_date)
+
+    def test_validate_batch_params_without_queries(self):
+        with self.assertRaisesRegex(
+            ValidationError, "Mandatory field queries cannot be None"
+        ):
+            ValidatorService.validate_batch_params(None)
+
+    def test_validate_batch_params_with_too_many_queries(self):
+        with self.assertRaisesRegex(ValidationError, "queries 3 is greater than 2."):
+            ValidatorService.validate_batch_params([{}, {}, {}], max_queries=2)
+
+    def test_validate_batch_params_with_invalid_query(self):
+        with self.assertRaisesRegex(
+            ValidationError, r"queries\[1\]: Invalid format for end_date: 2023-1R-31"
+        ):
+            ValidatorService.validate_batch_params(
+                [
+                    {
+                        "city": "New York",
+                        "start_date": self.valid_start_date,
+                        "end_date": self.valid_end_date,
+                    },
+                    {
+                        "city": "New York",
+                        "start_date": self.valid_start_date,
+                        "end_date": self.invalid_end_date,
+                    },
+                ]
+            )
+
+    def test_validate_daily_format(self):
+        self.assertEqual("map", ValidatorService.validate_daily_format(None))
+        self.assertEqual("compact", ValidatorService.validate_daily_format("compact"))
+
+    def test_validate_daily_format_with_invalid_value(self):
+        with self.assertRaisesRegex(
+            ValidationError, "daily_format columns is not one of map, compact."
+        ):
+            ValidatorService.validate_daily_format("columns")
+
+    def test_validate_fields(self):
+        self.assertEqual(
+            frozenset(["average", "max"]),
+            ValidatorService.validate_fields("average, max"),
+        )
+        self.assertEqual(ALL_STATS_FIELDS, ValidatorService.validate_fields(None))
+
+    def test_validate_fields_with_invalid_field(self):
+        with self.assertRaisesRegex(
+            ValidationError, "fields median is not one of average, average_by_day"
+        ):
+            ValidatorService.validate_fields("average,median")
+
+    def test_validate_fields_with_field_out_of_stats_fields(self):
+        with self.assertRaisesRegex(
+            ValidationError, "fields total is not one of average, average_by_day, max"
+        ):
+            ValidatorService.validate_fields("average,total", TEMPERATURE_STATS_FIELDS)
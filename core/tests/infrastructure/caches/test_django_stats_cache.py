@@ -0,0 +1,37 @@
+import hashlib
+from unittest import TestCase
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from core.infrastructure.caches.django_stats_cache import (
+    STATS_CACHE_SCHEMA_VERSION,
+    DjangoStatsCache,
+)
+
+
+class TestDjangoStatsCache(TestCase):
+    def setUp(self) -> None:
+        self.cache = LocMemCache("test_django_stats_cache", {})
+        self.django_stats_cache = DjangoStatsCache(self.cache)
+
+    def tearDown(self) -> None:
+        self.cache.clear()
+
+    def test_get_and_set(self) -> None:
+        self.django_stats_cache.set("temperature|madrid", {"average": 1.0})
+
+        self.assertEqual(
+            {"average": 1.0}, self.django_stats_cache.get("temperature|madrid")
+        )
+        self.assertIsNone(self.django_stats_cache.get("temperature|barcelona"))
+
+    def test_set_prefixes_key_with_schema_version(self) -> None:
+        self.django_stats_cache.set("temperature|madrid", {"average": 1.0})
+
+        self.assertEqual(
+            {"average": 1.0},
+            self.cache.get(
+                f"stats:v{STATS_CACHE_SCHEMA_VERSION}:"
+                f"{hashlib.sha256(b'temperature|madrid').hexdigest()}"
+            ),
+        )
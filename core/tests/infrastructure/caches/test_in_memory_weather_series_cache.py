@@ -0,0 +1,79 @@
+from datetime import datetime
+from unittest import TestCase
+
+from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.weather_series_index import WeatherSeriesIndex
+from core.infrastructure.caches.in_memory_weather_series_cache import (
+    InMemoryWeatherSeriesCache,
+)
+
+
+class TestInMemoryWeatherSeriesCache(TestCase):
+    def setUp(self) -> None:
+        self.weather_series_index = WeatherSeriesIndex(
+            WeatherSeries.from_weather_data(
+                [
+                    WeatherData(1, datetime(2010, 1, 1, 0, 0, 0), 10.0, 0.1),
+                    WeatherData(1, datetime(2010, 1, 1, 1, 0, 0), 12.0, 0.2),
+                ]
+            )
+        )
+        self.cache = InMemoryWeatherSeriesCache(2 * self.weather_series_index.nbytes)
+
+    def test_get_with_same_data_version(self) -> None:
+        self.cache.set(1, 0, self.weather_series_index)
+
+        self.assertIs(self.weather_series_index, self.cache.get(1, 0))
+
+    def test_get_with_stale_data_version(self) -> None:
+        self.cache.set(1, 0, self.weather_series_index)
+
+        self.assertIsNone(self.cache.get(1, 1))
+        self.assertIsNone(self.cache.get(2, 0))
+
+    def test_set_evicts_least_recently_used(self) -> None:
+        self.cache.set(1, 0, self.weather_series_index)
+        self.cache.set(2, 0, self.weather_series_index)
+        self.cache.get(1, 0)
+
+        self.cache.set(3, 0, self.weather_series_index)
+
+        self.assertIs(self.weather_series_index, self.cache.get(1, 0))
+        self.assertIsNone(self.cache.get(2, 0))
+        self.assertIs(self.weather_series_index, self.cache.get(3, 0))
+        self.assertEqual(2 * self.weather_series_index.nbytes, self.cache.nbytes)
+
+    def test_set_replaces_previous_data_version(self) -> None:
+        self.cache.set(1, 0, self.weather_series_index)
+        self.cache.set(1, 1, self.weather_series_index)
+
+        self.assertIsNone(self.cache.get(1, 0))
+        self.assertIs(self.weather_series_index, self.cache.get(1, 1))
+        self.assertEqual(self.weather_series_index.nbytes, self.cache.nbytes)
+
+    def test_set_skips_series_over_budget(self) -> None:
+        cache = InMemoryWeatherSeriesCache(self.weather_series_index.nbytes - 1)
+
+        cache.set(1, 0, self.weather_series_index)
+
+        self.assertIsNone(cache.get(1, 0))
+        self.assertEqual(0, cache.nbytes)
+
+    def test_admit_after_second_miss(self) -> None:
+        self.assertFalse(self.cache.admit(1, 0))
+        self.assertTrue(self.cache.admit(1, 0))
+        self.assertFalse(self.cache.admit(1, 1))
+        self.assertFalse(self.cache.admit(2, 0))
+
+    def test_admit_skips_series_over_budget(self) -> None:
+        cache = InMemoryWeatherSeriesCache(self.weather_series_index.nbytes - 1)
+        cache.admit(1, 0)
+        cache.admit(1, 0)
+
+        cache.set(1, 0, self.weather_series_index)
+
+        self.assertFalse(cache.admit(1, 0))
+        self.assertFalse(cache.admit(1, 0))
+        self.assertFalse(cache.admit(1, 1))
+        self.assertTrue(cache.admit(1, 1))
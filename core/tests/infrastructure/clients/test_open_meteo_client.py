@@ -1,8 +1,9 @@
 from unittest import TestCase
-from unittest.mock import patch, Mock
+from unittest.mock import MagicMock, patch, Mock
 import pandas as pd
 from requests import Response, HTTPError
 
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
 from core.domain.models.city import City
 from core.domain.models.weather_data import WeatherData
 from core.infrastructure.clients.open_meteo_client import OpenMeteoClient
@@ -56,6 +57,24 @@ class TestOpenMeteoClient(TestCase):
         with self.assertRaises(HTTPError):
             self.client.get_cities_by_name("AnyCity")
 
+    @patch("requests.get")
+    def test_get_cities_by_name_http_error_is_measured(self, get: Mock) -> None:
+        performance_recorder = Mock(spec=PerformanceRecorder, measure=MagicMock())
+        client = OpenMeteoClient(
+            self.city_endpoint, self.weather_endpoint, performance_recorder
+        )
+        response = Mock(spec=Response)
+        response.status_code = 500
+        response.raise_for_status.side_effect = HTTPError
+        get.return_value = response
+
+        with self.assertRaises(HTTPError):
+            client.get_cities_by_name("Madrid")
+
+        performance_recorder.measure.assert_called_once_with("meteo")
+        measure_exit = performance_recorder.measure.return_value.__exit__
+        self.assertIs(HTTPError, measure_exit.call_args.args[0])
+
     @patch("requests.get")
     def test_get_weather_data_by_city_success(self, get: Mock) -> None:
         response = Mock(spec=Response)
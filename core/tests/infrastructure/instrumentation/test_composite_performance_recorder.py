@@ -0,0 +1,31 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock
+
+from core.domain.instrumentation.performance_recorder import PerformanceRecorder
+from core.infrastructure.instrumentation.composite_performance_recorder import (
+    CompositePerformanceRecorder,
+)
+
+
+class TestCompositePerformanceRecorder(TestCase):
+    def setUp(self) -> None:
+        self.performance_recorders = [
+            Mock(spec=PerformanceRecorder, measure=MagicMock()),
+            Mock(spec=PerformanceRecorder, measure=MagicMock()),
+        ]
+        self.recorder = CompositePerformanceRecorder(self.performance_recorders)
+
+    def test_measure(self) -> None:
+        with self.recorder.measure("db"):
+            pass
+
+        for performance_recorder in self.performance_recorders:
+            performance_recorder.measure.assert_called_once_with("db")
+            performance_recorder.measure.return_value.__enter__.assert_called_once()
+            performance_recorder.measure.return_value.__exit__.assert_called_once()
+
+    def test_count(self) -> None:
+        self.recorder.count("rows", 3)
+
+        for performance_recorder in self.performance_recorders:
+            performance_recorder.count.assert_called_once_with("rows", 3)
@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from prometheus_client import REGISTRY
+
+from core.infrastructure.instrumentation.prometheus_performance_recorder import (
+    PrometheusPerformanceRecorder,
+)
+
+
+class TestPrometheusPerformanceRecorder(TestCase):
+    def setUp(self) -> None:
+        self.recorder = PrometheusPerformanceRecorder()
+
+    def test_measure(self) -> None:
+        count = self.__get_sample_value(
+            "meteoanalyzer_operation_duration_seconds_count", operation="test_measure"
+        )
+
+        with self.recorder.measure("test_measure"):
+            pass
+
+        self.assertEqual(
+            count + 1,
+            self.__get_sample_value(
+                "meteoanalyzer_operation_duration_seconds_count",
+                operation="test_measure",
+            ),
+        )
+
+    def test_measure_with_error(self) -> None:
+        errors = self.__get_sample_value(
+            "meteoanalyzer_operation_errors_total", operation="test_error"
+        )
+
+        with self.assertRaises(ValueError):
+            with self.recorder.measure("test_error"):
+                raise ValueError("error")
+
+        self.assertEqual(
+            errors + 1,
+            self.__get_sample_value(
+                "meteoanalyzer_operation_errors_total", operation="test_error"
+            ),
+        )
+        self.assertEqual(
+            1,
+            self.__get_sample_value(
+                "meteoanalyzer_operation_duration_seconds_count",
+                operation="test_error",
+            ),
+        )
+
+    def test_count(self) -> None:
+        events = self.__get_sample_value(
+            "meteoanalyzer_events_total", event="test_rows"
+        )
+
+        self.recorder.count("test_rows", 5)
+        self.recorder.count("test_rows")
+
+        self.assertEqual(
+            events + 6,
+            self.__get_sample_value("meteoanalyzer_events_total", event="test_rows"),
+        )
+
+    @staticmethod
+    def __get_sample_value(name: str, **labels) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0.0
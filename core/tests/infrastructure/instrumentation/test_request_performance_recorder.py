@@ -0,0 +1,61 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from unittest import TestCase
+
+from core.infrastructure.instrumentation.request_performance_recorder import (
+    RequestPerformanceRecorder,
+)
+
+
+class TestRequestPerformanceRecorder(TestCase):
+    def setUp(self) -> None:
+        self.recorder = RequestPerformanceRecorder()
+
+    def test_measure_and_count_outside_request(self) -> None:
+        with self.recorder.measure("db"):
+            pass
+        self.recorder.count("rows", 3)
+
+        with self.recorder.record() as request_timings:
+            pass
+
+        self.assertEqual({}, request_timings.durations)
+        self.assertEqual({}, request_timings.counts)
+
+    def test_record(self) -> None:
+        with self.recorder.record() as request_timings:
+            with self.recorder.measure("db"):
+                pass
+            with self.recorder.measure("db"):
+                pass
+            self.recorder.count("rows", 3)
+            self.recorder.count("rows", 2)
+            self.recorder.count("db_queries")
+
+        self.assertEqual(["db"], list(request_timings.durations.keys()))
+        self.assertGreaterEqual(request_timings.durations["db"], 0.0)
+        self.assertEqual({"rows": 5, "db_queries": 1}, request_timings.counts)
+
+    def test_record_from_copied_context_in_threads(self) -> None:
+        with self.recorder.record() as request_timings:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(copy_context().run, self.recorder.count, "rows", 1)
+                    for _ in range(4)
+                ]
+                [future.result() for future in futures]
+
+        self.assertEqual({"rows": 4}, request_timings.counts)
+
+    def test_to_server_timing(self) -> None:
+        with self.recorder.record() as request_timings:
+            request_timings.add_duration("db", 0.0125)
+            request_timings.add_count("rows", 8760)
+
+        self.assertEqual(
+            'db;dur=12.500, rows;desc="8760"', request_timings.to_server_timing()
+        )
+        self.assertEqual(
+            {"durations_ms": {"db": 12.5}, "counts": {"rows": 8760}},
+            request_timings.to_dict(),
+        )
@@ -0,0 +1,58 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, call, patch
+
+from core.domain.locks.single_flight import SingleFlight
+from core.infrastructure.locks.db_single_flight import DbSingleFlight
+
+
+class TestDbSingleFlight(TestCase):
+    def setUp(self) -> None:
+        self.inner_single_flight = Mock(spec=SingleFlight)
+        self.inner_single_flight.run.side_effect = lambda key, function: function()
+        self.single_flight = DbSingleFlight(self.inner_single_flight)
+
+    @patch("core.infrastructure.locks.db_single_flight.connections")
+    def test_run_without_advisory_locks(self, mock_connections) -> None:
+        mock_connections.__getitem__.return_value.vendor = "sqlite"
+
+        result = self.single_flight.run("key", lambda: 1)
+
+        self.assertEqual(1, result)
+        self.inner_single_flight.run.assert_called_once()
+        self.assertEqual("key", self.inner_single_flight.run.call_args.args[0])
+        mock_connections.__getitem__.return_value.cursor.assert_not_called()
+
+    @patch("core.infrastructure.locks.db_single_flight.connections")
+    def test_run_with_advisory_lock(self, mock_connections) -> None:
+        connection = MagicMock(vendor="postgresql")
+        cursor = connection.cursor.return_value.__enter__.return_value
+        mock_connections.__getitem__.return_value = connection
+
+        result = self.single_flight.run("key", lambda: 1)
+
+        self.assertEqual(1, result)
+        lock_id = cursor.execute.call_args_list[0].args[1][0]
+        self.assertEqual(
+            [
+                call("SELECT pg_advisory_lock(%s)", [lock_id]),
+                call("SELECT pg_advisory_unlock(%s)", [lock_id]),
+            ],
+            cursor.execute.call_args_list,
+        )
+        self.assertTrue(-(2**63) <= lock_id < 2**63)
+
+    @patch("core.infrastructure.locks.db_single_flight.connections")
+    def test_run_releases_advisory_lock_on_error(self, mock_connections) -> None:
+        connection = MagicMock(vendor="postgresql")
+        cursor = connection.cursor.return_value.__enter__.return_value
+        mock_connections.__getitem__.return_value = connection
+
+        def compute() -> None:
+            raise ValueError("error")
+
+        with self.assertRaises(ValueError):
+            self.single_flight.run("key", compute)
+
+        self.assertEqual(
+            "SELECT pg_advisory_unlock(%s)", cursor.execute.call_args_list[-1].args[0]
+        )
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import TestCase
+
+from core.infrastructure.locks.in_memory_single_flight import InMemorySingleFlight
+
+
+class TestInMemorySingleFlight(TestCase):
+    def setUp(self) -> None:
+        self.single_flight = InMemorySingleFlight()
+
+    def test_run_coalesces_concurrent_calls_with_same_key(self) -> None:
+        started = Event()
+        release = Event()
+        calls = []
+
+        def compute() -> list[int]:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return [1, 2, 3]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(self.single_flight.run, "key", compute)
+            started.wait(5)
+            followers = [
+                executor.submit(self.single_flight.run, "key", compute)
+                for _ in range(3)
+            ]
+            release.set()
+            results = [leader.result(5)] + [
+                follower.result(5) for follower in followers
+            ]
+
+        self.assertEqual(1, len(calls))
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_run_does_not_coalesce_different_keys(self) -> None:
+        self.assertEqual(1, self.single_flight.run("key_1", lambda: 1))
+        self.assertEqual(2, self.single_flight.run("key_2", lambda: 2))
+
+    def test_run_computes_again_after_completion(self) -> None:
+        calls = []
+
+        self.single_flight.run("key", lambda: calls.append(1))
+        self.single_flight.run("key", lambda: calls.append(1))
+
+        self.assertEqual(2, len(calls))
+
+    def test_run_shares_exception_with_followers(self) -> None:
+        started = Event()
+        release = Event()
+
+        def compute() -> None:
+            started.set()
+            release.wait(5)
+            raise ValueError("error")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(self.single_flight.run, "key", compute)
+            started.wait(5)
+            follower = executor.submit(self.single_flight.run, "key", compute)
+            release.set()
+
+            with self.assertRaises(ValueError):
+                leader.result(5)
+            with self.assertRaises(ValueError):
+                follower.result(5)
+
+        self.assertEqual(3, self.single_flight.run("key", lambda: 3))
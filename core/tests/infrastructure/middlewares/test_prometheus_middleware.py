@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+from prometheus_client import REGISTRY
+
+from core.dependency_injection_factories.infrastructure.instrumentation.request_performance_recorder_factory import (
+    RequestPerformanceRecorderFactory,
+)
+from core.infrastructure.middlewares.prometheus_middleware import (
+    PrometheusMiddleware,
+)
+
+
+class TestPrometheusMiddleware(TestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/stats/all/")
+        self.request.resolver_match = resolve("/stats/all/")
+
+    @staticmethod
+    def get_response(_) -> HttpResponse:
+        RequestPerformanceRecorderFactory.create().count("rows", 42)
+        return HttpResponse()
+
+    def test_call(self) -> None:
+        labels = {"view": "all", "method": "GET", "status": "200"}
+        count = self.__get_sample_value(
+            "meteoanalyzer_request_duration_seconds_count", labels
+        )
+        rows = self.__get_sample_value(
+            "meteoanalyzer_request_db_rows_sum", {"view": "all"}
+        )
+
+        with RequestPerformanceRecorderFactory.create().record():
+            PrometheusMiddleware(self.get_response)(self.request)
+
+        self.assertEqual(
+            count + 1,
+            self.__get_sample_value(
+                "meteoanalyzer_request_duration_seconds_count", labels
+            ),
+        )
+        self.assertEqual(
+            rows + 42,
+            self.__get_sample_value(
+                "meteoanalyzer_request_db_rows_sum", {"view": "all"}
+            ),
+        )
+
+    def test_call_without_server_timing(self) -> None:
+        rows = self.__get_sample_value(
+            "meteoanalyzer_request_db_rows_sum", {"view": "all"}
+        )
+
+        PrometheusMiddleware(self.get_response)(self.request)
+
+        self.assertEqual(
+            rows + 42,
+            self.__get_sample_value(
+                "meteoanalyzer_request_db_rows_sum", {"view": "all"}
+            ),
+        )
+        self.assertIsNone(RequestPerformanceRecorderFactory.create().current())
+
+    @staticmethod
+    def __get_sample_value(name: str, labels: dict) -> float:
+        return REGISTRY.get_sample_value(name, labels) or 0.0
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.dependency_injection_factories.infrastructure.instrumentation.request_performance_recorder_factory import (
+    RequestPerformanceRecorderFactory,
+)
+from core.infrastructure.middlewares.server_timing_middleware import (
+    ServerTimingMiddleware,
+)
+
+
+class TestServerTimingMiddleware(TestCase):
+    def setUp(self) -> None:
+        self.request = RequestFactory().get("/stats/all/")
+
+    @staticmethod
+    def get_response(_) -> HttpResponse:
+        recorder = RequestPerformanceRecorderFactory.create()
+        with recorder.measure("db"):
+            recorder.count("db_queries")
+        return HttpResponse()
+
+    @staticmethod
+    async def aget_response(request) -> HttpResponse:
+        return TestServerTimingMiddleware.get_response(request)
+
+    def test_call(self) -> None:
+        response = ServerTimingMiddleware(self.get_response)(self.request)
+
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=\d+\.\d{3}, total;dur=\d+\.\d{3}, db_queries;desc="1"$',
+        )
+
+    def test_async_call(self) -> None:
+        response = async_to_sync(ServerTimingMiddleware(self.aget_response))(
+            self.request
+        )
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn('db_queries;desc="1"', response["Server-Timing"])
+
+    @patch(
+        "core.infrastructure.middlewares.server_timing_middleware.SERVER_TIMING_LOG",
+        True,
+    )
+    def test_call_with_log(self) -> None:
+        with self.assertLogs("core.performance", level="INFO") as logs:
+            ServerTimingMiddleware(self.get_response)(self.request)
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIn('"path":"/stats/all/"', logs.records[0].getMessage())
+        self.assertIn('"counts":{"db_queries":1}', logs.records[0].getMessage())
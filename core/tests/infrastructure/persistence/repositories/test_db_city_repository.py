@@ -169,3 +169,24 @@ class TestIntegrationDbCityRepository(TestCase):
         city_3.delete()
         city_4.delete()
         city_5.delete()
+
+    def test_get_cities_page(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", longitude=0.0, latitude=2.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Elsewhere", longitude=1.0, latitude=1.0
+        )
+        city_3 = DjangoCity.objects.create(
+            id=3, name="Somewhere", longitude=1.0, latitude=2.0
+        )
+
+        first_page = self.db_city_repository.get_cities_page(None, 2)
+        second_page = self.db_city_repository.get_cities_page(2, 2)
+
+        self.assertEqual([city_1.to_domain(), city_2.to_domain()], first_page)
+        self.assertEqual([city_3.to_domain()], second_page)
+
+        city_1.delete()
+        city_2.delete()
+        city_3.delete()
@@ -0,0 +1,87 @@
+import numpy as np
+from django.test import TestCase
+
+from core.domain.models.city_weather_snapshot import CityWeatherSnapshot
+from core.domain.models.city_weather_stats import CityWeatherStats
+from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_city_weather_snapshot import (
+    DjangoCityWeatherSnapshot,
+)
+from core.infrastructure.persistence.repositories.db_city_weather_snapshot_repository import (
+    DbCityWeatherSnapshotRepository,
+)
+
+
+class TestIntegrationDbCityWeatherSnapshotRepository(TestCase):
+    def setUp(self) -> None:
+        self.db_city_weather_snapshot_repository = DbCityWeatherSnapshotRepository()
+
+    def test_bulk_save_and_get_by_city_ids(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=1.0, longitude=2.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Nowhere", latitude=3.0, longitude=4.0
+        )
+        city_3 = DjangoCity.objects.create(
+            id=3, name="Nowhere", latitude=5.0, longitude=6.0
+        )
+        city_weather_stats = CityWeatherStats(
+            latitude=1.0,
+            longitude=2.0,
+            start_date="2010-01-01",
+            end_date="2010-02-01",
+            temperature_average=12.5,
+            precipitation_total=3.0,
+            days_with_precipitation=2,
+            precipitation_max={"date_time": "2010-01-02T03:00", "precipitation": 2.0},
+            temperature_max={"date_time": "2010-01-03T13:00", "temperature": 25.0},
+            temperature_min={"date_time": "2010-01-04T05:00", "temperature": -2.0},
+        )
+        empty_city_weather_stats = CityWeatherStats(
+            latitude=3.0,
+            longitude=4.0,
+            start_date="2010-01-01",
+            end_date="2010-01-01",
+            temperature_average=np.nan,
+            precipitation_total=0.0,
+            days_with_precipitation=0,
+            precipitation_max={"date_time": None, "precipitation": None},
+            temperature_max={"date_time": None, "temperature": None},
+            temperature_min={"date_time": None, "temperature": None},
+        )
+
+        self.db_city_weather_snapshot_repository.bulk_save(
+            [
+                CityWeatherSnapshot(1, 1, city_weather_stats),
+                CityWeatherSnapshot(2, 1, empty_city_weather_stats),
+                CityWeatherSnapshot(3, 1, None),
+            ]
+        )
+        self.db_city_weather_snapshot_repository.bulk_save(
+            [CityWeatherSnapshot(2, 2, empty_city_weather_stats)]
+        )
+
+        with self.assertNumQueries(1):
+            city_weather_snapshots = (
+                self.db_city_weather_snapshot_repository.get_by_city_ids([1, 2, 3])
+            )
+
+        self.assertEqual(
+            CityWeatherSnapshot(1, 1, city_weather_stats), city_weather_snapshots[1]
+        )
+        self.assertEqual(2, city_weather_snapshots[2].data_version)
+        self.assertEqual(
+            empty_city_weather_stats.to_dict().keys(),
+            city_weather_snapshots[2].city_weather_stats.to_dict().keys(),
+        )
+        self.assertTrue(
+            np.isnan(city_weather_snapshots[2].city_weather_stats.temperature_average)
+        )
+        self.assertEqual(CityWeatherSnapshot(3, 1, None), city_weather_snapshots[3])
+        self.assertEqual(3, DjangoCityWeatherSnapshot.objects.count())
+
+        DjangoCityWeatherSnapshot.objects.all().delete()
+        city_1.delete()
+        city_2.delete()
+        city_3.delete()
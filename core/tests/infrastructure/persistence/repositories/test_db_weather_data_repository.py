@@ -1,10 +1,27 @@
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 
+import numpy as np
 from django.test import TestCase
 
+from core.domain.models.stats_query import (
+    AVERAGE_FIELD,
+    HOURS_ABOVE_THRESHOLD_FIELD,
+    MAX_FIELD,
+)
 from core.domain.models.weather_data import WeatherData
+from core.domain.models.weather_series import WeatherSeries
+from core.domain.services.series_stats_kernel import SeriesStatsKernel
 from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_weather_daily import (
+    DjangoWeatherDaily,
+)
 from core.infrastructure.persistence.models.django_weather_data import DjangoWeatherData
+from core.infrastructure.persistence.models.django_weather_monthly import (
+    DjangoWeatherMonthly,
+)
+from core.infrastructure.persistence.models.django_weather_yearly import (
+    DjangoWeatherYearly,
+)
 from core.infrastructure.persistence.repositories.db_weather_data_repository import (
     DbWeatherDataRepository,
 )
@@ -92,6 +109,156 @@ class TestIntegrationDbWeatherDataRepository(TestCase):
         [django_weather_data.delete() for django_weather_data in weather_data_list]
         city.delete()
 
+    def test_bulk_save_increments_data_version(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Nowhere", latitude=1.0, longitude=1.0
+        )
+
+        for hour in range(2):
+            self.db_weather_data_repository.bulk_save(
+                [
+                    WeatherData(
+                        city_id=city_1.id,
+                        date_time=datetime(2010, 1, 1, hour, tzinfo=timezone.utc),
+                        precipitation=0.0,
+                        temperature=10.0,
+                    )
+                ]
+            )
+
+        city_1.refresh_from_db()
+        city_2.refresh_from_db()
+        self.assertEqual(2, city_1.data_version)
+        self.assertEqual(0, city_2.data_version)
+        self.assertIsNotNone(city_1.data_updated_at)
+        self.assertIsNone(city_2.data_updated_at)
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city_1.delete()
+        city_2.delete()
+
+    def test_bulk_save_refreshes_daily_rollup(self) -> None:
+        city = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+
+        self.db_weather_data_repository.bulk_save(
+            [
+                WeatherData(
+                    city_id=city.id,
+                    date_time=datetime(2010, 1, 1, 0, tzinfo=timezone.utc),
+                    precipitation=1.0,
+                    temperature=31.0,
+                ),
+                WeatherData(
+                    city_id=city.id,
+                    date_time=datetime(2010, 1, 1, 1, tzinfo=timezone.utc),
+                    precipitation=0.0,
+                    temperature=33.0,
+                ),
+            ]
+        )
+        self.db_weather_data_repository.bulk_save(
+            [
+                WeatherData(
+                    city_id=city.id,
+                    date_time=datetime(2010, 1, 1, 2, tzinfo=timezone.utc),
+                    precipitation=2.0,
+                    temperature=-1.0,
+                ),
+                WeatherData(
+                    city_id=city.id,
+                    date_time=datetime(2010, 1, 2, 0, tzinfo=timezone.utc),
+                    precipitation=None,
+                    temperature=None,
+                ),
+            ]
+        )
+
+        weather_daily_list = list(DjangoWeatherDaily.objects.filter(city_id=city.id))
+        self.assertEqual(2, len(weather_daily_list))
+
+        first_day = weather_daily_list[0]
+        self.assertEqual(date(2010, 1, 1), first_day.day)
+        self.assertEqual(3, first_day.temperature_count)
+        self.assertEqual(63.0, first_day.temperature_sum)
+        self.assertEqual(33.0, first_day.temperature_max)
+        self.assertEqual(
+            datetime(2010, 1, 1, 1, tzinfo=timezone.utc),
+            first_day.temperature_max_date_time,
+        )
+        self.assertEqual(-1.0, first_day.temperature_min)
+        self.assertEqual(
+            datetime(2010, 1, 1, 2, tzinfo=timezone.utc),
+            first_day.temperature_min_date_time,
+        )
+        self.assertEqual(2, first_day.hours_above_threshold)
+        self.assertEqual(1, first_day.hours_below_threshold)
+        self.assertEqual(3.0, first_day.precipitation_sum)
+        self.assertEqual(2.0, first_day.precipitation_max)
+        self.assertEqual(2, first_day.hours_with_precipitation)
+
+        second_day = weather_daily_list[1]
+        self.assertEqual(date(2010, 1, 2), second_day.day)
+        self.assertEqual(0, second_day.temperature_count)
+        self.assertIsNone(second_day.temperature_max)
+        self.assertIsNone(second_day.temperature_max_date_time)
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city.delete()
+
+    def test_bulk_save_refreshes_daily_rollup_by_chunks(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Somewhere", latitude=1.0, longitude=10.4
+        )
+
+        DbWeatherDataRepository(chunk_size=2).bulk_save(
+            [
+                WeatherData(
+                    city_id=city_id,
+                    date_time=datetime(2010, 1, 1, hour, tzinfo=timezone.utc),
+                    precipitation=float(hour),
+                    temperature=10.0 * hour + city_id,
+                )
+                for city_id in (city_1.id, city_2.id)
+                for hour in range(3)
+            ]
+        )
+
+        for city in (city_1, city_2):
+            weather_daily = DjangoWeatherDaily.objects.get(
+                city_id=city.id, day=date(2010, 1, 1)
+            )
+            self.assertEqual(3, weather_daily.temperature_count)
+            self.assertEqual(30.0 + 3 * city.id, weather_daily.temperature_sum)
+            self.assertEqual(20.0 + city.id, weather_daily.temperature_max)
+            self.assertEqual(
+                datetime(2010, 1, 1, 2, tzinfo=timezone.utc),
+                weather_daily.temperature_max_date_time,
+            )
+            self.assertEqual(float(city.id), weather_daily.temperature_min)
+            self.assertEqual(3.0, weather_daily.precipitation_sum)
+            self.assertEqual(2, weather_daily.hours_with_precipitation)
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city_1.delete()
+        city_2.delete()
+
     def test_get_by_city_id_and_date_range(self) -> None:
         city_1 = DjangoCity.objects.create(
             id=1, name="Nowhere", latitude=0.0, longitude=0.0
@@ -259,3 +426,474 @@ class TestIntegrationDbWeatherDataRepository(TestCase):
 
         city_1.delete()
         city_2.delete()
+
+    def test_get_series_by_city_ids(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Somewhere", latitude=1.0, longitude=10.4
+        )
+        city_3 = DjangoCity.objects.create(
+            id=3, name="Elsewhere", latitude=2.0, longitude=10.4
+        )
+
+        weather_data_1 = DjangoWeatherData.objects.create(
+            id=1,
+            city_id=1,
+            date_time=datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+            temperature=15.4,
+            precipitation=0.0,
+        )
+        weather_data_2 = DjangoWeatherData.objects.create(
+            id=2,
+            city_id=3,
+            date_time=datetime(2010, 2, 1, 1, 0, tzinfo=timezone.utc),
+            temperature=15.0,
+            precipitation=0.01,
+        )
+        weather_data_3 = DjangoWeatherData.objects.create(
+            id=3,
+            city_id=1,
+            date_time=datetime(2010, 1, 1, 0, 0, tzinfo=timezone.utc),
+            temperature=15.6,
+            precipitation=None,
+        )
+
+        with self.assertNumQueries(1):
+            retrieved_weather_series = (
+                self.db_weather_data_repository.get_series_by_city_ids([1, 2, 3])
+            )
+
+        self.assertEqual([1, 3], list(retrieved_weather_series.keys()))
+        self.assertEqual(
+            ["2010-01-01T00:00:00.000000", "2010-02-01T00:00:00.000000"],
+            [str(date_time) for date_time in retrieved_weather_series[1].date_times],
+        )
+        self.assertEqual([15.6, 15.4], list(retrieved_weather_series[1].temperatures))
+        self.assertTrue(np.isnan(retrieved_weather_series[1].precipitations[0]))
+        self.assertEqual(0.0, retrieved_weather_series[1].precipitations[1])
+        self.assertEqual(
+            ["2010-02-01T01:00:00.000000"],
+            [str(date_time) for date_time in retrieved_weather_series[3].date_times],
+        )
+        self.assertEqual([15.0], list(retrieved_weather_series[3].temperatures))
+        self.assertEqual([0.01], list(retrieved_weather_series[3].precipitations))
+
+        with self.assertNumQueries(1):
+            retrieved_weather_series = (
+                self.db_weather_data_repository.get_series_by_city_date_ranges(
+                    {
+                        1: [
+                            (
+                                datetime(2009, 12, 1, tzinfo=timezone.utc),
+                                datetime(2009, 12, 31, tzinfo=timezone.utc),
+                            ),
+                            (
+                                datetime(2010, 1, 15, tzinfo=timezone.utc),
+                                datetime(2010, 2, 1, 0, tzinfo=timezone.utc),
+                            ),
+                        ],
+                        3: [
+                            (
+                                datetime(2010, 1, 1, tzinfo=timezone.utc),
+                                datetime(2010, 1, 31, tzinfo=timezone.utc),
+                            )
+                        ],
+                    }
+                )
+            )
+
+        self.assertEqual([1], list(retrieved_weather_series.keys()))
+        self.assertEqual([15.4], list(retrieved_weather_series[1].temperatures))
+
+        weather_data_1.delete()
+        weather_data_2.delete()
+        weather_data_3.delete()
+
+        city_1.delete()
+        city_2.delete()
+        city_3.delete()
+
+    def test_get_series_by_city_ids_by_chunks(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Somewhere", latitude=1.0, longitude=10.4
+        )
+        weather_data_list = [
+            DjangoWeatherData.objects.create(
+                id=index + 1,
+                city_id=city_id,
+                date_time=datetime(2010, 1, 1, hour, 0, tzinfo=timezone.utc),
+                temperature=float(index),
+                precipitation=0.0,
+            )
+            for index, (city_id, hour) in enumerate(
+                [(1, 0), (1, 1), (1, 2), (2, 0), (2, 1)]
+            )
+        ]
+
+        with self.assertNumQueries(1):
+            retrieved_weather_series = DbWeatherDataRepository(
+                chunk_size=2
+            ).get_series_by_city_ids([1, 2])
+
+        self.assertEqual([1, 2], list(retrieved_weather_series.keys()))
+        self.assertEqual(
+            [0.0, 1.0, 2.0], list(retrieved_weather_series[1].temperatures)
+        )
+        self.assertEqual([3.0, 4.0], list(retrieved_weather_series[2].temperatures))
+        self.assertEqual(
+            ["2010-01-01T00:00:00.000000", "2010-01-01T01:00:00.000000"],
+            [str(date_time) for date_time in retrieved_weather_series[2].date_times],
+        )
+
+        [weather_data.delete() for weather_data in weather_data_list]
+        city_1.delete()
+        city_2.delete()
+
+    def test_get_stats_by_city_ids_and_date_range(self) -> None:
+        city_1 = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        city_2 = DjangoCity.objects.create(
+            id=2, name="Somewhere", latitude=1.0, longitude=10.4
+        )
+
+        weather_data_1 = DjangoWeatherData.objects.create(
+            id=1,
+            city_id=1,
+            date_time=datetime(2010, 1, 1, 0, 0, tzinfo=timezone.utc),
+            temperature=15.6,
+            precipitation=0.0,
+        )
+        weather_data_2 = DjangoWeatherData.objects.create(
+            id=2,
+            city_id=1,
+            date_time=datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+            temperature=15.4,
+            precipitation=0.0,
+        )
+        weather_data_3 = DjangoWeatherData.objects.create(
+            id=3,
+            city_id=1,
+            date_time=datetime(2010, 2, 1, 1, 0, tzinfo=timezone.utc),
+            temperature=15.0,
+            precipitation=0.5,
+        )
+        weather_data_4 = DjangoWeatherData.objects.create(
+            id=4,
+            city_id=1,
+            date_time=datetime(2010, 2, 2, 2, 0, tzinfo=timezone.utc),
+            temperature=14.6,
+            precipitation=None,
+        )
+        weather_data_5 = DjangoWeatherData.objects.create(
+            id=5,
+            city_id=1,
+            date_time=datetime(2010, 3, 2, 0, 0, tzinfo=timezone.utc),
+            temperature=15.2,
+            precipitation=0.0,
+        )
+        weather_data_6 = DjangoWeatherData.objects.create(
+            id=6,
+            city_id=2,
+            date_time=datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+            temperature=17.6,
+            precipitation=0.0,
+        )
+
+        retrieved_stats_by_city_id = (
+            self.db_weather_data_repository.get_stats_by_city_ids_and_date_range(
+                [1, 2, 3],
+                datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+                datetime(2010, 3, 1, 0, 0, tzinfo=timezone.utc),
+                15.2,
+                14.8,
+            )
+        )
+
+        self.assertCountEqual([1, 2], retrieved_stats_by_city_id.keys())
+        self.assertEqual(17.6, retrieved_stats_by_city_id[2].temperature.max)
+        self.assertEqual(
+            "2010-02-01T00:00", retrieved_stats_by_city_id[2].temperature.max_date_time
+        )
+
+        retrieved_stats = retrieved_stats_by_city_id[1]
+        temperature_stats = retrieved_stats.temperature
+        self.assertEqual(3, temperature_stats.count)
+        self.assertAlmostEqual(15.0, temperature_stats.average)
+        self.assertEqual(15.4, temperature_stats.max)
+        self.assertEqual("2010-02-01T00:00", temperature_stats.max_date_time)
+        self.assertEqual(14.6, temperature_stats.min)
+        self.assertEqual("2010-02-02T02:00", temperature_stats.min_date_time)
+        self.assertEqual(1, temperature_stats.hours_above_threshold)
+        self.assertEqual(1, temperature_stats.hours_below_threshold)
+        self.assertEqual("2010-02-01", temperature_stats.start_day)
+        self.assertEqual("2010-02-02", temperature_stats.end_day)
+        self.assertEqual(
+            {"2010-02-01": 15.2, "2010-02-02": 14.6},
+            temperature_stats.average_by_day_as_dict(),
+        )
+
+        precipitation_stats = retrieved_stats.precipitation
+        self.assertEqual(2, precipitation_stats.count)
+        self.assertEqual(0.5, precipitation_stats.total)
+        self.assertEqual(0.5, precipitation_stats.max)
+        self.assertEqual("2010-02-01T01:00", precipitation_stats.max_date_time)
+        self.assertEqual(1, precipitation_stats.hours_above_threshold)
+        self.assertEqual(
+            {"2010-02-01": 0.5, "2010-02-02": 0.0},
+            precipitation_stats.total_by_day_as_dict(),
+        )
+
+        weather_data_1.delete()
+        weather_data_2.delete()
+        weather_data_3.delete()
+        weather_data_4.delete()
+        weather_data_5.delete()
+        weather_data_6.delete()
+
+        city_1.delete()
+        city_2.delete()
+
+    def test_get_stats_by_city_ids_and_date_range_with_fields(self) -> None:
+        city = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        for index, (day, hour, temperature) in enumerate(
+            [(1, 0, 15.6), (1, 1, 15.0), (2, 2, 14.6)], start=1
+        ):
+            DjangoWeatherData.objects.create(
+                id=index,
+                city_id=city.id,
+                date_time=datetime(2010, 2, day, hour, 0, tzinfo=timezone.utc),
+                temperature=temperature,
+                precipitation=0.0,
+            )
+
+        with self.assertNumQueries(1):
+            retrieved_stats_by_city_id = (
+                self.db_weather_data_repository.get_stats_by_city_ids_and_date_range(
+                    [1],
+                    datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+                    datetime(2010, 3, 1, 0, 0, tzinfo=timezone.utc),
+                    15.2,
+                    14.8,
+                    frozenset([AVERAGE_FIELD, HOURS_ABOVE_THRESHOLD_FIELD]),
+                )
+            )
+
+        temperature_stats = retrieved_stats_by_city_id[1].temperature
+        self.assertEqual(3, temperature_stats.count)
+        self.assertAlmostEqual(15.066666, temperature_stats.average, places=5)
+        self.assertEqual(1, temperature_stats.hours_above_threshold)
+        self.assertIsNone(temperature_stats.max_date_time)
+        self.assertEqual(0, len(temperature_stats.days))
+
+        with self.assertNumQueries(2):
+            retrieved_stats_by_city_id = (
+                self.db_weather_data_repository.get_stats_by_city_ids_and_date_range(
+                    [1],
+                    datetime(2010, 2, 1, 0, 0, tzinfo=timezone.utc),
+                    datetime(2010, 3, 1, 0, 0, tzinfo=timezone.utc),
+                    15.2,
+                    14.8,
+                    frozenset([MAX_FIELD]),
+                )
+            )
+
+        temperature_stats = retrieved_stats_by_city_id[1].temperature
+        self.assertEqual(15.6, temperature_stats.max)
+        self.assertEqual("2010-02-01T00:00", temperature_stats.max_date_time)
+        self.assertIsNone(temperature_stats.min_date_time)
+
+        DjangoWeatherData.objects.all().delete()
+        city.delete()
+
+    def test_get_stats_by_city_ids_and_date_range_from_daily_rollup(self) -> None:
+        city = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        self.db_weather_data_repository.bulk_save(
+            [
+                WeatherData(
+                    city_id=city.id,
+                    date_time=datetime(2010, 1, day, hour, tzinfo=timezone.utc),
+                    temperature=float(10 * day + hour),
+                    precipitation=float(hour // 6 % 2),
+                )
+                for day in range(1, 6)
+                for hour in range(0, 24, 6)
+            ]
+        )
+
+        with self.assertNumQueries(2):
+            retrieved_stats_by_city_id = (
+                self.db_weather_data_repository.get_stats_by_city_ids_and_date_range(
+                    [1],
+                    datetime(2010, 1, 1, 12, tzinfo=timezone.utc),
+                    datetime(2010, 1, 4, 0, tzinfo=timezone.utc),
+                    30.0,
+                    0.0,
+                )
+            )
+
+        temperature_stats = retrieved_stats_by_city_id[1].temperature
+        self.assertEqual(11, temperature_stats.count)
+        self.assertEqual(20.0, temperature_stats.min)
+        self.assertEqual("2010-01-02T00:00", temperature_stats.min_date_time)
+        self.assertEqual(48.0, temperature_stats.max)
+        self.assertEqual("2010-01-03T18:00", temperature_stats.max_date_time)
+        self.assertEqual(6, temperature_stats.hours_above_threshold)
+        self.assertEqual(0, temperature_stats.hours_below_threshold)
+        self.assertEqual(
+            {
+                "2010-01-01": 25.0,
+                "2010-01-02": 29.0,
+                "2010-01-03": 39.0,
+                "2010-01-04": 40.0,
+            },
+            temperature_stats.average_by_day_as_dict(),
+        )
+
+        precipitation_stats = retrieved_stats_by_city_id[1].precipitation
+        self.assertEqual(5.0, precipitation_stats.total)
+        self.assertEqual(5, precipitation_stats.hours_above_threshold)
+        self.assertEqual(
+            {
+                "2010-01-01": 1.0,
+                "2010-01-02": 2.0,
+                "2010-01-03": 2.0,
+                "2010-01-04": 0.0,
+            },
+            precipitation_stats.total_by_day_as_dict(),
+        )
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city.delete()
+
+    def test_bulk_save_refreshes_monthly_and_yearly_rollups(self) -> None:
+        city = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+
+        for day in (date(2010, 1, 31), date(2010, 2, 1), date(2011, 1, 1)):
+            self.db_weather_data_repository.bulk_save(
+                [
+                    WeatherData(
+                        city_id=city.id,
+                        date_time=datetime(
+                            day.year, day.month, day.day, hour, tzinfo=timezone.utc
+                        ),
+                        precipitation=1.0,
+                        temperature=float(day.month * 10 + hour),
+                    )
+                    for hour in range(2)
+                ]
+            )
+
+        weather_monthly_list = list(
+            DjangoWeatherMonthly.objects.filter(city_id=city.id)
+        )
+        self.assertEqual(
+            [date(2010, 1, 1), date(2010, 2, 1), date(2011, 1, 1)],
+            [weather_monthly.month for weather_monthly in weather_monthly_list],
+        )
+        self.assertEqual(
+            [2, 2, 2],
+            [
+                weather_monthly.temperature_count
+                for weather_monthly in weather_monthly_list
+            ],
+        )
+
+        weather_yearly_list = list(DjangoWeatherYearly.objects.filter(city_id=city.id))
+        self.assertEqual(
+            [date(2010, 1, 1), date(2011, 1, 1)],
+            [weather_yearly.year for weather_yearly in weather_yearly_list],
+        )
+
+        first_year = weather_yearly_list[0]
+        self.assertEqual(4, first_year.temperature_count)
+        self.assertEqual(62.0, first_year.temperature_sum)
+        self.assertEqual(21.0, first_year.temperature_max)
+        self.assertEqual(
+            datetime(2010, 2, 1, 1, tzinfo=timezone.utc),
+            first_year.temperature_max_date_time,
+        )
+        self.assertEqual(10.0, first_year.temperature_min)
+        self.assertEqual(
+            datetime(2010, 1, 31, 0, tzinfo=timezone.utc),
+            first_year.temperature_min_date_time,
+        )
+        self.assertEqual(4, first_year.hours_with_precipitation)
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city.delete()
+
+    def test_get_summary_stats_by_city_ids(self) -> None:
+        city = DjangoCity.objects.create(
+            id=1, name="Nowhere", latitude=0.0, longitude=0.0
+        )
+        start_date = datetime(2010, 12, 31, 12, tzinfo=timezone.utc)
+        weather_data_list = [
+            WeatherData(
+                city_id=city.id,
+                date_time=start_date + timedelta(hours=6 * index),
+                temperature=float(index % 97) - 20.0,
+                precipitation=float(index % 3),
+            )
+            for index in range(1600)
+        ]
+        self.db_weather_data_repository.bulk_save(weather_data_list)
+
+        with self.assertNumQueries(5):
+            retrieved_stats_by_city_id = (
+                self.db_weather_data_repository.get_summary_stats_by_city_ids([1, 2])
+            )
+
+        weather_series = WeatherSeries.from_weather_data(weather_data_list)
+        kernel = SeriesStatsKernel(weather_series.date_times)
+        expected_stats = kernel.compute(weather_series.temperatures, 30.0, 0.0)
+        expected_precipitation_stats = kernel.compute(
+            weather_series.precipitations, upper_threshold=0.0
+        )
+
+        self.assertEqual([1], list(retrieved_stats_by_city_id.keys()))
+        temperature_stats = retrieved_stats_by_city_id[1].temperature
+        self.assertEqual(expected_stats.count, temperature_stats.count)
+        self.assertAlmostEqual(expected_stats.average, temperature_stats.average)
+        self.assertEqual(expected_stats.max, temperature_stats.max)
+        self.assertEqual(expected_stats.max_date_time, temperature_stats.max_date_time)
+        self.assertEqual(expected_stats.min, temperature_stats.min)
+        self.assertEqual(expected_stats.min_date_time, temperature_stats.min_date_time)
+        self.assertEqual(
+            expected_stats.hours_above_threshold,
+            temperature_stats.hours_above_threshold,
+        )
+        self.assertEqual("2010-12-31", temperature_stats.start_day)
+        self.assertEqual(expected_stats.end_day, temperature_stats.end_day)
+
+        precipitation_stats = retrieved_stats_by_city_id[1].precipitation
+        self.assertAlmostEqual(
+            expected_precipitation_stats.total, precipitation_stats.total
+        )
+        self.assertEqual(
+            expected_precipitation_stats.hours_above_threshold,
+            precipitation_stats.hours_above_threshold,
+        )
+
+        DjangoWeatherYearly.objects.all().delete()
+        DjangoWeatherMonthly.objects.all().delete()
+        DjangoWeatherDaily.objects.all().delete()
+        DjangoWeatherData.objects.all().delete()
+        city.delete()
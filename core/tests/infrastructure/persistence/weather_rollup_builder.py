@@ -0,0 +1,39 @@
+from core.domain.services.daily_weather_stats_accumulator import (
+    DailyWeatherStatsAccumulator,
+)
+from core.infrastructure.persistence.models.django_weather_daily import (
+    DjangoWeatherDaily,
+)
+from core.infrastructure.persistence.models.django_weather_monthly import (
+    DjangoWeatherMonthly,
+)
+from core.infrastructure.persistence.models.django_weather_yearly import (
+    DjangoWeatherYearly,
+)
+from core.infrastructure.persistence.repositories.db_weather_data_repository import (
+    DbWeatherDataRepository,
+)
+
+
+class WeatherRollupBuilder:
+    @staticmethod
+    def build(city_ids: list[int]) -> None:
+        for city_id, weather_series in (
+            DbWeatherDataRepository().get_series_by_city_ids(city_ids).items()
+        ):
+            accumulator = DailyWeatherStatsAccumulator()
+            accumulator.add(weather_series)
+            daily = accumulator.result()
+            monthly = daily.resample("M")
+            yearly = monthly.resample("Y")
+
+            for django_weather_rollup_model, period_weather_series_stats in (
+                (DjangoWeatherDaily, daily),
+                (DjangoWeatherMonthly, monthly),
+                (DjangoWeatherYearly, yearly),
+            ):
+                django_weather_rollup_model.objects.bulk_create(
+                    django_weather_rollup_model.from_domain(
+                        city_id, period_weather_series_stats
+                    )
+                )
@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+import numpy as np
+
+from core.infrastructure.views.renderers.orjson_renderer import ORJSONRenderer
+
+
+class TestORJSONRenderer(TestCase):
+    def setUp(self) -> None:
+        self.renderer = ORJSONRenderer()
+
+    def test_render(self) -> None:
+        self.assertEqual(
+            b'{"city":"Madrid","values":[1.5,0.30000000000000004]}',
+            self.renderer.render({"city": "Madrid", "values": [1.5, 0.1 + 0.2]}),
+        )
+
+    def test_render_numpy(self) -> None:
+        self.assertEqual(
+            b'{"total":1.5,"total_by_day":[0.5,1.0],"days":2}',
+            self.renderer.render(
+                {
+                    "total": np.float64(1.5),
+                    "total_by_day": np.array([0.5, 1.0]),
+                    "days": np.int64(2),
+                }
+            ),
+        )
+
+    def test_render_with_indent(self) -> None:
+        self.assertEqual(
+            b'{\n  "total_by_day": [\n    0.5,\n    null\n  ]\n}',
+            self.renderer.render(
+                {"total_by_day": np.array([0.5, np.nan])},
+                "application/json; indent=4",
+            ),
+        )
+        self.assertEqual(
+            b'{\n  "total": 1.5\n}',
+            self.renderer.render({"total": 1.5}, renderer_context={"indent": 2}),
+        )
+
+    def test_render_none(self) -> None:
+        self.assertEqual(b"", self.renderer.render(None))
@@ -0,0 +1,32 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+
+from core.infrastructure.views.async_api_view import AsyncAPIView
+
+
+class TestAsyncAPIView(TestCase):
+    def setUp(self) -> None:
+        self.view = AsyncAPIView()
+
+    def test_run_in_executor_without_executor(self) -> None:
+        with patch.object(AsyncAPIView, "_AsyncAPIView__executor", None):
+            result = async_to_sync(self.view.run_in_executor)(sum, [1, 2, 3])
+
+        self.assertEqual(6, result)
+
+    @patch("core.infrastructure.views.async_api_view.close_old_connections")
+    def test_run_in_executor_with_executor(self, mock_close_old_connections) -> None:
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stats")
+
+        with patch.object(AsyncAPIView, "_AsyncAPIView__executor", executor):
+            thread_name = async_to_sync(self.view.run_in_executor)(
+                lambda: threading.current_thread().name
+            )
+        executor.shutdown()
+
+        self.assertTrue(thread_name.startswith("stats"))
+        self.assertEqual(2, mock_close_old_connections.call_count)
@@ -1,12 +1,19 @@
+import json
 from datetime import datetime, timezone
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from rest_framework.reverse import reverse
 
 from core.infrastructure.persistence.models.django_city import DjangoCity
+from core.infrastructure.persistence.models.django_city_weather_snapshot import (
+    DjangoCityWeatherSnapshot,
+)
 from core.infrastructure.persistence.models.django_weather_data import DjangoWeatherData
+from core.tests.infrastructure.persistence.weather_rollup_builder import (
+    WeatherRollupBuilder,
+)
 
 
 class TestIntegrationGetAllWeatherStatsView(TestCase):
@@ -114,6 +121,8 @@ class TestIntegrationGetAllWeatherStatsView(TestCase):
             cls.weather_data_10,
         ]
 
+        WeatherRollupBuilder.build([1, 2, 3, 4, 5])
+
     @classmethod
     def tearDownClass(cls):
         [
@@ -208,3 +217,90 @@ class TestIntegrationGetAllWeatherStatsView(TestCase):
             {"error": "An unexpected error happened"},
             retrieved_response.json(),
         )
+
+    def test_get_reuses_snapshots(self) -> None:
+        url = reverse("all")
+
+        first_response = self.client.get(url)
+        with self.assertNumQueries(2):
+            second_response = self.client.get(url)
+
+        self.assertEqual(first_response.json(), second_response.json())
+        self.assertEqual(5, DjangoCityWeatherSnapshot.objects.count())
+
+        DjangoCityWeatherSnapshot.objects.all().delete()
+
+    def test_get_streaming_json(self) -> None:
+        url = reverse("all")
+
+        response = self.client.get(url)
+        streamed_response = self.client.get(url, {"stream": "true"})
+
+        self.assertEqual(200, streamed_response.status_code)
+        self.assertTrue(streamed_response.streaming)
+        self.assertEqual(
+            response.json(),
+            json.loads(b"".join(streamed_response.streaming_content)),
+        )
+
+        DjangoCityWeatherSnapshot.objects.all().delete()
+
+    def test_get_streaming_ndjson(self) -> None:
+        url = reverse("all")
+
+        response = self.client.get(url)
+        streamed_response = self.client.get(url, HTTP_ACCEPT="application/x-ndjson")
+
+        self.assertEqual(200, streamed_response.status_code)
+        self.assertEqual("application/x-ndjson", streamed_response["Content-Type"])
+        self.assertEqual(
+            [
+                {"city": city_name, **city_weather_stats}
+                for city_name, all_city_weather_stats in response.json().items()
+                for city_weather_stats in all_city_weather_stats
+            ],
+            [
+                json.loads(line)
+                for line in b"".join(streamed_response.streaming_content).splitlines()
+            ],
+        )
+
+        DjangoCityWeatherSnapshot.objects.all().delete()
+
+    @override_settings(REST_FRAMEWORK={"PAGE_SIZE": 2})
+    def test_get_paginated(self) -> None:
+        url = reverse("all")
+
+        first_page = self.client.get(url)
+        second_page = self.client.get(first_page.json()["next"])
+        third_page = self.client.get(second_page.json()["next"])
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+        self.assertEqual(200, first_page.status_code)
+        self.assertEqual(
+            [
+                {"Madrid": [1.0]},
+                {"Madrid": [3.0], "Barcelona": [4.0]},
+                {"Barcelona": [5.0]},
+            ],
+            [
+                {
+                    city_name: [stats["latitude"] for stats in all_stats]
+                    for city_name, all_stats in page.json()["results"].items()
+                }
+                for page in [first_page, second_page, third_page]
+            ],
+        )
+        self.assertIsNone(third_page.json()["next"])
+
+        DjangoCityWeatherSnapshot.objects.all().delete()
+
+    @override_settings(REST_FRAMEWORK={"PAGE_SIZE": 2})
+    def test_get_paginated_with_invalid_cursor(self) -> None:
+        url = reverse("all")
+
+        retrieved_response = self.client.get(url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(404, retrieved_response.status_code)
+        self.assertEqual({"detail": "Invalid cursor"}, retrieved_response.json())
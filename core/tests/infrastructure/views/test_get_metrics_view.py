@@ -0,0 +1,21 @@
+from django.test import TestCase
+
+from rest_framework.reverse import reverse
+
+
+class TestIntegrationGetMetricsView(TestCase):
+    def test_get(self) -> None:
+        self.client.get(reverse("all"))
+
+        retrieved_response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertTrue(retrieved_response["Content-Type"].startswith("text/plain"))
+        self.assertIn(
+            b'meteoanalyzer_request_duration_seconds_count{method="GET",status="200",view="all"}',
+            retrieved_response.content,
+        )
+        self.assertIn(
+            b'meteoanalyzer_events_total{event="db_queries"}',
+            retrieved_response.content,
+        )
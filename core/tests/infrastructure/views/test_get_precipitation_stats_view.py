@@ -1,11 +1,19 @@
 from datetime import datetime, timezone
 
+from django.core.cache import caches
 from django.test import TestCase
 
 from rest_framework.reverse import reverse
 
+from MeteoAnalyzer.settings import STATS_CACHE_ALIAS
+from core.dependency_injection_factories.infrastructure.caches.in_memory_weather_series_cache_factory import (
+    InMemoryWeatherSeriesCacheFactory,
+)
 from core.infrastructure.persistence.models.django_city import DjangoCity
 from core.infrastructure.persistence.models.django_weather_data import DjangoWeatherData
+from core.tests.infrastructure.persistence.weather_rollup_builder import (
+    WeatherRollupBuilder,
+)
 
 
 class TestIntegrationGetPrecipitationStatsView(TestCase):
@@ -113,6 +121,8 @@ class TestIntegrationGetPrecipitationStatsView(TestCase):
             cls.weather_data_10,
         ]
 
+        WeatherRollupBuilder.build([1, 2, 3, 4, 5])
+
     @classmethod
     def tearDownClass(cls):
         [
@@ -129,6 +139,9 @@ class TestIntegrationGetPrecipitationStatsView(TestCase):
         cls.barcelona_city_1.delete()
         cls.barcelona_city_2.delete()
 
+        caches[STATS_CACHE_ALIAS].clear()
+        InMemoryWeatherSeriesCacheFactory.create().clear()
+
     def test_get(self) -> None:
         url = reverse("precipitation")
 
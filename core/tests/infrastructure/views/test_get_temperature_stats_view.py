@@ -1,11 +1,23 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+from django.core.cache import caches
 from django.test import TestCase
 
 from rest_framework.reverse import reverse
 
+from MeteoAnalyzer.settings import STATS_CACHE_ALIAS
+from core.dependency_injection_factories.infrastructure.caches.in_memory_weather_series_cache_factory import (
+    InMemoryWeatherSeriesCacheFactory,
+)
+from core.domain.models.weather_data import WeatherData
 from core.infrastructure.persistence.models.django_city import DjangoCity
 from core.infrastructure.persistence.models.django_weather_data import DjangoWeatherData
+from core.infrastructure.persistence.repositories.db_weather_data_repository import (
+    DbWeatherDataRepository,
+)
+from core.tests.infrastructure.persistence.weather_rollup_builder import (
+    WeatherRollupBuilder,
+)
 
 
 class TestIntegrationGetTemperatureStatsView(TestCase):
@@ -113,6 +125,8 @@ class TestIntegrationGetTemperatureStatsView(TestCase):
             cls.weather_data_10,
         ]
 
+        WeatherRollupBuilder.build([1, 2, 3, 4, 5])
+
     @classmethod
     def tearDownClass(cls):
         [
@@ -129,6 +143,9 @@ class TestIntegrationGetTemperatureStatsView(TestCase):
         cls.barcelona_city_1.delete()
         cls.barcelona_city_2.delete()
 
+        caches[STATS_CACHE_ALIAS].clear()
+        InMemoryWeatherSeriesCacheFactory.create().clear()
+
     def test_get(self) -> None:
         url = reverse("temperature")
 
@@ -172,3 +189,241 @@ class TestIntegrationGetTemperatureStatsView(TestCase):
             ],
             retrieved_response.json(),
         )
+
+    def test_get_after_ingest(self) -> None:
+        url = reverse("temperature")
+        query_params = {
+            "city": "Barcelona",
+            "latitude": 4.0,
+            "start_date": "2000-01-01",
+            "end_date": "2025-01-01",
+        }
+
+        first_response = self.client.get(url, query_params=query_params)
+        DbWeatherDataRepository().bulk_save(
+            [
+                WeatherData(
+                    city_id=4,
+                    date_time=datetime(2011, 1, 2, 2, 0, 0, tzinfo=timezone.utc),
+                    temperature=35.0,
+                    precipitation=0.0,
+                )
+            ]
+        )
+        refreshed_response = self.client.get(url, query_params=query_params)
+
+        self.assertEqual(5.0, first_response.json()[0]["temperature"]["average"])
+        self.assertEqual(15.0, refreshed_response.json()[0]["temperature"]["average"])
+        self.assertEqual(
+            {"value": 35.0, "date": "2011-01-02T02:00"},
+            refreshed_response.json()[0]["temperature"]["max"],
+        )
+
+        DjangoWeatherData.objects.filter(
+            city_id=4, date_time=datetime(2011, 1, 2, 2, 0, 0, tzinfo=timezone.utc)
+        ).delete()
+
+    def test_get_compact_daily_format(self) -> None:
+        url = reverse("temperature")
+        query_params = {
+            "city": "Barcelona",
+            "latitude": 5.0,
+            "start_date": "2010-02-02",
+            "end_date": "2010-02-05",
+        }
+
+        query_param_response = self.client.get(
+            url, query_params={**query_params, "daily_format": "compact"}
+        )
+        accept_response = self.client.get(
+            url,
+            query_params=query_params,
+            HTTP_ACCEPT="application/json; daily_format=compact",
+        )
+
+        self.assertEqual(200, query_param_response.status_code)
+        self.assertEqual(
+            {"start": "2010-02-02", "step": "P1D", "values": [5.0]},
+            query_param_response.json()[0]["temperature"]["average_by_day"],
+        )
+        self.assertEqual(query_param_response.json(), accept_response.json())
+
+    def test_get_invalid_daily_format(self) -> None:
+        url = reverse("temperature")
+
+        retrieved_response = self.client.get(
+            url,
+            query_params={
+                "city": "Barcelona",
+                "start_date": "2000-01-01",
+                "end_date": "2025-01-01",
+                "daily_format": "columns",
+            },
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            {"error": "daily_format columns is not one of map, compact."},
+            retrieved_response.json(),
+        )
+
+    def test_get_with_fields(self) -> None:
+        url = reverse("temperature")
+
+        retrieved_response = self.client.get(
+            url,
+            query_params={
+                "city": "Barcelona",
+                "latitude": 4.0,
+                "start_date": "2000-01-01",
+                "end_date": "2025-01-01",
+                "fields": "average,max,min",
+            },
+        )
+
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertEqual(
+            [
+                {
+                    "latitude": 4.0,
+                    "longitude": 4.0,
+                    "temperature": {
+                        "average": 5.0,
+                        "max": {"value": 10.0, "date": "2011-01-02T01:00"},
+                        "min": {"value": 0.0, "date": "2011-01-02T00:00"},
+                    },
+                }
+            ],
+            retrieved_response.json(),
+        )
+
+    def test_get_with_precipitation_field(self) -> None:
+        url = reverse("temperature")
+
+        retrieved_response = self.client.get(
+            url,
+            query_params={
+                "city": "Barcelona",
+                "start_date": "2000-01-01",
+                "end_date": "2025-01-01",
+                "fields": "total",
+            },
+        )
+
+        self.assertEqual(400, retrieved_response.status_code)
+        self.assertEqual(
+            {
+                "error": "fields total is not one of average, average_by_day, max, min, hours_above_threshold, hours_below_threshold."
+            },
+            retrieved_response.json(),
+        )
+
+    def test_get_caches_series_after_second_miss(self) -> None:
+        url = reverse("temperature")
+        weather_series_cache = InMemoryWeatherSeriesCacheFactory.create()
+        weather_series_cache.clear()
+        query_params = {
+            "city": "Madrid",
+            "start_date": "2010-01-01",
+            "end_date": "2010-01-02",
+        }
+
+        first_response = self.client.get(url, query_params=query_params)
+        nbytes_after_first_response = weather_series_cache.nbytes
+        caches[STATS_CACHE_ALIAS].clear()
+        second_response = self.client.get(url, query_params=query_params)
+
+        self.assertEqual(0, nbytes_after_first_response)
+        self.assertLess(0, weather_series_cache.nbytes)
+        self.assertEqual(first_response.json(), second_response.json())
+
+    def test_get_not_modified(self) -> None:
+        url = reverse("temperature")
+        query_params = {
+            "city": "Barcelona",
+            "start_date": "2000-01-01",
+            "end_date": "2025-01-01",
+        }
+
+        first_response = self.client.get(url, query_params=query_params)
+        with self.assertNumQueries(1):
+            not_modified_response = self.client.get(
+                url,
+                query_params=query_params,
+                HTTP_IF_NONE_MATCH=first_response["ETag"],
+            )
+
+        self.assertEqual(200, first_response.status_code)
+        self.assertIn("public", first_response["Cache-Control"])
+        self.assertIn("max-age=86400", first_response["Cache-Control"])
+        self.assertEqual(304, not_modified_response.status_code)
+        self.assertEqual(first_response["ETag"], not_modified_response["ETag"])
+        self.assertEqual(b"", not_modified_response.content)
+
+    def test_get_recent_range_not_cacheable(self) -> None:
+        url = reverse("temperature")
+        query_params = {
+            "city": "Barcelona",
+            "start_date": "2000-01-01",
+            "end_date": (datetime.now(timezone.utc) - timedelta(days=1))
+            .date()
+            .isoformat(),
+        }
+
+        retrieved_response = self.client.get(url, query_params=query_params)
+
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertIn("no-cache", retrieved_response["Cache-Control"])
+        self.assertNotIn("public", retrieved_response["Cache-Control"])
+
+    def test_get_modified_after_ingest(self) -> None:
+        url = reverse("temperature")
+        query_params = {
+            "city": "Barcelona",
+            "latitude": 4.0,
+            "start_date": "2000-01-01",
+            "end_date": "2025-01-01",
+        }
+
+        first_response = self.client.get(url, query_params=query_params)
+        DbWeatherDataRepository().bulk_save(
+            [
+                WeatherData(
+                    city_id=4,
+                    date_time=datetime(2011, 1, 2, 2, 0, 0, tzinfo=timezone.utc),
+                    temperature=35.0,
+                    precipitation=0.0,
+                )
+            ]
+        )
+        refreshed_response = self.client.get(
+            url, query_params=query_params, HTTP_IF_NONE_MATCH=first_response["ETag"]
+        )
+
+        self.assertNotIn("Last-Modified", first_response)
+        self.assertEqual(200, refreshed_response.status_code)
+        self.assertNotEqual(first_response["ETag"], refreshed_response["ETag"])
+        self.assertIn("Last-Modified", refreshed_response)
+
+        DjangoWeatherData.objects.filter(
+            city_id=4, date_time=datetime(2011, 1, 2, 2, 0, 0, tzinfo=timezone.utc)
+        ).delete()
+
+    def test_get_server_timing(self) -> None:
+        url = reverse("temperature")
+
+        retrieved_response = self.client.get(
+            url,
+            query_params={
+                "city": "Madrid",
+                "start_date": "2010-01-01",
+                "end_date": "2010-01-06",
+            },
+        )
+
+        server_timing = retrieved_response["Server-Timing"]
+        self.assertEqual(200, retrieved_response.status_code)
+        self.assertIn("db;dur=", server_timing)
+        self.assertIn("serialization;dur=", server_timing)
+        self.assertIn("total;dur=", server_timing)
+        self.assertIn('db_queries;desc="', server_timing)
@@ -2,22 +2,23 @@ from datetime import datetime
 from unittest import TestCase
 from unittest.mock import patch
 
+from asgiref.sync import async_to_sync
 from django.test import RequestFactory
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from core.domain.exceptions.validation_error import ValidationError
 from core.domain.models.stats_query import StatsQuery
 from core.domain.validators.validator_service import ValidatorService
+from core.infrastructure.views.async_api_view import AsyncAPIView
 from core.infrastructure.views.validations.validate_stats_query import (
     validate_stats_query,
 )
 
 
-class DummyView(APIView):
-    @validate_stats_query
-    def get(self, _, stats_query: StatsQuery):
+class DummyView(AsyncAPIView):
+    @validate_stats_query()
+    async def get(self, _, stats_query: StatsQuery):
         return Response(
             {"message": "Success", "query": stats_query.__dict__}, status=200
         )
@@ -27,7 +28,7 @@ class TestValidateStatsQueryDecorator(TestCase):
     def setUp(self):
         self.factory = RequestFactory()
 
-        self.view = DummyView.as_view()
+        self.view = async_to_sync(DummyView.as_view())
 
     @patch.object(ValidatorService, "validate_params")
     def test_valid_params(self, mock_validate):
@@ -7,8 +7,14 @@ until pg_isready -h database -p "${POSTGRES_PORT:-5432}" -U "${POSTGRES_USER:-da
 done
 echo "Postgres is ready!"
 
+if [ -n "${PROMETHEUS_MULTIPROC_DIR}" ]; then
+  rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+  mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+fi
+
 echo "Running migrations with Django..."
 python manage.py migrate
+python manage.py createcachetable
 echo "Migrations complete!"
 
 echo "Collecting statics..."
@@ -16,4 +22,7 @@ python manage.py collectstatic --no-input
 echo "Statics collected!"
 
 echo "Starting the Django server..."
+if [ "${SERVER_INTERFACE:-wsgi}" = "asgi" ]; then
+  exec gunicorn --bind "${BACKEND_HOST:-0.0.0.0}":"${BACKEND_PORT:-8000}" -k uvicorn.workers.UvicornWorker MeteoAnalyzer.asgi:application
+fi
 exec gunicorn --bind "${BACKEND_HOST:-0.0.0.0}":"${BACKEND_PORT:-8000}" MeteoAnalyzer.wsgi:application
\ No newline at end of file
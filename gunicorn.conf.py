@@ -0,0 +1,8 @@
+import os
+
+from prometheus_client import multiprocess
+
+
+def child_exit(server, worker) -> None:
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR") is not None:
+        multiprocess.mark_process_dead(worker.pid)